@@ -1,9 +1,36 @@
-from .argparse_helper import ArgumentParserHelper
-from .dataset_subsampler import DatasetSubsampler
-from .date import Date
-from .hypothesis_test import HypothesisTest
-from .encrypter import Encrypter
-from .etl import ETL
-from .feature_selection import FeatureSelection
-from .path import Path
-from .timestamp import Timestamp
+import importlib
+
+# Public names are imported on first use, so importing the package, or any
+# light module in it, does not load pandas, numpy or scipy.
+EXPORTS = {
+    "ArgumentParserHelper": ".argparse_helper",
+    "ColumnOperations": ".column_operations",
+    "DatasetSchema": ".dataset_schema",
+    "DatasetSubsampler": ".dataset_subsampler",
+    "Date": ".date",
+    "DuplicateFilter": ".duplicate_filter",
+    "HypothesisTest": ".hypothesis_test",
+    "Encrypter": ".encrypter",
+    "ETL": ".etl",
+    "FeatureSelection": ".feature_selection",
+    "ParseCache": ".parse_cache",
+    "Path": ".path",
+    "Pipeline": ".pipeline",
+    "Timestamp": ".timestamp"
+}
+
+__all__ = list(EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(EXPORTS[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,8 @@ log = logging.getLogger(__name__)
 
 
 class AnalysisModeling(DataProcessor):
+    FINGERPRINT_METHODS = ["process", "process_chunk", "analise", "save"]
+
     save_report_on_load = False
     save_report_on_save = False
     model_developed = None
@@ -42,9 +44,20 @@ class AnalysisModeling(DataProcessor):
 
         if len(sys.argv) > 1:
             self.parse_arguments()
-        self.load()
-        self.process()
-        self.analise()
-        self.save()
+        if self.incremental and self.is_up_to_date():
+            log.info("- output is up to date, nothing to execute")
+            return
+        self.metrics = {}
+        with self.measure("load"):
+            self.load()
+        with self.measure("process"):
+            self.process()
+        with self.measure("analise"):
+            self.analise()
+        with self.measure("save"):
+            self.save()
         self.log_changes()
+        self.save_run_record()
+        if self.incremental:
+            self.save_fingerprint()
 
@@ -0,0 +1,197 @@
+import logging
+from typing import Callable, Dict, List, Union
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+class ColumnOperations:
+    """
+    Batch of column operations on a dataframe: drop, rename, cast and derive.
+
+    Operations are only collected when added, so calls can be chained, and run
+    in order by `execute()`. The columns are handled one by one, as series, and
+    the resulting dataframe is built only once at the end. Columns that are
+    neither cast nor derived are not copied: they are shared with the original
+    dataframe, which is left untouched.
+
+    Polars dataframes, and lazy frames, are supported as well. Their
+    operations are added to a single query instead.
+
+    Each operation is recorded in `changes`, usually those of the data
+    processor creating the batch (see `DataProcessor.column_operations()`), so
+    `log_changes()` dumps them.
+    """
+
+    dataframe = None
+    changes: Dict = None
+    operations: List = None
+
+    def __init__(self, dataframe, changes: Dict = None):
+        """
+        Init ColumnOperations class instance.
+
+        :param dataframe: pandas or Polars dataframe, or Polars lazy frame, the
+        operations are made on.
+        :param changes: dictionary where each operation is recorded. Optional.
+        """
+
+        log.info("Init column operations")
+        log.debug(f"ColumnOperations.__init__("
+                  f"dataframe={type(dataframe).__name__})")
+
+        self.dataframe = dataframe
+        self.changes = {}
+        self.operations = []
+
+        if changes is not None:
+            self.changes = changes
+
+    def drop(self, columns: Union[str, List[str]]) -> "ColumnOperations":
+        """
+        Drop the columns provided.
+
+        :param columns: name, or list of names, of the columns to drop.
+        :return: the batch, so calls can be chained.
+        :rtype: ColumnOperations
+        """
+
+        if isinstance(columns, str):
+            columns = [columns]
+        self.operations.append(("drop", list(columns)))
+
+        return self
+
+    def rename(self, columns: Dict[str, str]) -> "ColumnOperations":
+        """
+        Rename the columns provided, keeping their position.
+
+        :param columns: dictionary with the new name of each column.
+        :return: the batch, so calls can be chained.
+        :rtype: ColumnOperations
+        """
+
+        self.operations.append(("rename", dict(columns)))
+
+        return self
+
+    def cast(self, dtypes: Dict) -> "ColumnOperations":
+        """
+        Cast the columns provided to new types.
+
+        :param dtypes: dictionary with the type of each column, as pandas, or
+        Polars, expects it.
+        :return: the batch, so calls can be chained.
+        :rtype: ColumnOperations
+        """
+
+        self.operations.append(("cast", dict(dtypes)))
+
+        return self
+
+    def derive(self, column: str, value: Union[Callable, object]) -> "ColumnOperations":
+        """
+        Add a column, or replace it if it exists, with the value provided.
+
+        With pandas, the value is a series, a scalar, or a function taking the
+        current columns, as a dictionary of series, and returning either.
+        With Polars, the value is an expression, or a function taking the
+        current lazy frame and returning one.
+
+        :param column: name of the column.
+        :param value: value of the column, or function computing it.
+        :return: the batch, so calls can be chained.
+        :rtype: ColumnOperations
+        """
+
+        self.operations.append(("derive", (column, value)))
+
+        return self
+
+    def execute(self):
+        """
+        Run the operations, in the order they were added, and build the
+        resulting dataframe. Polars lazy frames are not computed.
+
+        :return: dataframe with the operations made, of the same kind as the
+        original one.
+        """
+
+        log.info("Execute column operations")
+        log.debug(f"ColumnOperations.execute("
+                  f"operations={len(self.operations)})")
+
+        if type(self.dataframe).__module__.split(".")[0] == "polars":
+            return self.__execute_polars()
+
+        columns = {column: self.dataframe[column] for column in self.dataframe.columns}
+        for operation, arguments in self.operations:
+            if operation == "drop":
+                for column in arguments:
+                    del columns[column]
+                    self.changes[f"column {column} dropped"] = True
+            elif operation == "rename":
+                columns = {
+                    arguments.get(column, column): series
+                    for column, series in columns.items()
+                }
+                for column, new_column in arguments.items():
+                    self.changes[f"column {column} renamed"] = new_column
+            elif operation == "cast":
+                for column, dtype in arguments.items():
+                    previous_dtype = columns[column].dtype
+                    columns[column] = columns[column].astype(dtype)
+                    self.changes[f"column {column} cast"] = f"{previous_dtype} to {columns[column].dtype}"
+            else:
+                column, value = arguments
+                if callable(value):
+                    value = value(columns)
+                if not isinstance(value, pd.Series):
+                    value = pd.Series(value, index=self.dataframe.index)
+                columns[column] = value.rename(column)
+                self.changes[f"column {column} derived"] = str(value.dtype)
+
+        self.operations = []
+
+        return pd.DataFrame(columns, index=self.dataframe.index, copy=False)
+
+    def __execute_polars(self):
+        """
+        Run the operations on a Polars dataframe, or lazy frame, adding them
+        to a single lazy query.
+
+        :return: Polars dataframe, or lazy frame, with the operations made.
+        """
+
+        import polars as pl
+
+        lazy_frame = self.dataframe.lazy()
+        for operation, arguments in self.operations:
+            if operation == "drop":
+                lazy_frame = lazy_frame.drop(arguments)
+                for column in arguments:
+                    self.changes[f"column {column} dropped"] = True
+            elif operation == "rename":
+                lazy_frame = lazy_frame.rename(arguments)
+                for column, new_column in arguments.items():
+                    self.changes[f"column {column} renamed"] = new_column
+            elif operation == "cast":
+                lazy_frame = lazy_frame.cast(arguments)
+                for column, dtype in arguments.items():
+                    self.changes[f"column {column} cast"] = f"to {dtype}"
+            else:
+                column, value = arguments
+                if callable(value):
+                    value = value(lazy_frame)
+                if not isinstance(value, pl.Expr):
+                    value = pl.lit(value)
+                lazy_frame = lazy_frame.with_columns(value.alias(column))
+                self.changes[f"column {column} derived"] = True
+
+        self.operations = []
+
+        if isinstance(self.dataframe, pl.LazyFrame):
+            return lazy_frame
+
+        return lazy_frame.collect()
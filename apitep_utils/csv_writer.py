@@ -0,0 +1,258 @@
+import bz2
+import gzip
+import logging
+import lzma
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+class CSVWriter:
+    """
+    Write dataframes to a CSV file in batches of rows, optionally compressed.
+
+    Each batch is serialized to CSV text and, if a compression codec is
+    selected, compressed on its own, so several batches are compressed at the
+    same time by a pool of threads. The compressed batches are written one
+    after the other as independent members (or frames) of the same file, which
+    gzip, bzip2, xz and zstd decompressors, pandas included, read as a whole.
+
+    The codec is taken from the extension of the file (".gz", ".bz2", ".xz" or
+    ".zst") or from `compression` ("gzip", "bz2", "xz" or "zstd").
+
+    Unless `batch_rows` is set, the number of rows per batch is estimated from
+    the first rows written, so each batch takes about `batch_bytes` of text.
+    Memory is thus bounded regardless of how wide the dataframes are.
+
+    The columns of the first dataframe written are kept in `columns`, as they
+    are in the header. Later dataframes are written in that order, and those
+    with other columns are rejected.
+    """
+
+    COMPRESSIONS = {
+        ".gz": "gzip",
+        ".bz2": "bz2",
+        ".xz": "xz",
+        ".zst": "zstd"
+    }
+
+    path_segment: str = None
+    separator: str = ","
+    compression: str = None
+    batch_rows: int = None
+    batch_bytes: int = 8 * 2 ** 20
+    max_workers: int = None
+
+    columns: List = None
+    rows: int = 0
+    uncompressed_bytes: int = 0
+    compressed_bytes: int = 0
+
+    def __init__(
+            self,
+            path_segment: str,
+            separator: str = None,
+            compression: str = None,
+            batch_rows: int = None,
+            batch_bytes: int = None,
+            max_workers: int = None
+    ):
+        """
+        Init CSVWriter class instance and open the file.
+
+        :param path_segment: path to the CSV file to write.
+        :param separator: separator of the CSV file. Optional.
+        :param compression: compression codec, if the extension of the file
+        does not select one. Optional.
+        :param batch_rows: number of rows serialized, and compressed, at once.
+        Optional.
+        :param batch_bytes: approximate size of the text of each batch, used if
+        `batch_rows` is not set. Optional.
+        :param max_workers: number of threads compressing batches. Defaults to
+        the number of CPUs. Optional.
+        """
+
+        log.info("Init CSV writer")
+        log.debug(f"CSVWriter.__init__("
+                  f"path_segment={path_segment}, "
+                  f"separator={separator}, "
+                  f"compression={compression}, "
+                  f"batch_rows={batch_rows}, "
+                  f"batch_bytes={batch_bytes}, "
+                  f"max_workers={max_workers})")
+
+        self.path_segment = path_segment
+        if separator is not None:
+            self.separator = separator
+        if batch_rows is not None:
+            self.batch_rows = batch_rows
+        if batch_bytes is not None:
+            self.batch_bytes = batch_bytes
+        if max_workers is not None:
+            self.max_workers = max_workers
+        self.compression = CSVWriter.get_compression(path_segment, compression)
+
+        self.columns = None
+        self.rows = 0
+        self.uncompressed_bytes = 0
+        self.compressed_bytes = 0
+
+        self.__file = open(path_segment, "wb")
+        self.__workers = self.max_workers or os.cpu_count() or 1
+        self.__executor = None
+        self.__pending = deque()
+        if self.compression is not None:
+            self.__executor = ThreadPoolExecutor(max_workers=self.__workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def get_compression(path_segment: str, compression: str = None) -> str:
+        """
+        Get the compression codec of the CSV file provided, from its extension
+        or, if it has none, from the codec provided.
+
+        :param path_segment: path to the CSV file.
+        :param compression: codec used when the extension does not select one.
+        :return: compression codec, or None if the file is not compressed.
+        :rtype: str
+        """
+
+        suffix = Path(path_segment).suffix.lower()
+        compression = CSVWriter.COMPRESSIONS.get(suffix, compression)
+        if compression is not None and compression not in CSVWriter.COMPRESSIONS.values():
+            raise ValueError(f"unknown CSV compression \"{compression}\"")
+
+        return compression
+
+    def write(self, dataframe: pd.DataFrame):
+        """
+        Append the rows of the dataframe provided to the file. The header is
+        written before the first rows only, and the columns of the following
+        dataframes are put in its order.
+
+        :param dataframe: dataframe to write.
+        :raises ValueError: if the dataframe does not have the same columns as
+        the first one written.
+        """
+
+        log.debug(f"CSVWriter.write("
+                  f"dataframe={len(dataframe.index)} rows)")
+
+        if self.columns is None:
+            self.columns = list(dataframe.columns)
+        elif list(dataframe.columns) != self.columns:
+            missing_columns = [column for column in self.columns if column not in dataframe.columns]
+            extra_columns = [column for column in dataframe.columns if column not in self.columns]
+            if missing_columns or extra_columns or dataframe.columns.has_duplicates:
+                raise ValueError(
+                    f"columns differ from the header of {self.path_segment}: "
+                    f"missing {missing_columns}, extra {extra_columns}")
+            dataframe = dataframe[self.columns]
+
+        if self.batch_rows is None and len(dataframe.index) > 0:
+            self.batch_rows = self.get_batch_rows(dataframe)
+        batch_rows = self.batch_rows or 1
+
+        for start in range(0, max(len(dataframe.index), 1), batch_rows):
+            batch = dataframe.iloc[start:start + batch_rows]
+            data = batch.to_csv(
+                sep=self.separator,
+                index=False,
+                header=self.uncompressed_bytes == 0).encode()
+            self.rows += len(batch.index)
+            self.uncompressed_bytes += len(data)
+            self.__write_bytes(data)
+
+    def get_batch_rows(self, dataframe: pd.DataFrame) -> int:
+        """
+        Estimate how many rows of the dataframe provided take about
+        `batch_bytes` once serialized, from a sample of its first rows.
+
+        :param dataframe: dataframe to write.
+        :return: number of rows per batch.
+        :rtype: int
+        """
+
+        sample = dataframe.iloc[:1000]
+        sample_bytes = len(sample.to_csv(sep=self.separator, index=False, header=False).encode())
+        batch_rows = max(1, self.batch_bytes * len(sample.index) // max(sample_bytes, 1))
+        log.debug(f"- batch rows: {batch_rows}")
+
+        return batch_rows
+
+    def __write_bytes(self, data: bytes):
+        """
+        Write a serialized batch, compressing it in the pool of threads if
+        needed. At most two batches per thread are kept waiting, so memory is
+        bounded by the batch size.
+
+        :param data: serialized batch.
+        """
+
+        if self.__executor is None:
+            self.__write_compressed(data)
+            return
+
+        self.__pending.append(self.__executor.submit(CSVWriter.compress, data, self.compression))
+        while len(self.__pending) > 2 * self.__workers:
+            self.__write_compressed(self.__pending.popleft().result())
+
+    def __write_compressed(self, data: bytes):
+        self.__file.write(data)
+        self.compressed_bytes += len(data)
+
+    @staticmethod
+    def compress(data: bytes, compression: str) -> bytes:
+        """
+        Compress the data provided as a standalone member of the codec
+        provided.
+
+        :param data: data to compress.
+        :param compression: compression codec.
+        :return: compressed data.
+        :rtype: bytes
+        """
+
+        if compression == "gzip":
+            return gzip.compress(data, compresslevel=6)
+        if compression == "bz2":
+            return bz2.compress(data)
+        if compression == "xz":
+            return lzma.compress(data)
+
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+
+    def close(self):
+        """
+        Write the batches still being compressed and close the file.
+        """
+
+        log.debug("CSVWriter.close()")
+
+        if self.__file.closed:
+            return
+
+        try:
+            while self.__pending:
+                self.__write_compressed(self.__pending.popleft().result())
+        finally:
+            if self.__executor is not None:
+                self.__executor.shutdown()
+            self.__file.close()
+
+        log.debug(f"- rows: {self.rows}")
+        log.debug(f"- uncompressed bytes: {self.uncompressed_bytes}")
+        log.debug(f"- compressed bytes: {self.compressed_bytes}")
@@ -1,13 +1,33 @@
 import argparse
+import functools
+import hashlib
+import inspect
+import itertools
+import json
 import logging
+import math
+import os
+import pickle
 import time
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from typing import Callable, Iterator, List, Union
 
+import numpy as np
 import pandas as pd
-import swifter
 
 from apitep_utils import ArgumentParserHelper
+from apitep_utils.column_operations import ColumnOperations
+from apitep_utils.csv_writer import CSVWriter
+from apitep_utils.dataset_schema import DatasetSchema
+from apitep_utils.duplicate_filter import DuplicateFilter
+from apitep_utils.parse_cache import ParseCache
+from apitep_utils.phase_profiler import PhaseProfiler
 from apitep_utils.report import Report
 
 log = logging.getLogger(__name__)
@@ -22,164 +42,2548 @@ class DataProcessor:
 
     Optionally, generate a reports about the source and destination datasets,
     on load or save.
+
+    The format of each dataset is selected from its extension: CSV, Excel,
+    Parquet, Feather and Arrow IPC are supported. The last three need pyarrow.
+
+    Attach a `DatasetSchema` to the class, or store it next to each input
+    dataset, to choose the columns to read, their types, the categorical
+    columns and the date columns.
+
+    If `chunk_size` is set, the dataset is streamed instead: `load()` prepares
+    an iterator of chunks, `process_chunk()` transforms each of them, and
+    `save()` appends every result to the output file. Only one chunk is kept in
+    memory at a time.
+
+    If `dataframe_backend` is Polars, the datasets are loaded as Polars lazy
+    frames instead, so `process()` can be written against Polars, and
+    multithreaded, optimized, queries only run when the output is saved. They
+    are converted to pandas only for reports. Polars is needed in that case.
+
+    If `memory_map` is True, Feather and Arrow IPC datasets are saved
+    uncompressed, and loaded by mapping them in memory, so stages running in
+    separate processes hand datasets over without parsing, nor copying,
+    them. Processes mapping the same dataset share its pages.
+
+    If `drop_duplicates` is True, duplicated rows are dropped as the datasets
+    are loaded, or streamed, across all of them, comparing the hashes of their
+    rows, over `duplicate_columns` if present (see `DuplicateFilter`).
     """
 
-    class ReportType(Enum):
-        Standard = "standard"
-        Advanced = "advanced"
-        Both = "both"
+    class ReportType(Enum):
+        Standard = "standard"
+        Advanced = "advanced"
+        Both = "both"
+
+    class ApplyBackend(Enum):
+        Serial = "serial"
+        Threads = "threads"
+        Processes = "processes"
+
+    class DataFrameBackend(Enum):
+        Pandas = "pandas"
+        Polars = "polars"
+
+    class DatasetFormat(Enum):
+        CSV = "csv"
+        Excel = "excel"
+        Parquet = "parquet"
+        Feather = "feather"
+        ArrowIPC = "arrow"
+
+    FINGERPRINT_SUFFIX = ".fingerprint.json"
+    RUN_RECORD_SUFFIX = ".metrics.jsonl"
+    PROFILE_PATH_VARIABLE = "APITEP_PROFILE_PATH"
+    METADATA_SUFFIX = ".meta.json"
+    FINGERPRINT_METHODS = ["process", "process_chunk"]
+    FINGERPRINT_EXCLUDED_ATTRIBUTES = [
+        "changes",
+        "metrics",
+        "profile_path_segment",
+        "active_profilers",
+        "input_df",
+        "output_df",
+        "input_dfs",
+        "input_chunks",
+        "fingerprint"
+    ]
+
+    DATASET_FORMATS = {
+        ".csv": DatasetFormat.CSV,
+        ".tsv": DatasetFormat.CSV,
+        ".txt": DatasetFormat.CSV,
+        ".xls": DatasetFormat.Excel,
+        ".xlsx": DatasetFormat.Excel,
+        ".xlsm": DatasetFormat.Excel,
+        ".parquet": DatasetFormat.Parquet,
+        ".pq": DatasetFormat.Parquet,
+        ".feather": DatasetFormat.Feather,
+        ".arrow": DatasetFormat.ArrowIPC,
+        ".ipc": DatasetFormat.ArrowIPC
+    }
+
+    description: str = "DataProcessor"
+    changes = {}
+    metrics = {}
+    input_path_segment: str = None
+    output_path_segment: str = None
+    input_separator: str = ","
+    output_separator: str = ","
+    save_report_on_load: bool = False
+    save_report_on_save: bool = False
+    report_type: ReportType = None
+    report_path_segment: str = None
+    input_type_excel: bool = False
+    chunk_size: int = None
+    input_columns: List = None
+    output_compression: str = None
+    schema: DatasetSchema = None
+    schema_path_segment: str = None
+    optimize_memory: bool = False
+    category_threshold: float = 0.5
+    csv_engine: str = None
+    dtype_backend: str = None
+    max_workers: int = None
+    parse_cache: ParseCache = None
+    incremental: bool = False
+    output_metadata: bool = False
+    verify_input: bool = False
+    excel_sheets: List = None
+    excel_excluded_sheets: List = None
+    excel_engine: str = None
+    partition_rows: int = None
+    partition_column: str = None
+    apply_backend: ApplyBackend = ApplyBackend.Processes
+    profile_path_segment: str = None
+    dataframe_backend: DataFrameBackend = DataFrameBackend.Pandas
+    memory_map: bool = False
+    drop_duplicates: bool = False
+    duplicate_columns: List = None
+
+    input_df: pd.DataFrame = None
+    output_df: pd.DataFrame = None
+    input_chunks: Iterator[pd.DataFrame] = None
+    fingerprint: dict = None
+
+    def __init__(
+            self,
+            input_path_segment: str = None,
+            output_path_segment: str = None,
+            input_separator: str = None,
+            output_separator: str = None,
+            save_report_on_load: bool = None,
+            save_report_on_save: bool = None,
+            report_type: ReportType = None,
+            report_path_segment: str = None,
+            input_type_excel: bool = None,
+            chunk_size: int = None,
+            input_columns: List = None,
+            output_compression: str = None,
+            schema: DatasetSchema = None,
+            schema_path_segment: str = None,
+            optimize_memory: bool = None,
+            category_threshold: float = None,
+            csv_engine: str = None,
+            dtype_backend: str = None,
+            max_workers: int = None,
+            parse_cache: ParseCache = None,
+            incremental: bool = None,
+            output_metadata: bool = None,
+            verify_input: bool = None,
+            excel_sheets: List = None,
+            excel_excluded_sheets: List = None,
+            excel_engine: str = None,
+            partition_rows: int = None,
+            partition_column: str = None,
+            apply_backend: ApplyBackend = None,
+            profile_path_segment: str = None,
+            dataframe_backend: DataFrameBackend = None,
+            memory_map: bool = None,
+            drop_duplicates: bool = None,
+            duplicate_columns: List = None
+    ):
+        """
+        Init DataProcessor class instance.
+
+        :param input_path_segment: path to the input dataset to process.
+        Optional.
+        :param output_path_segment: path where the input dataset, after being
+        processed, should be stored. Optional.
+        :param input_separator: separator used in the input dataset. Optional.
+        :param output_separator: separator used in the output dataset. Optional.
+        :param save_report_on_load: save input dataset report if True.
+        :param save_report_on_save: save output dataset report if True.
+        :param report_type: control the type of the report saved if
+        save_report_on_load or save_report_on_save are True.
+        :param report_path_segment: where to save the reports. If not presents,
+        they will be stored in the dataset's folder.
+        :param input_type_excel: load with configuration of excel if True. Optional.
+        :param chunk_size: number of rows per chunk. If present, the dataset is
+        streamed in chunks of this size instead of loaded at once. Optional.
+        :param input_columns: list of the columns to read from the input
+        dataset. If not present, all of them are read. Optional.
+        :param output_compression: compression codec for the output dataset,
+        such as "snappy", "zstd" or "lz4" for Parquet, Feather or Arrow IPC, or
+        "gzip", "bz2", "xz" or "zstd" for CSV. CSV datasets are also compressed
+        if their extension is ".gz", ".bz2", ".xz" or ".zst". Optional.
+        :param schema: schema used to load the input datasets. Optional.
+        :param schema_path_segment: path to a JSON file with the schema used to
+        load the input datasets. Optional.
+        :param optimize_memory: downcast the columns of the input datasets to
+        save memory if True. Optional.
+        :param category_threshold: maximum ratio of unique values to rows for a
+        text column to be converted to categorical when optimizing memory.
+        Optional.
+        :param csv_engine: parser used to read CSV datasets: "c", "python" or
+        "pyarrow". The last one is multithreaded. Optional.
+        :param dtype_backend: backend of the types of the loaded datasets:
+        "numpy_nullable" or "pyarrow". Optional.
+        :param max_workers: maximum number of datasets loaded, reports saved,
+        CSV output batches compressed, or partitions processed, at the same
+        time. Optional.
+        :param parse_cache: cache of parsed CSV and Excel datasets. Optional.
+        :param incremental: skip the execution if neither the inputs, nor the
+        parameters, nor the code changed since the last one, and the output
+        still exists, if True. Optional.
+        :param output_metadata: save the number of rows and the checksum of the
+        output dataset next to it if True. Optional.
+        :param verify_input: check the number of rows and the checksum of the
+        input datasets against the metadata saved next to them, if any, if
+        True. Optional.
+        :param excel_sheets: names of the sheets to read from Excel datasets.
+        If not present, all of them are read. Optional.
+        :param excel_excluded_sheets: names of the sheets not to read from
+        Excel datasets. Optional.
+        :param excel_engine: engine used to read Excel datasets, any of those
+        `pandas.read_excel()` accepts, such as "openpyxl" or "odf". Optional.
+        :param partition_rows: number of rows per partition. If present, or if
+        `partition_column` is, the input dataset is processed in partitions by
+        `process_chunk()`, in up to `max_workers` processes. Optional.
+        :param partition_column: column whose groups of rows are never split
+        between partitions. Optional.
+        :param apply_backend: how `apply()` runs functions that cannot be
+        vectorized. Optional.
+        :param profile_path_segment: folder where a profile of each measured
+        phase is saved. Profiling is enabled only if present, or if the
+        environment variable APITEP_PROFILE_PATH is set. Optional.
+        :param dataframe_backend: library the datasets are loaded with, and
+        `process()` works with: pandas or Polars. Optional.
+        :param memory_map: save Feather and Arrow IPC datasets uncompressed,
+        and load them by mapping them in memory, if True. Optional.
+        :param drop_duplicates: drop duplicated rows on load, if True.
+        Optional.
+        :param duplicate_columns: columns the rows are compared by to find
+        duplicates. Defaults to all of them. Optional.
+        """
+
+        log.info("Init data processor")
+        log.debug(f"DataProcessor.__init__("
+                  f"input_path_segment={input_path_segment}, "
+                  f"output_path_segment={output_path_segment}, "
+                  f"input_separator={input_separator}, "
+                  f"output_separator={output_separator}, "
+                  f"save_report_on_load={save_report_on_load}, "
+                  f"save_report_on_save={save_report_on_save}, "
+                  f"report_type={report_type}, "
+                  f"report_path_segment={report_path_segment}, "
+                  f"input_type_excel={input_type_excel}, "
+                  f"chunk_size={chunk_size}, "
+                  f"input_columns={input_columns}, "
+                  f"output_compression={output_compression}, "
+                  f"schema={schema}, "
+                  f"schema_path_segment={schema_path_segment}, "
+                  f"optimize_memory={optimize_memory}, "
+                  f"category_threshold={category_threshold}, "
+                  f"csv_engine={csv_engine}, "
+                  f"dtype_backend={dtype_backend}, "
+                  f"max_workers={max_workers}, "
+                  f"parse_cache={parse_cache}, "
+                  f"incremental={incremental}, "
+                  f"output_metadata={output_metadata}, "
+                  f"verify_input={verify_input}, "
+                  f"excel_sheets={excel_sheets}, "
+                  f"excel_excluded_sheets={excel_excluded_sheets}, "
+                  f"excel_engine={excel_engine}, "
+                  f"partition_rows={partition_rows}, "
+                  f"partition_column={partition_column}, "
+                  f"apply_backend={apply_backend}, "
+                  f"profile_path_segment={profile_path_segment}, "
+                  f"dataframe_backend={dataframe_backend}, "
+                  f"memory_map={memory_map}, "
+                  f"drop_duplicates={drop_duplicates}, "
+                  f"duplicate_columns={duplicate_columns})")
+
+        self.changes = {}
+        self.metrics = {}
+        self.active_profilers = []
+
+        if input_path_segment is not None:
+            self.input_path_segment = input_path_segment
+
+        if output_path_segment is not None:
+            self.output_path_segment = output_path_segment
+
+        if input_separator is not None:
+            self.input_separator = input_separator
+
+        if output_separator is not None:
+            self.output_separator = output_separator
+
+        if save_report_on_load is not None:
+            self.save_report_on_load = save_report_on_load
+
+        if save_report_on_save is not None:
+            self.save_report_on_save = save_report_on_save
+
+        if report_type is not None:
+            self.report_type = report_type
+
+        if report_path_segment is not None:
+            self.report_path_segment = report_path_segment
+
+        if input_type_excel is not None:
+            self.input_type_excel = input_type_excel
+
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+
+        if input_columns is not None:
+            self.input_columns = input_columns
+
+        if output_compression is not None:
+            self.output_compression = output_compression
+
+        if schema is not None:
+            self.schema = schema
+
+        if schema_path_segment is not None:
+            self.schema_path_segment = schema_path_segment
+
+        if optimize_memory is not None:
+            self.optimize_memory = optimize_memory
+
+        if category_threshold is not None:
+            self.category_threshold = category_threshold
+
+        if csv_engine is not None:
+            self.csv_engine = csv_engine
+
+        if dtype_backend is not None:
+            self.dtype_backend = dtype_backend
+
+        if max_workers is not None:
+            self.max_workers = max_workers
+
+        if parse_cache is not None:
+            self.parse_cache = parse_cache
+
+        if incremental is not None:
+            self.incremental = incremental
+
+        if output_metadata is not None:
+            self.output_metadata = output_metadata
+
+        if verify_input is not None:
+            self.verify_input = verify_input
+
+        if excel_sheets is not None:
+            self.excel_sheets = excel_sheets
+
+        if excel_excluded_sheets is not None:
+            self.excel_excluded_sheets = excel_excluded_sheets
+
+        if excel_engine is not None:
+            self.excel_engine = excel_engine
+
+        if partition_rows is not None:
+            self.partition_rows = partition_rows
+
+        if partition_column is not None:
+            self.partition_column = partition_column
+
+        if apply_backend is not None:
+            self.apply_backend = apply_backend
+
+        if profile_path_segment is not None:
+            self.profile_path_segment = profile_path_segment
+        elif os.environ.get(DataProcessor.PROFILE_PATH_VARIABLE):
+            self.profile_path_segment = os.environ[DataProcessor.PROFILE_PATH_VARIABLE]
+
+        if dataframe_backend is not None:
+            self.dataframe_backend = dataframe_backend
+
+        if memory_map is not None:
+            self.memory_map = memory_map
+
+        if drop_duplicates is not None:
+            self.drop_duplicates = drop_duplicates
+        if duplicate_columns is not None:
+            self.duplicate_columns = duplicate_columns
+
+    def load(self):
+        """
+        Load the dataset in the input path provided, in any of the formats in
+        `DatasetFormat`. Optionally, save a report in the same path, with the
+        same name, but with HTML extension.
+
+        In streaming mode, only prepare the iterator of chunks in `input_chunks`.
+        Nothing is read until `save()` consumes it.
+
+        If `drop_duplicates` is True, duplicated rows are dropped, after the
+        report, if any, or as the chunks are read.
+        """
+
+        log.info("Load input dataset")
+        log.debug("DataProcessor.load()")
+
+        if self.input_path_segment is None:
+            log.debug("- input path is none, nothing to load or report about")
+            return
+        if self.chunk_size is not None:
+            self.input_chunks = self.read_chunks([self.input_path_segment])
+            if self.drop_duplicates:
+                self.input_chunks = self.get_duplicate_filter().filter_chunks(self.input_chunks)
+            return
+
+        self.input_df = self.read_dataset(self.input_path_segment)
+
+        if self.save_report_on_load:
+            with self.measure("load_report"):
+                self.save_report(self.input_df, self.input_path_segment)
+        if self.drop_duplicates:
+            self.input_df = self.get_duplicate_filter().filter(self.input_df, self.input_path_segment)
+
+    @staticmethod
+    def get_dataset_format(path_segment: str) -> DatasetFormat:
+        """
+        Get the format of the dataset in the path provided from its extension.
+        Unknown extensions are considered CSV.
+
+        :param path_segment: path to the dataset.
+        :return: format of the dataset.
+        :rtype: DatasetFormat
+        """
+
+        log.debug(f"DataProcessor.get_dataset_format("
+                  f"path_segment={path_segment})")
+
+        suffix = Path(path_segment).suffix.lower()
+        dataset_format = DataProcessor.DATASET_FORMATS.get(
+            suffix,
+            DataProcessor.DatasetFormat.CSV)
+        log.debug(f"- dataset format: {dataset_format}")
+
+        return dataset_format
+
+    def get_input_dataset_format(self, input_path_segment: str) -> DatasetFormat:
+        """
+        Get the format of the input dataset in the path provided. It is always
+        Excel if `input_type_excel` is True.
+
+        :param input_path_segment: path to the input dataset.
+        :return: format of the input dataset.
+        :rtype: DatasetFormat
+        """
+
+        log.debug(f"DataProcessor.get_input_dataset_format("
+                  f"input_path_segment={input_path_segment})")
+
+        if self.input_type_excel:
+            return DataProcessor.DatasetFormat.Excel
+
+        return self.get_dataset_format(input_path_segment)
+
+    def get_schema(self, input_path_segment: str) -> DatasetSchema:
+        """
+        Get the schema of the input dataset in the path provided. It is the
+        schema in `schema`, or the one in `schema_path_segment`, or the one
+        stored next to the dataset, in that order. None if there is none.
+
+        :param input_path_segment: path to the input dataset.
+        :return: schema of the input dataset, or None.
+        :rtype: DatasetSchema
+        """
+
+        log.debug(f"DataProcessor.get_schema("
+                  f"input_path_segment={input_path_segment})")
+
+        if self.schema is not None:
+            return self.schema
+
+        if self.schema_path_segment is not None:
+            return DatasetSchema.from_file(self.schema_path_segment)
+
+        sidecar_path_segment = DatasetSchema.get_sidecar_path(input_path_segment)
+        if Path(sidecar_path_segment).is_file():
+            log.debug(f"- schema found: {sidecar_path_segment}")
+            return DatasetSchema.from_file(sidecar_path_segment)
+
+        return None
+
+    def get_read_arguments(self, schema: DatasetSchema) -> dict:
+        """
+        Get the columns to read and their types, from `input_columns` and the
+        schema provided. `input_columns` takes precedence over the columns in
+        the schema.
+
+        :param schema: schema of the input dataset, or None.
+        :return: dictionary with the keys "columns" and "dtypes".
+        :rtype: dict
+        """
+
+        columns = self.input_columns
+        dtypes = None
+        if schema is not None:
+            if columns is None:
+                columns = schema.columns
+            dtypes = schema.get_dtypes() or None
+
+        return {"columns": columns, "dtypes": dtypes}
+
+    def get_backend_arguments(self) -> dict:
+        """
+        Get the arguments selecting the types backend, to pass to pandas'
+        readers. Empty if `dtype_backend` is not present, so older versions of
+        pandas are still supported.
+
+        :return: dictionary of arguments for pandas' readers.
+        :rtype: dict
+        """
+
+        if self.dtype_backend is None:
+            return {}
+
+        return {"dtype_backend": self.dtype_backend}
+
+    def read_dataset(self, input_path_segment: str) -> pd.DataFrame:
+        """
+        Read the dataset in the path provided. The format is selected from the
+        extension of the file. Only the columns in `input_columns` are read, if
+        present. The schema of the dataset, if any, is applied. Then, the
+        memory used is optimized if `optimize_memory` is True.
+
+        CSV and Excel datasets are taken from `parse_cache`, if present, when
+        neither the file nor the options used to parse it have changed.
+
+        If `verify_input` is True, the checksum and the number of rows of the
+        dataset are checked against its metadata, if any.
+
+        With the Polars backend, a Polars lazy frame is returned instead (see
+        `read_polars_dataset()`), and neither `parse_cache` nor
+        `optimize_memory` are used.
+
+        :param input_path_segment: path to the dataset to read.
+        :return: dataframe with the contents of the dataset.
+        :rtype: pd.DataFrame
+        """
+
+        log.info("Read input dataset")
+        log.debug(f"DataProcessor.read_dataset("
+                  f"input_path_segment={input_path_segment})")
+
+        dataset_format = self.get_input_dataset_format(input_path_segment)
+        schema = self.get_schema(input_path_segment)
+        read_arguments = self.get_read_arguments(schema)
+
+        metadata = None
+        if self.verify_input:
+            metadata = self.verify_dataset(input_path_segment)
+
+        input_df = None
+        cache_options = None
+        if self.dataframe_backend == DataProcessor.DataFrameBackend.Polars:
+            input_df = self.read_polars_dataset(
+                input_path_segment,
+                dataset_format,
+                schema,
+                read_arguments)
+        elif self.parse_cache is not None and dataset_format in [
+                DataProcessor.DatasetFormat.CSV,
+                DataProcessor.DatasetFormat.Excel]:
+            cache_options = self.get_cache_options(dataset_format, schema, read_arguments)
+            input_df = self.parse_cache.get(
+                input_path_segment,
+                cache_options,
+                self.dtype_backend)
+
+        if input_df is None:
+            input_df = self.__parse_dataset(
+                input_path_segment,
+                dataset_format,
+                schema,
+                read_arguments)
+            if cache_options is not None:
+                self.parse_cache.put(input_path_segment, cache_options, input_df)
+
+        if metadata is not None:
+            rows = DataProcessor.count_rows(input_df)
+            if metadata["rows"] != rows:
+                log.error(f"- {input_path_segment} has {rows} rows "
+                          f"but its metadata says {metadata['rows']}")
+                raise RuntimeError(f"dataset does not match its metadata: {input_path_segment}")
+
+        if self.optimize_memory:
+            if DataProcessor.is_polars(input_df):
+                log.warning("- memory optimization is not available with the polars backend")
+            else:
+                input_df = self.optimize_dataframe_memory(input_df, input_path_segment)
+
+        return input_df
+
+    def read_polars_dataset(
+            self,
+            input_path_segment: str,
+            dataset_format: DatasetFormat,
+            schema: DatasetSchema,
+            read_arguments: dict
+    ):
+        """
+        Read the dataset in the path provided as a Polars lazy frame, and apply
+        its schema, if any. CSV, Parquet, Feather and Arrow IPC datasets are
+        scanned, so nothing is read until the lazy frame is collected, and only
+        the columns and rows the query needs. Excel datasets are read with
+        pandas, then converted.
+
+        :param input_path_segment: path to the dataset to read.
+        :param dataset_format: format of the dataset.
+        :param schema: schema of the dataset, or None.
+        :param read_arguments: columns to read and their types.
+        :return: Polars lazy frame with the contents of the dataset.
+        :rtype: pl.LazyFrame
+        """
+
+        log.debug(f"DataProcessor.read_polars_dataset("
+                  f"input_path_segment={input_path_segment}, "
+                  f"dataset_format={dataset_format})")
+
+        import polars as pl
+
+        if dataset_format == DataProcessor.DatasetFormat.CSV:
+            schema_overrides = None
+            if schema is not None:
+                schema_overrides = schema.get_polars_dtypes() or None
+            lazy_frame = pl.scan_csv(
+                input_path_segment,
+                separator=self.input_separator,
+                schema_overrides=schema_overrides)
+        elif dataset_format == DataProcessor.DatasetFormat.Excel:
+            lazy_frame = pl.from_pandas(self.read_excel(input_path_segment, read_arguments)).lazy()
+        elif dataset_format == DataProcessor.DatasetFormat.Parquet:
+            lazy_frame = pl.scan_parquet(input_path_segment)
+        else:
+            lazy_frame = pl.scan_ipc(input_path_segment)
+
+        if read_arguments["columns"] is not None:
+            lazy_frame = lazy_frame.select(read_arguments["columns"])
+        if schema is not None:
+            lazy_frame = schema.apply_polars(lazy_frame)
+
+        return lazy_frame
+
+    @staticmethod
+    def is_polars(dataframe) -> bool:
+        """
+        Check if the dataframe provided is a Polars dataframe or lazy frame,
+        without importing Polars.
+
+        :param dataframe: dataframe to check.
+        :return: True if it comes from Polars.
+        :rtype: bool
+        """
+
+        return type(dataframe).__module__.split(".")[0] == "polars"
+
+    @staticmethod
+    def collect(dataframe):
+        """
+        Compute the Polars lazy frame provided. Any other dataframe is returned
+        as it is.
+
+        :param dataframe: dataframe, or lazy frame.
+        :return: dataframe.
+        """
+
+        if DataProcessor.is_polars(dataframe) and hasattr(dataframe, "collect"):
+            return dataframe.collect()
+
+        return dataframe
+
+    @staticmethod
+    def to_pandas(dataframe) -> pd.DataFrame:
+        """
+        Convert the Polars dataframe, or lazy frame, provided to pandas. Pandas
+        dataframes are returned as they are.
+
+        :param dataframe: dataframe to convert.
+        :return: pandas dataframe.
+        :rtype: pd.DataFrame
+        """
+
+        if not DataProcessor.is_polars(dataframe):
+            return dataframe
+
+        return DataProcessor.collect(dataframe).to_pandas()
+
+    @staticmethod
+    def to_polars(dataframe):
+        """
+        Convert the pandas, or Polars, dataframe provided to a Polars lazy
+        frame. Lazy frames are returned as they are.
+
+        :param dataframe: dataframe to convert.
+        :return: Polars lazy frame.
+        :rtype: pl.LazyFrame
+        """
+
+        if DataProcessor.is_polars(dataframe):
+            return dataframe.lazy()
+
+        import polars as pl
+
+        return pl.from_pandas(dataframe).lazy()
+
+    @staticmethod
+    def get_dataframe_shape(dataframe) -> tuple:
+        """
+        Get the number of rows and columns of the dataframe provided. The rows
+        of Polars lazy frames are unknown, as counting them means running the
+        query.
+
+        :param dataframe: pandas or Polars dataframe, or Polars lazy frame.
+        :return: number of rows, or None, and number of columns.
+        :rtype: tuple
+        """
+
+        if not DataProcessor.is_polars(dataframe):
+            return len(dataframe.index), len(dataframe.columns)
+        if hasattr(dataframe, "collect"):
+            return None, len(dataframe.collect_schema())
+
+        return dataframe.height, dataframe.width
+
+    @staticmethod
+    def count_rows(dataframe) -> int:
+        """
+        Get the number of rows of the dataframe provided, running the query of
+        Polars lazy frames, but only to count them.
+
+        :param dataframe: pandas or Polars dataframe, or Polars lazy frame.
+        :return: number of rows.
+        :rtype: int
+        """
+
+        rows, _ = DataProcessor.get_dataframe_shape(dataframe)
+        if rows is None:
+            import polars as pl
+
+            rows = dataframe.select(pl.len()).collect().item()
+
+        return rows
+
+    def get_cache_options(self, dataset_format: DatasetFormat, schema: DatasetSchema, read_arguments: dict) -> dict:
+        """
+        Get the options that change the result of parsing an input dataset, to
+        identify it in `parse_cache`.
+
+        :param dataset_format: format of the input dataset.
+        :param schema: schema of the input dataset, or None.
+        :param read_arguments: columns to read and their types.
+        :return: dictionary of options.
+        :rtype: dict
+        """
+
+        options = {
+            "format": dataset_format.value,
+            "separator": self.input_separator,
+            "columns": read_arguments["columns"],
+            "dtypes": read_arguments["dtypes"],
+            "csv_engine": self.csv_engine,
+            "dtype_backend": self.dtype_backend
+        }
+        if schema is not None:
+            options["dates"] = schema.dates
+        if dataset_format == DataProcessor.DatasetFormat.Excel:
+            options["excel_sheets"] = self.excel_sheets
+            options["excel_excluded_sheets"] = self.excel_excluded_sheets
+            options["excel_engine"] = self.excel_engine
+
+        return options
+
+    def __parse_dataset(
+            self,
+            input_path_segment: str,
+            dataset_format: DatasetFormat,
+            schema: DatasetSchema,
+            read_arguments: dict
+    ) -> pd.DataFrame:
+        """
+        Parse the dataset in the path provided with the reader of its format,
+        and apply its schema, if any.
+
+        :param input_path_segment: path to the dataset to read.
+        :param dataset_format: format of the dataset.
+        :param schema: schema of the dataset, or None.
+        :param read_arguments: columns to read and their types.
+        :return: dataframe with the contents of the dataset.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug(f"DataProcessor.__parse_dataset("
+                  f"input_path_segment={input_path_segment}, "
+                  f"dataset_format={dataset_format})")
+
+        if dataset_format == DataProcessor.DatasetFormat.CSV:
+            input_df = pd.read_csv(
+                input_path_segment,
+                sep=self.input_separator,
+                usecols=read_arguments["columns"],
+                dtype=read_arguments["dtypes"],
+                engine=self.csv_engine,
+                **self.get_backend_arguments())
+            if self.csv_engine == "pyarrow":
+                input_df = self.fill_empty_strings(input_df)
+        elif dataset_format == DataProcessor.DatasetFormat.Excel:
+            input_df = self.read_excel(input_path_segment, read_arguments)
+        elif dataset_format == DataProcessor.DatasetFormat.Parquet:
+            input_df = pd.read_parquet(
+                input_path_segment,
+                columns=read_arguments["columns"],
+                **self.get_backend_arguments())
+        elif self.memory_map:
+            input_df = self.read_memory_mapped(input_path_segment, read_arguments)
+        else:
+            input_df = pd.read_feather(
+                input_path_segment,
+                columns=read_arguments["columns"],
+                **self.get_backend_arguments())
+
+        if schema is not None:
+            input_df = schema.apply(input_df)
+
+        return input_df
+
+    @staticmethod
+    def fill_empty_strings(dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace the empty strings of the text columns of the dataframe provided
+        with missing values. The pyarrow CSV engine reads empty fields of text
+        columns as empty strings, while the C and Python engines read them as
+        missing values, so this makes the engines interchangeable.
+
+        :param dataframe: dataframe read with the pyarrow CSV engine.
+        :return: dataframe with missing values instead of empty strings. Only
+        the columns changed are copied.
+        :rtype: pd.DataFrame
+        """
+
+        for column in dataframe.columns:
+            series = dataframe[column]
+            if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+                continue
+            empty = series.eq("").fillna(False).to_numpy(dtype=bool)
+            if empty.any():
+                dataframe[column] = series.mask(empty)
+
+        return dataframe
+
+    def read_memory_mapped(self, input_path_segment: str, read_arguments: dict) -> pd.DataFrame:
+        """
+        Read the Feather or Arrow IPC dataset in the path provided by mapping
+        it in memory. Numeric columns without missing values, or every column
+        if `dtype_backend` is "pyarrow", are not copied: they point to the
+        mapped file, and are read-only. Compressed datasets are decompressed,
+        and thus copied, anyway.
+
+        :param input_path_segment: path to the dataset to read.
+        :param read_arguments: columns to read and their types.
+        :return: dataframe with the contents of the dataset.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug(f"DataProcessor.read_memory_mapped("
+                  f"input_path_segment={input_path_segment})")
+
+        import pyarrow as pa
+
+        table = pa.ipc.open_file(pa.memory_map(input_path_segment)).read_all()
+        if read_arguments["columns"] is not None:
+            table = table.select(read_arguments["columns"])
+
+        types_mapper = None
+        if self.dtype_backend == "pyarrow":
+            types_mapper = pd.ArrowDtype
+
+        return table.to_pandas(split_blocks=True, types_mapper=types_mapper)
+
+    def get_excel_sheets(self, input_path_segment: str) -> List:
+        """
+        Get the names of the sheets to read from the Excel dataset in the path
+        provided: those in `excel_sheets`, or every sheet if not present, minus
+        those in `excel_excluded_sheets`.
+
+        :param input_path_segment: path to the Excel dataset.
+        :return: list of sheet names, in the order they are read.
+        :rtype: List
+        """
+
+        log.debug(f"DataProcessor.get_excel_sheets("
+                  f"input_path_segment={input_path_segment})")
+
+        with pd.ExcelFile(input_path_segment, engine=self.excel_engine) as excel_file:
+            sheet_names = excel_file.sheet_names
+
+        if self.excel_sheets is not None:
+            missing_sheets = [sheet for sheet in self.excel_sheets if sheet not in sheet_names]
+            if missing_sheets:
+                log.error(f"- sheets not found in {input_path_segment}: {missing_sheets}")
+                raise ValueError(f"sheets not found: {missing_sheets}")
+            sheet_names = list(self.excel_sheets)
+        if self.excel_excluded_sheets is not None:
+            sheet_names = [sheet for sheet in sheet_names if sheet not in self.excel_excluded_sheets]
+        log.debug(f"- sheets: {sheet_names}")
+
+        return sheet_names
+
+    def read_excel(self, input_path_segment: str, read_arguments: dict) -> pd.DataFrame:
+        """
+        Read the sheets selected from the Excel dataset in the path provided,
+        and concatenate them. Sheets are parsed by up to `max_workers`
+        processes, as Excel parsing is bound by the CPU.
+
+        :param input_path_segment: path to the Excel dataset.
+        :param read_arguments: columns to read and their types.
+        :return: dataframe with the contents of the sheets.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug(f"DataProcessor.read_excel("
+                  f"input_path_segment={input_path_segment})")
+
+        sheet_names = self.get_excel_sheets(input_path_segment)
+        excel_arguments = {
+            "header": 0,
+            "usecols": read_arguments["columns"],
+            "dtype": read_arguments["dtypes"],
+            "engine": self.excel_engine,
+            **self.get_backend_arguments()
+        }
+
+        if not sheet_names:
+            log.warning(f"- no sheets selected in {input_path_segment}")
+            return pd.DataFrame(columns=read_arguments["columns"])
+
+        max_workers = min(len(sheet_names), self.max_workers or os.cpu_count() or 1)
+        if max_workers == 1:
+            sheet_dfs = [
+                DataProcessor.read_excel_sheet(input_path_segment, sheet_name, excel_arguments)
+                for sheet_name in sheet_names
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                sheet_dfs = list(executor.map(
+                    DataProcessor.read_excel_sheet,
+                    itertools.repeat(input_path_segment),
+                    sheet_names,
+                    itertools.repeat(excel_arguments)))
+
+        return pd.concat(sheet_dfs, ignore_index=True)
+
+    @staticmethod
+    def read_excel_sheet(input_path_segment: str, sheet_name: str, excel_arguments: dict) -> pd.DataFrame:
+        """
+        Read a sheet from the Excel dataset in the path provided.
+
+        :param input_path_segment: path to the Excel dataset.
+        :param sheet_name: name of the sheet to read.
+        :param excel_arguments: arguments passed to the Excel reader.
+        :return: dataframe with the contents of the sheet.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug(f"DataProcessor.read_excel_sheet("
+                  f"input_path_segment={input_path_segment}, "
+                  f"sheet_name={sheet_name})")
+
+        return pd.read_excel(input_path_segment, sheet_name=sheet_name, **excel_arguments)
+
+    def optimize_dataframe_memory(self, dataframe: pd.DataFrame, name: str) -> pd.DataFrame:
+        """
+        Reduce the memory used by the dataframe provided. Integer and float
+        columns are downcast to the smallest type that keeps their values, and
+        text columns with a ratio of unique values to rows up to
+        `category_threshold` are converted to categorical.
+
+        The bytes saved in each column are stored in `changes`.
+
+        :param dataframe: dataframe to optimize.
+        :param name: name of the dataframe, used to describe the changes.
+        :return: dataframe using less memory.
+        :rtype: pd.DataFrame
+        """
+
+        log.info("Optimize dataset memory")
+        log.debug(f"DataProcessor.optimize_dataframe_memory("
+                  f"dataframe={len(dataframe.index)} rows, "
+                  f"name={name})")
+
+        optimized_df = dataframe.copy(deep=False)
+        bytes_saved = 0
+        for column in dataframe.columns:
+            series = dataframe[column]
+            optimized_series = self.__optimize_series_memory(series)
+            if optimized_series is None:
+                continue
+
+            series_bytes = series.memory_usage(index=False, deep=True)
+            optimized_series_bytes = optimized_series.memory_usage(index=False, deep=True)
+            if optimized_series_bytes >= series_bytes:
+                continue
+
+            optimized_df[column] = optimized_series
+            column_bytes_saved = series_bytes - optimized_series_bytes
+            self.changes[f"bytes saved in {name}, column {column}"] = column_bytes_saved
+            bytes_saved += column_bytes_saved
+
+        log.debug(f"- bytes saved: {bytes_saved}")
+
+        return optimized_df
+
+    def __optimize_series_memory(self, series: pd.Series) -> pd.Series:
+        """
+        Get a version of the series provided using a smaller type, without
+        losing any of its values.
+
+        :param series: series to optimize.
+        :return: optimized series, or None if it cannot be optimized.
+        :rtype: pd.Series
+        """
+
+        if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+            return None
+
+        if pd.api.types.is_numeric_dtype(series) and not series.notna().any():
+            # Nothing to keep, and the minimum of nullable types would be NA
+            return None
+
+        if pd.api.types.is_integer_dtype(series):
+            if series.min() >= 0:
+                return pd.to_numeric(series, downcast="unsigned")
+            return pd.to_numeric(series, downcast="integer")
+
+        if pd.api.types.is_float_dtype(series):
+            optimized_series = pd.to_numeric(series, downcast="float")
+            lossless = (optimized_series.astype(series.dtype) == series) | series.isna()
+            if lossless.all():
+                return optimized_series
+            return None
+
+        if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            if len(series.index) == 0:
+                return None
+            try:
+                unique_ratio = series.nunique() / len(series.index)
+            except TypeError:
+                return None
+            if unique_ratio <= self.category_threshold:
+                return series.astype("category")
+
+        return None
+
+    def read_datasets(self, input_path_segments: List) -> List[pd.DataFrame]:
+        """
+        Read the datasets in the path list provided, with up to `max_workers`
+        threads. The dataframes are returned in the same order as the paths.
+
+        If any of the datasets cannot be read, every failure is logged and an
+        error listing the datasets is raised. No dataframe is returned.
+
+        :param input_path_segments: list of paths to the datasets to read.
+        :return: list of dataframes with the contents of the datasets.
+        :rtype: List[pd.DataFrame]
+        """
+
+        log.info("Read input datasets")
+        log.debug(f"DataProcessor.read_datasets("
+                  f"input_path_segments={input_path_segments})")
+
+        return self.__map_datasets(
+            self.read_dataset,
+            input_path_segments,
+            "cannot load datasets")
+
+    def save_reports(self, dataframes: List[pd.DataFrame], source_path_segments: List):
+        """
+        Save a report about each of the dataframes provided, with up to
+        `max_workers` threads.
+
+        :param dataframes: list of dataframes reports should be generated about.
+        :param source_path_segments: list of paths to the data sources used to
+        create the dataframes, in the same order.
+        """
+
+        log.info("Save datasets reports")
+        log.debug(f"DataProcessor.save_reports("
+                  f"dataframes={len(dataframes)}, "
+                  f"source_path_segments={source_path_segments})")
+
+        self.__map_datasets(
+            self.save_report,
+            source_path_segments,
+            "cannot save datasets reports",
+            dataframes)
+
+    def __map_datasets(self, function, path_segments: List, error_message: str, *arguments: List) -> List:
+        """
+        Call the function provided once per path, with up to `max_workers`
+        threads, and return the results in the same order as the paths. If any
+        of the calls fails, log every failure and raise a single error.
+
+        :param function: function to call with each path, preceded by the
+        corresponding item of each list in arguments.
+        :param path_segments: list of paths to the datasets.
+        :param error_message: description of the error raised on failure.
+        :param arguments: more lists of items to pass to the function.
+        :return: list of results.
+        :rtype: List
+        """
+
+        calls = list(zip(*arguments, path_segments))
+        max_workers = self.max_workers or 1
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(len(calls), 1))) as executor:
+            futures = [executor.submit(function, *call) for call in calls]
+
+        results = []
+        failures = []
+        for path_segment, future in zip(path_segments, futures):
+            error = future.exception()
+            if error is not None:
+                log.error(f"- {path_segment}: {error!r}")
+                failures.append((path_segment, error))
+            else:
+                results.append(future.result())
+
+        if failures:
+            failed_path_segments = ", ".join(path_segment for path_segment, _ in failures)
+            raise RuntimeError(f"{error_message}: {failed_path_segments}") from failures[0][1]
+
+        return results
+
+    def read_chunks(self, input_path_segments: List) -> Iterator[pd.DataFrame]:
+        """
+        Read the datasets in the path list provided in chunks of `chunk_size`
+        rows, one file after the other. Files are not opened until their first
+        chunk is requested, but their checksums are verified beforehand if
+        `verify_input` is True.
+
+        :param input_path_segments: list of paths to the datasets to read.
+        :return: iterator over the chunks of all the datasets.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        log.info("Read input datasets in chunks")
+        log.debug(f"DataProcessor.read_chunks("
+                  f"input_path_segments={input_path_segments})")
+
+        if self.dataframe_backend == DataProcessor.DataFrameBackend.Polars:
+            log.error("- streaming mode is not available with the polars backend")
+            raise NotImplementedError
+
+        for input_path_segment in input_path_segments:
+            dataset_format = self.get_input_dataset_format(input_path_segment)
+            if dataset_format == DataProcessor.DatasetFormat.Excel:
+                log.error("- Excel datasets cannot be read in chunks")
+                raise NotImplementedError
+            if self.verify_input:
+                self.verify_dataset(input_path_segment)
+
+        if self.save_report_on_load:
+            log.warning("- reports on load are not available in streaming mode")
+
+        return itertools.chain.from_iterable(
+            self.read_dataset_chunks(input_path_segment)
+            for input_path_segment in input_path_segments)
+
+    def read_dataset_chunks(self, input_path_segment: str) -> Iterator[pd.DataFrame]:
+        """
+        Read the dataset in the path provided in chunks of `chunk_size` rows.
+        The schema of the dataset, if any, is applied to each chunk.
+
+        :param input_path_segment: path to the dataset to read.
+        :return: iterator over the chunks of the dataset.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        log.debug(f"DataProcessor.read_dataset_chunks("
+                  f"input_path_segment={input_path_segment})")
+
+        dataset_format = self.get_input_dataset_format(input_path_segment)
+        schema = self.get_schema(input_path_segment)
+        read_arguments = self.get_read_arguments(schema)
+
+        if dataset_format == DataProcessor.DatasetFormat.CSV:
+            csv_engine = self.csv_engine
+            if csv_engine == "pyarrow":
+                log.debug("- pyarrow engine cannot read in chunks, using c engine")
+                csv_engine = "c"
+            with pd.read_csv(
+                    input_path_segment,
+                    sep=self.input_separator,
+                    usecols=read_arguments["columns"],
+                    dtype=read_arguments["dtypes"],
+                    engine=csv_engine,
+                    chunksize=self.chunk_size,
+                    **self.get_backend_arguments()) as reader:
+                yield from self.__apply_schema(reader, schema)
+        elif dataset_format == DataProcessor.DatasetFormat.Parquet:
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(input_path_segment)
+            chunks = (
+                batch.to_pandas()
+                for batch in parquet_file.iter_batches(
+                    batch_size=self.chunk_size,
+                    columns=read_arguments["columns"]))
+            yield from self.__apply_schema(chunks, schema)
+        else:
+            import pyarrow as pa
+
+            with pa.memory_map(input_path_segment) as source:
+                table = pa.ipc.open_file(source).read_all()
+                if read_arguments["columns"] is not None:
+                    table = table.select(read_arguments["columns"])
+                chunks = (
+                    batch.to_pandas()
+                    for batch in table.to_batches(max_chunksize=self.chunk_size))
+                yield from self.__apply_schema(chunks, schema)
+
+    @staticmethod
+    def __apply_schema(chunks: Iterator[pd.DataFrame], schema: DatasetSchema) -> Iterator[pd.DataFrame]:
+        """
+        Apply the schema provided, if any, to each chunk.
+
+        :param chunks: iterator over the chunks of a dataset.
+        :param schema: schema of the dataset, or None.
+        :return: iterator over the chunks complying with the schema.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        for chunk in chunks:
+            if schema is not None:
+                chunk = schema.apply(chunk)
+            yield chunk
+
+    def save(self):
+        """
+        Save the dataset in the output path provided, in the format selected by
+        its extension. Save a report in the same path, with the same name, but
+        with the corresponding extension.
+
+        In streaming mode, each chunk in `input_chunks` is transformed with
+        `process_chunk()` and appended to the output file.
+
+        The dataset is written to a temporary file in the same folder, which
+        replaces the output file only once it is complete and flushed to disk.
+        A failed save leaves the previous output, if any, untouched. If
+        `output_metadata` is True, the number of rows and the checksum of the
+        dataset are saved next to it.
+        """
+
+        log.info("Save output dataset")
+        log.debug("DataProcessor.save()")
+
+        if self.output_path_segment is None:
+            log.debug("- output path is none, nothing to save or report about")
+            return
+
+        output_path = Path(self.output_path_segment)
+        output_path_parent = output_path.parent
+        if not output_path_parent.exists():
+            output_path_parent.mkdir(parents=True)
+
+        temporary_path_segment = self.get_temporary_path_segment(self.output_path_segment)
+        try:
+            if self.chunk_size is not None:
+                rows = self.save_chunks(temporary_path_segment)
+            else:
+                self.output_df = DataProcessor.collect(self.output_df)
+                self.write_dataset(self.output_df, temporary_path_segment)
+                rows = DataProcessor.count_rows(self.output_df)
+            Path(self.get_metadata_path_segment(self.output_path_segment)).unlink(missing_ok=True)
+            DataProcessor.replace_file(temporary_path_segment, self.output_path_segment)
+        except BaseException:
+            Path(temporary_path_segment).unlink(missing_ok=True)
+            raise
+
+        if self.output_metadata:
+            self.save_metadata(self.output_path_segment, rows)
+
+        if self.chunk_size is None and self.save_report_on_save:
+            with self.measure("save_report"):
+                self.save_report(self.output_df, self.output_path_segment)
+
+    def write_dataset(self, dataframe: pd.DataFrame, output_path_segment: str):
+        """
+        Write the dataframe provided to the path provided. The format is
+        selected from the extension of the file. Columnar formats are
+        compressed with `output_compression`, if present. CSV datasets are
+        compressed with the codec selected by their extension or by
+        `output_compression`, using several threads.
+
+        Polars dataframes are written by `write_polars_dataset()`.
+
+        :param dataframe: dataframe to write.
+        :param output_path_segment: path where the dataset should be written.
+        """
+
+        if DataProcessor.is_polars(dataframe):
+            self.write_polars_dataset(dataframe, output_path_segment)
+            return
+
+        log.info("Write output dataset")
+        log.debug(f"DataProcessor.write_dataset("
+                  f"dataframe={len(dataframe.index)} rows, "
+                  f"output_path_segment={output_path_segment})")
+
+        dataset_format = self.get_dataset_format(output_path_segment)
+
+        if dataset_format == DataProcessor.DatasetFormat.CSV:
+            tic = time.perf_counter()
+            with self.get_csv_writer(output_path_segment) as csv_writer:
+                csv_writer.write(dataframe)
+            toc = time.perf_counter()
+            self.record_save_metrics(csv_writer, toc - tic)
+        elif dataset_format == DataProcessor.DatasetFormat.Excel:
+            dataframe.to_excel(
+                output_path_segment,
+                index=False)
+        elif dataset_format == DataProcessor.DatasetFormat.Parquet:
+            dataframe.to_parquet(
+                output_path_segment,
+                compression=self.output_compression or "snappy",
+                index=False)
+        else:
+            dataframe.reset_index(drop=True).to_feather(
+                output_path_segment,
+                compression=self.get_arrow_compression())
+
+    def write_polars_dataset(self, dataframe, output_path_segment: str):
+        """
+        Write the Polars dataframe, or lazy frame, provided to the path
+        provided, with Polars' writers. The format and the compression are
+        selected as in `write_dataset()`. Feather and Arrow IPC datasets are
+        written with the Arrow types pandas reads, so pandas stages can load
+        them. Compressed CSV and Excel
+        datasets are converted to pandas and written by `write_dataset()`.
+
+        :param dataframe: Polars dataframe, or lazy frame, to write.
+        :param output_path_segment: path where the dataset should be written.
+        """
+
+        log.info("Write output dataset with polars")
+        log.debug(f"DataProcessor.write_polars_dataset("
+                  f"output_path_segment={output_path_segment})")
+
+        dataframe = DataProcessor.collect(dataframe)
+        dataset_format = self.get_dataset_format(output_path_segment)
+
+        if dataset_format == DataProcessor.DatasetFormat.CSV:
+            if self.get_csv_compression(output_path_segment) is not None:
+                self.write_dataset(dataframe.to_pandas(), output_path_segment)
+            else:
+                dataframe.write_csv(
+                    output_path_segment,
+                    separator=self.output_separator)
+        elif dataset_format == DataProcessor.DatasetFormat.Excel:
+            self.write_dataset(dataframe.to_pandas(), output_path_segment)
+        elif dataset_format == DataProcessor.DatasetFormat.Parquet:
+            dataframe.write_parquet(
+                output_path_segment,
+                compression=self.output_compression or "snappy")
+        else:
+            import polars as pl
+            import pyarrow as pa
+            import pyarrow.feather as feather
+
+            table = dataframe.to_arrow(compat_level=pl.CompatLevel.oldest())
+            table = table.cast(pa.schema([
+                field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+                if pa.types.is_dictionary(field.type) else field
+                for field in table.schema
+            ]))
+            feather.write_feather(
+                table,
+                output_path_segment,
+                compression=self.get_arrow_compression())
+
+    def get_arrow_compression(self) -> str:
+        """
+        Get the compression codec of Feather and Arrow IPC output datasets:
+        `output_compression`, or none if `memory_map` is True, so the datasets
+        can be mapped without copying them.
+
+        :return: compression codec, or None to use the default one.
+        :rtype: str
+        """
+
+        if not self.memory_map:
+            return self.output_compression
+
+        if self.output_compression not in [None, "uncompressed"]:
+            log.warning("- compressed datasets are copied when they are memory mapped")
+            return self.output_compression
+
+        return "uncompressed"
+
+    def save_chunks(self, output_path_segment: str) -> int:
+        """
+        Transform each chunk in `input_chunks` with `process_chunk()` and append
+        the result to the dataset in the path provided. CSV headers are written
+        only once, and columnar formats keep the schema of the first chunk.
+        CSV chunks whose columns differ from those of the first one raise a
+        ValueError.
+
+        :param output_path_segment: path where the dataset should be written.
+        :return: number of rows written.
+        :rtype: int
+        """
+
+        log.info("Save output dataset in chunks")
+        log.debug(f"DataProcessor.save_chunks("
+                  f"output_path_segment={output_path_segment})")
+
+        if self.save_report_on_save:
+            log.warning("- reports on save are not available in streaming mode")
+
+        dataset_format = self.get_dataset_format(output_path_segment)
+        if dataset_format == DataProcessor.DatasetFormat.Excel:
+            log.error("- Excel datasets cannot be written in chunks")
+            raise NotImplementedError
+
+        chunks = 0
+        rows = 0
+        writer = None
+        if dataset_format == DataProcessor.DatasetFormat.CSV:
+            writer = self.get_csv_writer(output_path_segment)
+        tic = time.perf_counter()
+        try:
+            for chunk in self.input_chunks:
+                output_chunk = self.process_chunk(chunk)
+                if dataset_format == DataProcessor.DatasetFormat.CSV:
+                    writer.write(output_chunk)
+                else:
+                    writer = self.__write_arrow_chunk(
+                        output_chunk,
+                        output_path_segment,
+                        dataset_format,
+                        writer)
+                chunks += 1
+                rows += len(output_chunk.index)
+        finally:
+            if writer is not None:
+                writer.close()
+        toc = time.perf_counter()
+
+        log.debug(f"- chunks: {chunks}")
+        log.debug(f"- rows: {rows}")
+
+        if dataset_format == DataProcessor.DatasetFormat.CSV:
+            self.record_save_metrics(writer, toc - tic)
+
+        return rows
+
+    def get_csv_writer(self, output_path_segment: str) -> CSVWriter:
+        """
+        Get a writer for the CSV dataset in the path provided, compressed with
+        the codec selected by its extension or, if it has none, by
+        `output_compression`.
+
+        :param output_path_segment: path where the dataset should be written.
+        :return: writer of the dataset.
+        :rtype: CSVWriter
+        """
+
+        return CSVWriter(
+            output_path_segment,
+            separator=self.output_separator,
+            compression=self.get_csv_compression(output_path_segment),
+            max_workers=self.max_workers)
+
+    def get_csv_compression(self, output_path_segment: str) -> str:
+        """
+        Get the compression codec of the CSV dataset in the path provided,
+        selected by its extension or, if it has none, by `output_compression`.
+
+        :param output_path_segment: path where the dataset should be written.
+        :return: compression codec, or None if the dataset is not compressed.
+        :rtype: str
+        """
+
+        compression = None
+        if self.output_compression in CSVWriter.COMPRESSIONS.values():
+            compression = self.output_compression
+
+        return CSVWriter.get_compression(output_path_segment, compression)
+
+    def record_save_metrics(self, csv_writer: CSVWriter, seconds: float):
+        """
+        Store the size, compression ratio and throughput of the CSV dataset
+        written in `metrics["save"]`.
+
+        :param csv_writer: writer used to write the dataset, already closed.
+        :param seconds: time spent writing the dataset.
+        """
+
+        compression_ratio = None
+        if csv_writer.compressed_bytes > 0:
+            compression_ratio = csv_writer.uncompressed_bytes / csv_writer.compressed_bytes
+        throughput = None
+        if seconds > 0:
+            throughput = csv_writer.uncompressed_bytes / seconds
+
+        self.metrics.setdefault("save", {}).update({
+            "compression": csv_writer.compression,
+            "rows": csv_writer.rows,
+            "uncompressed_bytes": csv_writer.uncompressed_bytes,
+            "compressed_bytes": csv_writer.compressed_bytes,
+            "compression_ratio": compression_ratio,
+            "seconds": seconds,
+            "throughput": throughput
+        })
+
+        log.debug(f"- compression: {csv_writer.compression}")
+        if compression_ratio is not None:
+            log.debug(f"- compression ratio: {compression_ratio:0.2f}")
+        if throughput is not None:
+            log.debug(f"- throughput: {throughput / 2 ** 20:0.1f} MiB/s")
+
+    def __write_arrow_chunk(
+            self,
+            chunk: pd.DataFrame,
+            output_path_segment: str,
+            dataset_format: DatasetFormat,
+            writer):
+        """
+        Append a chunk to a Parquet or Arrow IPC dataset, opening the writer
+        with the schema of the chunk if it is not open yet.
+
+        :param chunk: chunk to write.
+        :param output_path_segment: path where the dataset should be written.
+        :param dataset_format: format of the output dataset.
+        :param writer: writer returned for the previous chunk, or None.
+        :return: writer used, to pass with the next chunk.
+        """
+
+        import pyarrow as pa
+
+        if writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if dataset_format == DataProcessor.DatasetFormat.Parquet:
+                import pyarrow.parquet as pq
+
+                writer = pq.ParquetWriter(
+                    output_path_segment,
+                    table.schema,
+                    compression=self.output_compression or "snappy")
+            else:
+                writer = pa.ipc.new_file(
+                    output_path_segment,
+                    table.schema,
+                    options=pa.ipc.IpcWriteOptions(
+                        compression=self.output_compression))
+        else:
+            table = pa.Table.from_pandas(
+                chunk,
+                schema=writer.schema,
+                preserve_index=False)
+
+        writer.write_table(table)
+
+        return writer
+
+    @staticmethod
+    def get_temporary_path_segment(path_segment: str) -> str:
+        """
+        Get a new, unique, temporary path in the same folder as the path
+        provided, keeping its extensions, so the format is the same.
+
+        :param path_segment: path to the final file.
+        :return: path to the temporary file.
+        :rtype: str
+        """
+
+        path = Path(path_segment)
+        temporary_path = path.with_name(f".{uuid.uuid4().hex}-{path.name}")
+
+        return str(temporary_path)
+
+    @staticmethod
+    def replace_file(source_path_segment: str, destination_path_segment: str):
+        """
+        Flush the source file to disk and atomically rename it to the
+        destination path, replacing the file there, if any. The folder is
+        flushed as well, where supported, so the rename survives a crash.
+
+        :param source_path_segment: path to the complete file.
+        :param destination_path_segment: path the file should be moved to.
+        """
+
+        log.debug(f"DataProcessor.replace_file("
+                  f"source_path_segment={source_path_segment}, "
+                  f"destination_path_segment={destination_path_segment})")
+
+        with open(source_path_segment, "rb+") as file:
+            os.fsync(file.fileno())
+        os.replace(source_path_segment, destination_path_segment)
+
+        try:
+            folder_descriptor = os.open(Path(destination_path_segment).parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(folder_descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(folder_descriptor)
+
+    @staticmethod
+    def get_metadata_path_segment(dataset_path_segment: str) -> str:
+        """
+        Get the path where the metadata of the dataset provided is stored, next
+        to it, with its full file name followed by ".meta.json".
+
+        :param dataset_path_segment: path to the dataset.
+        :return: path to the metadata of the dataset.
+        :rtype: str
+        """
+
+        dataset_path = Path(dataset_path_segment)
+        metadata_path = dataset_path.with_name(
+            f"{dataset_path.name}{DataProcessor.METADATA_SUFFIX}")
+
+        return str(metadata_path)
+
+    def save_metadata(self, dataset_path_segment: str, rows: int):
+        """
+        Save the number of rows, the size and the checksum of the dataset
+        provided next to it.
+
+        :param dataset_path_segment: path to the dataset.
+        :param rows: number of rows of the dataset.
+        """
+
+        log.info("Save output dataset metadata")
+        log.debug(f"DataProcessor.save_metadata("
+                  f"dataset_path_segment={dataset_path_segment}, "
+                  f"rows={rows})")
+
+        metadata = {
+            "rows": rows,
+            "bytes": Path(dataset_path_segment).stat().st_size,
+            "sha256": ParseCache.hash_file(dataset_path_segment)
+        }
+
+        metadata_path_segment = self.get_metadata_path_segment(dataset_path_segment)
+        temporary_path_segment = self.get_temporary_path_segment(metadata_path_segment)
+        with open(temporary_path_segment, "w") as file:
+            json.dump(metadata, file, indent=2)
+        DataProcessor.replace_file(temporary_path_segment, metadata_path_segment)
+
+    def verify_dataset(self, dataset_path_segment: str) -> dict:
+        """
+        Check the size and the checksum of the dataset provided against its
+        metadata, if any. The number of rows is left to the caller, once the
+        dataset is read.
+
+        :param dataset_path_segment: path to the dataset.
+        :return: metadata of the dataset, or None if it has none.
+        :rtype: dict
+        """
+
+        log.info("Verify input dataset")
+        log.debug(f"DataProcessor.verify_dataset("
+                  f"dataset_path_segment={dataset_path_segment})")
+
+        metadata_path = Path(self.get_metadata_path_segment(dataset_path_segment))
+        if not metadata_path.is_file():
+            log.debug("- dataset has no metadata, nothing to verify")
+            return None
+
+        with open(metadata_path, "r") as file:
+            metadata = json.load(file)
+
+        if Path(dataset_path_segment).stat().st_size != metadata["bytes"] or \
+                ParseCache.hash_file(dataset_path_segment) != metadata["sha256"]:
+            log.error(f"- {dataset_path_segment} checksum does not match its metadata")
+            raise RuntimeError(f"dataset does not match its metadata: {dataset_path_segment}")
+
+        return metadata
+
+    def process(self):
+        """
+        Make all the changes needed in the input dataframe to get the output
+        dataframe.
+
+        Make sure to use `input_df` as the input of your pipeline, and to store
+        the resulting dataset in `output_df`.
+
+        In streaming mode, there is nothing to do here: provide your own
+        version of `process_chunk()` instead. In partitioned mode, the input
+        dataframe is processed by `process_chunk()` as well, one partition per
+        process.
+        """
+
+        log.info("Process dataset")
+        log.debug("DataProcessor.process()")
+
+        if self.chunk_size is not None:
+            log.debug("- streaming mode, chunks will be processed on save")
+            return
+        if self.is_partitioned():
+            self.output_df = self.process_partitioned(self.input_df)
+            return
+
+        self.output_df = self.input_df
+
+        raise NotImplementedError
+
+    def process_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Make all the changes needed in a chunk of the input dataset to get the
+        corresponding chunk of the output dataset. Only used in streaming and
+        partitioned modes.
+
+        Make sure the changes only depend on the rows in the chunk, or, in
+        partitioned mode with `partition_column`, on the groups in the chunk.
+
+        :param chunk: chunk of the input dataset.
+        :return: chunk of the output dataset.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug("DataProcessor.process_chunk()")
+
+        raise NotImplementedError
+
+    def is_partitioned(self) -> bool:
+        """
+        Check if the input dataset should be processed in partitions.
+        Partitioned mode is not available with the Polars backend, whose
+        queries already run in several threads.
+
+        :return: True if `partition_rows` or `partition_column` are present.
+        :rtype: bool
+        """
+
+        partitioned = self.partition_rows is not None or self.partition_column is not None
+        if partitioned and self.dataframe_backend == DataProcessor.DataFrameBackend.Polars:
+            log.error("- partitioned mode is not available with the polars backend")
+            raise NotImplementedError
+
+        return partitioned
+
+    def get_partitions(self, dataframe: pd.DataFrame) -> List[pd.DataFrame]:
+        """
+        Split the dataframe provided in partitions of up to `partition_rows`
+        rows, or of as many rows as needed to have one partition per worker.
+
+        With `partition_column`, the groups of rows sharing a value of that
+        column are kept together, in the order of their first appearance, and
+        packed in partitions of about `partition_rows` rows: each group goes to
+        the partition where its first row would fall if groups were contiguous.
+        The rows of each partition keep their original order.
+
+        :param dataframe: dataframe to split.
+        :return: list of partitions, in order.
+        :rtype: List[pd.DataFrame]
+        """
+
+        log.debug(f"DataProcessor.get_partitions("
+                  f"dataframe={len(dataframe.index)} rows)")
+
+        rows = len(dataframe.index)
+        workers = self.max_workers or os.cpu_count() or 1
+        partition_rows = self.partition_rows or max(1, math.ceil(rows / workers))
+
+        if self.partition_column is None:
+            partitions = [
+                dataframe.iloc[start:start + partition_rows]
+                for start in range(0, rows, partition_rows)
+            ]
+        else:
+            codes, _ = pd.factorize(dataframe[self.partition_column], use_na_sentinel=False)
+            group_rows = np.bincount(codes)
+            group_partitions = (np.cumsum(group_rows) - group_rows) // partition_rows
+            row_partitions = group_partitions[codes]
+            order = np.argsort(row_partitions, kind="stable")
+            _, partition_sizes = np.unique(row_partitions, return_counts=True)
+            ends = np.cumsum(partition_sizes)
+            partitions = [
+                dataframe.iloc[order[end - size:end]]
+                for end, size in zip(ends, partition_sizes)
+            ]
+
+        log.debug(f"- partitions: {len(partitions)}")
+
+        return partitions
+
+    def process_partitioned(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Process the dataframe provided with `process_chunk()`, one partition at
+        a time, in up to `max_workers` processes, and concatenate the results
+        in the order of the partitions.
+
+        With `partition_column`, partitions are not contiguous, so the rows of
+        the result are put back in the order of the input, as long as
+        `process_chunk()` keeps the index labels of the rows, and they are
+        unique. Otherwise, they are left in the order of the partitions.
+
+        Each worker gets a copy of this data processor, without its datasets.
+        Partitions, and their results, are sent in Arrow IPC format instead of
+        pickled, whenever their types allow it.
+
+        :param dataframe: dataframe to process.
+        :return: processed dataframe.
+        :rtype: pd.DataFrame
+        """
+
+        log.info("Process dataset in partitions")
+        log.debug(f"DataProcessor.process_partitioned("
+                  f"dataframe={len(dataframe.index)} rows)")
+
+        partitions = self.get_partitions(dataframe)
+        if not partitions:
+            return self.process_chunk(dataframe)
+
+        state = {
+            attribute: value
+            for attribute, value in vars(self).items()
+            if attribute not in DataProcessor.FINGERPRINT_EXCLUDED_ATTRIBUTES
+        }
+        max_workers = min(len(partitions), self.max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                DataProcessor.process_partition,
+                itertools.repeat(type(self)),
+                itertools.repeat(state),
+                [DataProcessor.serialize_dataframe(partition) for partition in partitions]))
+
+        output_df = pd.concat(
+            [DataProcessor.deserialize_dataframe(result) for result in results])
+        if self.partition_column is not None:
+            output_df = self.restore_order(output_df, dataframe.index)
+
+        return output_df
 
-    description: str = "DataProcessor"
-    changes = {}
-    input_path_segment: str = None
-    output_path_segment: str = None
-    input_separator: str = ","
-    output_separator: str = ","
-    save_report_on_load: bool = False
-    save_report_on_save: bool = False
-    report_type: ReportType = None
-    report_path_segment: str = None
-    input_type_excel: bool = False
+    @staticmethod
+    def restore_order(dataframe: pd.DataFrame, index: pd.Index) -> pd.DataFrame:
+        """
+        Sort the rows of the dataframe provided in the order of their labels in
+        the index provided.
+
+        :param dataframe: dataframe to sort.
+        :param index: index with the original order of the rows.
+        :return: sorted dataframe, or the same dataframe if its labels, or
+        those of the index, are not unique, or not all of them are in the
+        index.
+        :rtype: pd.DataFrame
+        """
 
-    input_df: pd.DataFrame = None
-    output_df: pd.DataFrame = None
+        if not index.is_unique or not dataframe.index.is_unique:
+            log.warning("- rows are not labelled uniquely, they are left in the order of the partitions")
+            return dataframe
 
-    def __init__(
-            self,
-            input_path_segment: str = None,
-            output_path_segment: str = None,
-            input_separator: str = None,
-            output_separator: str = None,
-            save_report_on_load: bool = None,
-            save_report_on_save: bool = None,
-            report_type: ReportType = None,
-            report_path_segment: str = None,
-            input_type_excel: bool = None
-    ):
+        positions = index.get_indexer(dataframe.index)
+        if (positions < 0).any():
+            log.warning("- rows are not labelled as in the input, they are left in the order of the partitions")
+            return dataframe
+
+        return dataframe.iloc[np.argsort(positions, kind="stable")]
+
+    @staticmethod
+    def process_partition(processor_class: type, state: dict, partition):
         """
-        Init DataProcessor class instance.
+        Process a partition with `process_chunk()` in a worker process. The
+        data processor is rebuilt from its class and state, without calling
+        its constructor.
+
+        :param processor_class: class of the data processor.
+        :param state: attributes of the data processor.
+        :param partition: serialized partition.
+        :return: serialized result.
+        """
+
+        data_processor = processor_class.__new__(processor_class)
+        vars(data_processor).update(state)
+        result = data_processor.process_chunk(DataProcessor.deserialize_dataframe(partition))
+
+        return DataProcessor.serialize_dataframe(result)
+
+    @staticmethod
+    def serialize_dataframe(dataframe: pd.DataFrame):
+        """
+        Serialize the dataframe provided in Arrow IPC format, index included,
+        to send it to another process. Dataframes Arrow does not support are
+        returned as they are, to be pickled.
+
+        :param dataframe: dataframe to serialize.
+        :return: Arrow IPC bytes, or the dataframe itself.
+        """
+
+        import pyarrow as pa
+
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return dataframe
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
 
-        :param input_path_segment: path to the input CSV dataset to process.
+        return sink.getvalue().to_pybytes()
+
+    @staticmethod
+    def deserialize_dataframe(data) -> pd.DataFrame:
+        """
+        Deserialize a dataframe serialized with `serialize_dataframe()`.
+
+        :param data: Arrow IPC bytes, or a dataframe.
+        :return: dataframe.
+        :rtype: pd.DataFrame
+        """
+
+        if isinstance(data, pd.DataFrame):
+            return data
+
+        import pyarrow as pa
+
+        return pa.ipc.open_stream(data).read_all().to_pandas()
+
+    def apply(
+            self,
+            data: Union[pd.Series, pd.DataFrame],
+            function: Callable,
+            name: str = None,
+            backend: ApplyBackend = None,
+            chunk_rows: int = None,
+            vectorized: bool = False
+    ) -> pd.Series:
+        """
+        Apply the function provided to each value of a series, or to each row
+        of a dataframe.
+
+        If `vectorized` is True, the function is called once with the whole
+        series or dataframe, which is much faster, so it must return the same
+        values it would return for each value, or row. Only do so for functions
+        using arithmetic, comparisons or pandas methods, not `if`, `str()`,
+        `len()` or side effects. Otherwise, or if the vectorized call fails,
+        the function is applied value by value, or row by row, in chunks of
+        `chunk_rows`, with the backend provided, or `apply_backend`. Functions
+        that cannot be sent to other processes are run in threads.
+
+        The path taken, the rows and the time spent are appended to
+        `metrics["apply"]`.
+
+        :param data: series, or dataframe, to apply the function to.
+        :param function: function taking a value, or a row.
+        :param name: name of the operation in the metrics. Defaults to the name
+        of the function. Optional.
+        :param backend: backend used if the function cannot be vectorized.
         Optional.
-        :param output_path_segment: path where the input CSV dataset, after
-        being processed, should be stored. Optional.
-        :param input_separator: separator used in the input dataset. Optional.
-        :param output_separator: separator used in the output dataset. Optional.
-        :param save_report_on_load: save input dataset report if True.
-        :param save_report_on_save: save output dataset report if True.
-        :param report_type: control the type of the report saved if
-        save_report_on_load or save_report_on_save are True.
-        :param report_path_segment: where to save the reports. If not presents,
-        they will be stored in the dataset's folder.
-        :param input_type_excel: load with configuration of excel if True. Optional.
+        :param chunk_rows: number of rows per chunk if the function cannot be
+        vectorized. Defaults to one chunk per worker. Optional.
+        :param vectorized: call the function with the whole series, or
+        dataframe, if True. Optional.
+        :return: result of the function for each value, or row.
+        :rtype: pd.Series
         """
 
-        log.info("Init data processor")
-        log.debug(f"DataProcessor.__init__("
-                  f"input_path_segment={input_path_segment}, "
-                  f"output_path_segment={output_path_segment}, "
-                  f"input_separator={input_separator}, "
-                  f"output_separator={output_separator}, "
-                  f"save_report_on_load={save_report_on_load}, "
-                  f"save_report_on_save={save_report_on_save}, "
-                  f"report_type={report_type}, "
-                  f"report_path_segment={report_path_segment}, "
-                  f"input_type_excel={input_type_excel})")
+        if name is None:
+            name = getattr(function, "__name__", str(function))
+        if backend is None:
+            backend = self.apply_backend
+
+        log.info("Apply function")
+        log.debug(f"DataProcessor.apply("
+                  f"data={len(data.index)} rows, "
+                  f"name={name}, "
+                  f"backend={backend}, "
+                  f"chunk_rows={chunk_rows}, "
+                  f"vectorized={vectorized})")
+
+        tic = time.perf_counter()
+        result = None
+        if vectorized:
+            result = DataProcessor.apply_vectorized(data, function)
+            if result is None:
+                log.warning(f"- {name} cannot be vectorized, applying it value by value")
+        if result is not None:
+            path = "vectorized"
+        else:
+            path = self.__get_apply_path(function, backend)
+            result = self.__apply_chunks(data, function, path, chunk_rows)
+        toc = time.perf_counter()
 
-        if input_path_segment is not None:
-            self.input_path_segment = input_path_segment
+        log.debug(f"- path: {path}")
+        self.metrics.setdefault("apply", []).append({
+            "name": name,
+            "path": path,
+            "rows": len(data.index),
+            "seconds": toc - tic
+        })
 
-        if output_path_segment is not None:
-            self.output_path_segment = output_path_segment
+        return result
 
-        if input_separator is not None:
-            self.input_separator = input_separator
+    @staticmethod
+    def apply_vectorized(data: Union[pd.Series, pd.DataFrame], function: Callable) -> pd.Series:
+        """
+        Call the function provided with the whole series, or dataframe. The
+        result must be a series with the same index as the data.
+
+        :param data: series, or dataframe, to apply the function to.
+        :param function: function taking a value, or a row, that also works
+        with whole columns.
+        :return: result of the function for each value, or row, or None if the
+        function cannot be vectorized.
+        :rtype: pd.Series
+        """
 
-        if output_separator is not None:
-            self.output_separator = output_separator
+        try:
+            result = function(data)
+        except Exception as error:
+            log.debug(f"- function cannot be vectorized: {error}")
+            return None
 
-        if save_report_on_load is not None:
-            self.save_report_on_load = save_report_on_load
+        if not isinstance(result, pd.Series) or not result.index.equals(data.index):
+            log.debug("- vectorized result does not match the data")
+            return None
 
-        if save_report_on_save is not None:
-            self.save_report_on_save = save_report_on_save
+        return result
 
-        if report_type is not None:
-            self.report_type = report_type
+    @staticmethod
+    def apply_chunk(chunk: Union[pd.Series, pd.DataFrame], function: Callable) -> pd.Series:
+        """
+        Apply the function provided to each value, or row, of the chunk
+        provided.
 
-        if report_path_segment is not None:
-            self.report_path_segment = report_path_segment
+        :param chunk: series, or dataframe, to apply the function to.
+        :param function: function taking a value, or a row.
+        :return: result of the function for each value, or row.
+        :rtype: pd.Series
+        """
 
-        if input_type_excel is not None:
-            self.input_type_excel = input_type_excel
+        if isinstance(chunk, pd.DataFrame):
+            return chunk.apply(function, axis="columns")
 
-    def load(self):
+        return chunk.apply(function)
+
+    def __get_apply_path(self, function: Callable, backend: ApplyBackend) -> str:
         """
-        Load the CSV or Excel dataset in the input path provided. Optionally, save a
-        report in the same path, with the same name, but with HTML extension.
+        Get the path used to apply a function that cannot be vectorized: the
+        backend provided, unless processes are requested but the function
+        cannot be sent to them.
+
+        :param function: function to apply.
+        :param backend: backend requested.
+        :return: name of the path taken.
+        :rtype: str
         """
 
-        log.info("Load input dataset")
-        log.debug("DataProcessor.load()")
+        if backend == DataProcessor.ApplyBackend.Processes:
+            try:
+                pickle.dumps(function)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                log.warning("- function cannot be sent to other processes, using threads")
+                return DataProcessor.ApplyBackend.Threads.value
 
-        if self.input_path_segment is None:
-            log.debug("- input path is none, nothing to load or report about")
-            return
-        if not self.input_type_excel:
-            self.input_df = pd.read_csv(
-                self.input_path_segment,
-                sep=self.input_separator)
+        return backend.value
+
+    def __apply_chunks(
+            self,
+            data: Union[pd.Series, pd.DataFrame],
+            function: Callable,
+            path: str,
+            chunk_rows: int
+    ) -> pd.Series:
+        """
+        Apply the function provided to each value, or row, of the data
+        provided, in chunks, with the path provided.
+
+        :param data: series, or dataframe, to apply the function to.
+        :param function: function taking a value, or a row.
+        :param path: "serial", "threads" or "processes".
+        :param chunk_rows: number of rows per chunk, or None.
+        :return: result of the function for each value, or row.
+        :rtype: pd.Series
+        """
+
+        if path == DataProcessor.ApplyBackend.Serial.value or len(data.index) == 0:
+            return DataProcessor.apply_chunk(data, function)
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+        chunk_rows = chunk_rows or max(1, math.ceil(len(data.index) / max_workers))
+        chunks = [
+            data.iloc[start:start + chunk_rows]
+            for start in range(0, len(data.index), chunk_rows)
+        ]
+
+        if path == DataProcessor.ApplyBackend.Threads.value:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
         else:
-            self.input_df = pd.concat(pd.read_excel(
-                self.input_path_segment,
-                header=0,
-                sheet_name=None
-            ), ignore_index=True)
+            executor = ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)))
+        with executor:
+            results = list(executor.map(
+                DataProcessor.apply_chunk,
+                chunks,
+                itertools.repeat(function)))
 
-        if self.save_report_on_load:
-            self.save_report(self.input_df, self.input_path_segment)
+        return pd.concat(results)
 
-    def save(self):
+    def column_operations(self, dataframe=None) -> ColumnOperations:
         """
-        Save the CSV dataset in the output path provided. Save a report in the
-        same path, with the same name, but with the corresponding extension.
+        Start a batch of column operations (drop, rename, cast and derive) on
+        the dataframe provided, or on `input_df`. The operations are run, and
+        recorded in `changes`, when the batch is executed:
+
+            self.output_df = (
+                self.column_operations()
+                .drop(["Cabin"])
+                .rename({"Fare": "Price"})
+                .cast({"Pclass": "int8"})
+                .derive("Family", lambda columns: columns["SibSp"] + columns["Parch"])
+                .execute())
+
+        Prefer it to chaining dataframe methods, as the dataframe is built only
+        once, and the columns left untouched are not copied.
+
+        :param dataframe: dataframe the operations are made on. Optional.
+        :return: empty batch of column operations.
+        :rtype: ColumnOperations
         """
 
-        log.info("Save output dataset")
-        log.debug("DataProcessor.save()")
+        log.debug("DataProcessor.column_operations()")
+
+        if dataframe is None:
+            dataframe = self.input_df
+
+        return ColumnOperations(dataframe, changes=self.changes)
+
+    def get_duplicate_filter(self) -> DuplicateFilter:
+        """
+        Get a new filter of duplicated rows, comparing them by
+        `duplicate_columns`, and counting the rows dropped in `changes`.
+        Duplicates are not filtered with the Polars backend, which drops them
+        in its own queries with `unique()`.
+
+        :return: empty filter of duplicated rows.
+        :rtype: DuplicateFilter
+        """
+
+        log.debug("DataProcessor.get_duplicate_filter()")
+
+        if self.dataframe_backend == DataProcessor.DataFrameBackend.Polars:
+            log.error("- duplicate filter is not available with the polars backend")
+            raise NotImplementedError
+
+        return DuplicateFilter(columns=self.duplicate_columns, changes=self.changes)
+
+    def drop_duplicate_datasets(self, dataframes: List[pd.DataFrame], input_path_segments: List) -> List[pd.DataFrame]:
+        """
+        Drop the duplicated rows of the dataframes provided, across all of
+        them, keeping the first occurrence, without stacking them. The rows
+        dropped from each dataset are counted in `changes`.
+
+        :param dataframes: list of dataframes to filter.
+        :param input_path_segments: list of paths to their datasets.
+        :return: list of dataframes without the duplicated rows.
+        :rtype: List[pd.DataFrame]
+        """
+
+        log.info("Drop duplicated rows")
+        log.debug("DataProcessor.drop_duplicate_datasets()")
+
+        duplicate_filter = self.get_duplicate_filter()
+
+        return [
+            duplicate_filter.filter(dataframe, input_path_segment)
+            for dataframe, input_path_segment in zip(dataframes, input_path_segments)
+        ]
+
+    def get_input_path_segments(self) -> List:
+        """
+        Get the list of paths to the input datasets.
+
+        :return: list of paths to the input datasets.
+        :rtype: List
+        """
+
+        if self.input_path_segment is None:
+            return []
+
+        return [self.input_path_segment]
+
+    def get_fingerprint(self) -> dict:
+        """
+        Get a fingerprint of everything the output of the execution depends on:
+        the identity of the input datasets (path, size and modification time),
+        the parameters of the instance (see `get_fingerprint_parameters()`),
+        and the source code of the methods in `FINGERPRINT_METHODS`.
+
+        :return: fingerprint of the execution.
+        :rtype: dict
+        """
+
+        log.info("Get execution fingerprint")
+        log.debug("DataProcessor.get_fingerprint()")
+
+        inputs = []
+        for input_path_segment in self.get_input_path_segments():
+            input_stat = Path(input_path_segment).stat()
+            inputs.append({
+                "path": str(Path(input_path_segment).resolve()),
+                "size": input_stat.st_size,
+                "mtime": input_stat.st_mtime_ns
+            })
+
+        serialized_parameters = json.dumps(
+            self.get_fingerprint_parameters(),
+            sort_keys=True,
+            default=DataProcessor.__serialize_parameter)
+
+        code_hash = hashlib.sha256()
+        for name in self.FINGERPRINT_METHODS:
+            method = getattr(type(self), name)
+            try:
+                code_hash.update(inspect.getsource(method).encode())
+            except (OSError, TypeError):
+                code_hash.update(method.__qualname__.encode())
+
+        return {
+            "inputs": inputs,
+            "parameters": hashlib.sha256(serialized_parameters.encode()).hexdigest(),
+            "code": code_hash.hexdigest()
+        }
+
+    def get_fingerprint_parameters(self) -> dict:
+        """
+        Get the parameters the output of the execution depends on: the
+        attributes named after the arguments of the constructors of the class
+        and its parents, whether they were passed, parsed from the command
+        line or overridden in the class body, such as `schema`. Attributes set
+        while executing, such as the datasets, the changes or a model, are not
+        parameters.
+
+        :return: dictionary with the current value of each parameter.
+        :rtype: dict
+        """
+
+        names = set()
+        for cls in type(self).__mro__:
+            if "__init__" in vars(cls):
+                try:
+                    names.update(inspect.signature(vars(cls)["__init__"]).parameters)
+                except (TypeError, ValueError):
+                    pass
+        names.discard("self")
+
+        parameters = {}
+        for name in sorted(names):
+            if name.startswith("_") or name.isupper() or name in DataProcessor.FINGERPRINT_EXCLUDED_ATTRIBUTES:
+                continue
+            if not hasattr(self, name):
+                continue
+            value = getattr(self, name)
+            if callable(value):
+                continue
+            parameters[name] = value
+
+        return parameters
+
+    @staticmethod
+    def __serialize_parameter(value):
+        """
+        Convert parameters JSON cannot serialize into something it can.
+        """
+
+        if isinstance(value, Enum):
+            return value.value
+        if hasattr(value, "__dict__"):
+            return vars(value)
+
+        return str(value)
+
+    def get_fingerprint_path_segment(self) -> str:
+        """
+        Get the path where the fingerprint of the last execution is stored:
+        next to the output dataset, with its full file name followed by
+        ".fingerprint.json".
+
+        :return: path to the fingerprint, or None if there is no output path.
+        :rtype: str
+        """
 
         if self.output_path_segment is None:
-            log.debug("- output path is none, nothing to save or report about")
-            return
+            return None
 
         output_path = Path(self.output_path_segment)
-        output_path_parent = output_path.parent
-        if not output_path_parent.exists():
-            output_path_parent.mkdir(parents=True)
+        fingerprint_path = output_path.with_name(
+            f"{output_path.name}{DataProcessor.FINGERPRINT_SUFFIX}")
 
-        self.output_df.to_csv(
-            self.output_path_segment,
-            sep=self.output_separator,
-            index=False)
+        return str(fingerprint_path)
 
-        if self.save_report_on_save:
-            self.save_report(self.output_df, self.output_path_segment)
+    def is_up_to_date(self) -> bool:
+        """
+        Check if the output of the last execution is still valid: the output
+        dataset exists and the fingerprint of the last execution matches the
+        current one. The current fingerprint is kept in `fingerprint`, so
+        `save_fingerprint()` saves it as it was before executing.
 
-    def process(self):
+        :return: True if the execution can be skipped, False otherwise.
+        :rtype: bool
         """
-        Make all the changes needed in the input dataframe to get the output
-        dataframe.
 
-        Make sure to use `input_df` as the input of your pipeline, and to store
-        the resulting dataset in `output_df`.
+        log.info("Check if output is up to date")
+        log.debug("DataProcessor.is_up_to_date()")
+
+        self.fingerprint = self.get_fingerprint()
+        fingerprint_path_segment = self.get_fingerprint_path_segment()
+        if fingerprint_path_segment is None:
+            log.debug("- output path is none, nothing to compare with")
+            return False
+        if not Path(self.output_path_segment).exists() or not Path(fingerprint_path_segment).is_file():
+            log.debug("- no previous output")
+            return False
+
+        with open(fingerprint_path_segment, "r") as file:
+            last_fingerprint = json.load(file)
+        up_to_date = last_fingerprint == self.fingerprint
+        log.debug(f"- up to date: {up_to_date}")
+
+        return up_to_date
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[dict]:
+        """
+        Measure the phase provided, such as "load", "process" or "save", and
+        store the results in `metrics[phase]`:
+        - wall and CPU time, in seconds.
+        - peak resident memory of the process so far, in bytes.
+        - rows and columns of the input and output datasets, if loaded.
+        - bytes read from the input datasets, on "load", or written to the
+        output dataset, on "save".
+
+        The record is yielded, so the phase can add its own values.
+
+        If `profile_path_segment` is present, the phase is also profiled, and
+        its profiles are saved there (see `get_profile_path_prefix()`). Outer
+        phases are paused while nested ones are profiled.
+
+        :param phase: name of the phase.
+        :return: record of the phase.
+        :rtype: Iterator[dict]
         """
 
-        log.info("Process dataset")
-        log.debug("DataProcessor.process()")
+        log.debug(f"DataProcessor.measure("
+                  f"phase={phase})")
+
+        record = self.metrics.setdefault(phase, {})
+        profiler = None
+        if self.profile_path_segment is not None:
+            profiler = self.start_profiler(phase)
+        wall_tic = time.perf_counter()
+        cpu_tic = time.process_time()
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                self.stop_profiler(profiler)
+            record["wall_seconds"] = time.perf_counter() - wall_tic
+            record["cpu_seconds"] = time.process_time() - cpu_tic
+            record["peak_rss_bytes"] = DataProcessor.get_peak_rss()
+            record.update(self.get_shape_metrics())
+            if phase == "load":
+                record["bytes_read"] = sum(
+                    Path(path_segment).stat().st_size
+                    for path_segment in self.get_input_path_segments()
+                    if Path(path_segment).is_file())
+            elif phase == "save" and self.output_path_segment is not None and \
+                    Path(self.output_path_segment).is_file():
+                record["bytes_written"] = Path(self.output_path_segment).stat().st_size
+            log.debug(f"- {phase}: {record['wall_seconds']:0.3f} s wall, "
+                      f"{record['cpu_seconds']:0.3f} s CPU")
+
+    def get_profile_path_prefix(self, phase: str) -> str:
+        """
+        Get the path of the profiles of the phase provided, without extension:
+        in `profile_path_segment`, named after the output dataset, or the
+        stage if there is none, and the phase.
 
-        self.output_df = self.input_df
+        :param phase: name of the phase.
+        :return: path of the profiles, without extension.
+        :rtype: str
+        """
 
-        raise NotImplementedError
+        if self.output_path_segment is not None:
+            name = Path(self.output_path_segment).stem
+        else:
+            name = self.description.lower().replace(" ", "_")
+
+        return str(Path(self.profile_path_segment) / f"{name}.{phase}")
+
+    def start_profiler(self, phase: str) -> PhaseProfiler:
+        """
+        Start profiling the phase provided, pausing the profiler of the phase
+        it is nested in, if any.
+
+        :param phase: name of the phase.
+        :return: profiler of the phase.
+        :rtype: PhaseProfiler
+        """
+
+        log.debug(f"DataProcessor.start_profiler("
+                  f"phase={phase})")
+
+        Path(self.profile_path_segment).mkdir(parents=True, exist_ok=True)
+        if self.active_profilers:
+            self.active_profilers[-1].pause()
+        profiler = PhaseProfiler(self.get_profile_path_prefix(phase))
+        self.active_profilers.append(profiler)
+        profiler.start()
+
+        return profiler
+
+    def stop_profiler(self, profiler: PhaseProfiler):
+        """
+        Stop the profiler provided, save its profiles, and resume the profiler
+        of the phase it was nested in, if any.
+
+        :param profiler: profiler to stop.
+        """
+
+        log.debug("DataProcessor.stop_profiler()")
+
+        profiler.stop()
+        self.active_profilers.remove(profiler)
+        if self.active_profilers:
+            self.active_profilers[-1].resume()
+        log.info(f"- profiles saved in {profiler.path_prefix}.*")
+
+    @staticmethod
+    def get_peak_rss() -> int:
+        """
+        Get the peak resident memory of the current process.
+
+        :return: peak resident memory, in bytes, or None if it is not available
+        in this platform.
+        :rtype: int
+        """
+
+        try:
+            import resource
+        except ImportError:
+            return None
+
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            peak_rss *= 1024
+
+        return peak_rss
+
+    def get_shape_metrics(self) -> dict:
+        """
+        Get the number of rows and columns of the input and output datasets
+        currently loaded. Several input datasets add up their rows. The rows of
+        Polars lazy frames are left out, as they are not computed yet.
+
+        :return: dictionary with the rows and columns of the datasets loaded.
+        :rtype: dict
+        """
+
+        shape_metrics = {}
+
+        input_dfs = getattr(self, "input_dfs", None) or []
+        if self.input_df is not None:
+            input_dfs = [self.input_df]
+        if input_dfs:
+            input_shapes = [DataProcessor.get_dataframe_shape(input_df) for input_df in input_dfs]
+            if all(rows is not None for rows, _ in input_shapes):
+                shape_metrics["input_rows"] = sum(rows for rows, _ in input_shapes)
+            shape_metrics["input_columns"] = max(columns for _, columns in input_shapes)
+
+        if self.output_df is not None:
+            output_rows, output_columns = DataProcessor.get_dataframe_shape(self.output_df)
+            if output_rows is not None:
+                shape_metrics["output_rows"] = output_rows
+            shape_metrics["output_columns"] = output_columns
+
+        return shape_metrics
+
+    def get_run_record_path_segment(self) -> str:
+        """
+        Get the path where the run records are stored, next to the output
+        dataset, with its full file name followed by ".metrics.jsonl".
+
+        :return: path to the run records, or None if there is no output path.
+        :rtype: str
+        """
+
+        if self.output_path_segment is None:
+            return None
+
+        output_path = Path(self.output_path_segment)
+        run_record_path = output_path.with_name(
+            f"{output_path.name}{DataProcessor.RUN_RECORD_SUFFIX}")
+
+        return str(run_record_path)
+
+    def save_run_record(self):
+        """
+        Append a record of the current execution, with its `metrics`, to the
+        run records next to the output dataset, one JSON object per line.
+        """
+
+        log.info("Save run record")
+        log.debug("DataProcessor.save_run_record()")
+
+        run_record_path_segment = self.get_run_record_path_segment()
+        if run_record_path_segment is None:
+            log.debug("- output path is none, nothing to save")
+            return
+
+        run_record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "stage": self.description,
+            "class": f"{type(self).__module__}.{type(self).__qualname__}",
+            "inputs": self.get_input_path_segments(),
+            "output": self.output_path_segment,
+            "metrics": self.metrics
+        }
+        with open(run_record_path_segment, "a") as file:
+            file.write(json.dumps(run_record, default=str) + "\n")
+
+    def save_fingerprint(self):
+        """
+        Save the fingerprint of the current execution next to the output
+        dataset, so the next one can be skipped if nothing changes. It is the
+        one taken by `is_up_to_date()` before executing, if any, so attributes
+        set while executing do not change it.
+        """
+
+        log.info("Save execution fingerprint")
+        log.debug("DataProcessor.save_fingerprint()")
+
+        fingerprint_path_segment = self.get_fingerprint_path_segment()
+        if fingerprint_path_segment is None:
+            log.debug("- output path is none, nothing to save")
+            return
+
+        fingerprint = self.fingerprint
+        if fingerprint is None:
+            fingerprint = self.get_fingerprint()
+        with open(fingerprint_path_segment, "w") as file:
+            json.dump(fingerprint, file, indent=2)
+        self.fingerprint = None
 
     def log_changes(self):
         """
@@ -204,6 +2608,8 @@ class DataProcessor:
         Parsed arguments are:
         - path to the input CSV dataset.
         - path to the output CSV dataset.
+        - optional arguments shared by every data processor, such as the CSV
+        engine.
         """
 
         log.info("Get data processor arguments")
@@ -215,6 +2621,7 @@ class DataProcessor:
                                      help="path to the input CSV dataset")
         argument_parser.add_argument("-o", "--output_path", required=True,
                                      help="path to the output CSV dataset")
+        self.add_optional_arguments(argument_parser)
 
         arguments = argument_parser.parse_args()
         self.input_path_segment = ArgumentParserHelper.parse_data_file_path(
@@ -222,14 +2629,107 @@ class DataProcessor:
         self.output_path_segment = ArgumentParserHelper.parse_data_file_path(
             data_file_path=arguments.output_path,
             check_is_file=False)
+        self.parse_optional_arguments(arguments)
+
+    def add_optional_arguments(self, argument_parser: argparse.ArgumentParser):
+        """
+        Add the optional arguments shared by every data processor to the parser
+        provided.
+
+        :param argument_parser: parser the arguments should be added to.
+        """
+
+        log.debug("DataProcessor.add_optional_arguments()")
+
+        argument_parser.add_argument("--csv_engine",
+                                     choices=["c", "python", "pyarrow"],
+                                     help="parser used to read CSV datasets")
+        argument_parser.add_argument("--dtype_backend",
+                                     choices=["numpy_nullable", "pyarrow"],
+                                     help="backend of the types of the loaded datasets")
+        argument_parser.add_argument("--max_workers", type=int,
+                                     help="maximum number of datasets loaded at the same time")
+        argument_parser.add_argument("--parse_cache_path",
+                                     help="folder of the cache of parsed CSV and Excel datasets")
+        argument_parser.add_argument("--incremental", action="store_true", default=None,
+                                     help="skip the execution if nothing changed since the last one")
+        argument_parser.add_argument("--excel_sheets", nargs="+",
+                                     help="sheets to read from Excel datasets")
+        argument_parser.add_argument("--excel_excluded_sheets", nargs="+",
+                                     help="sheets not to read from Excel datasets")
+        argument_parser.add_argument("--excel_engine",
+                                     help="engine used to read Excel datasets, such as openpyxl or odf")
+        argument_parser.add_argument("--partition_rows", type=int,
+                                     help="process the dataset in partitions of this number of rows")
+        argument_parser.add_argument("--partition_column",
+                                     help="process the dataset in partitions by this column")
+        argument_parser.add_argument("--profile_path",
+                                     help="folder where a profile of each phase is saved")
+        argument_parser.add_argument("--apply_backend",
+                                     choices=[backend.value for backend in DataProcessor.ApplyBackend],
+                                     help="backend used to apply functions that cannot be vectorized")
+        argument_parser.add_argument("--dataframe_backend",
+                                     choices=[backend.value for backend in DataProcessor.DataFrameBackend],
+                                     help="library the datasets are loaded and processed with")
+        argument_parser.add_argument("--memory_map", action="store_true", default=None,
+                                     help="save Arrow datasets uncompressed and load them memory mapped")
+        argument_parser.add_argument("--drop_duplicates", action="store_true", default=None,
+                                     help="drop duplicated rows on load")
+        argument_parser.add_argument("--duplicate_columns", nargs="+",
+                                     help="columns the rows are compared by to find duplicates")
+
+    def parse_optional_arguments(self, arguments: argparse.Namespace):
+        """
+        Store the optional arguments shared by every data processor, if they
+        were provided. Otherwise, keep the current values.
+
+        :param arguments: arguments parsed.
+        """
+
+        log.debug("DataProcessor.parse_optional_arguments()")
+
+        if arguments.csv_engine is not None:
+            self.csv_engine = arguments.csv_engine
+        if arguments.dtype_backend is not None:
+            self.dtype_backend = arguments.dtype_backend
+        if arguments.max_workers is not None:
+            self.max_workers = arguments.max_workers
+        if arguments.parse_cache_path is not None:
+            self.parse_cache = ParseCache(cache_path_segment=arguments.parse_cache_path)
+        if arguments.incremental is not None:
+            self.incremental = arguments.incremental
+        if arguments.excel_sheets is not None:
+            self.excel_sheets = arguments.excel_sheets
+        if arguments.excel_excluded_sheets is not None:
+            self.excel_excluded_sheets = arguments.excel_excluded_sheets
+        if arguments.excel_engine is not None:
+            self.excel_engine = arguments.excel_engine
+        if arguments.partition_rows is not None:
+            self.partition_rows = arguments.partition_rows
+        if arguments.partition_column is not None:
+            self.partition_column = arguments.partition_column
+        if arguments.apply_backend is not None:
+            self.apply_backend = DataProcessor.ApplyBackend(arguments.apply_backend)
+        if arguments.profile_path is not None:
+            self.profile_path_segment = arguments.profile_path
+        if arguments.dataframe_backend is not None:
+            self.dataframe_backend = DataProcessor.DataFrameBackend(arguments.dataframe_backend)
+        if arguments.memory_map is not None:
+            self.memory_map = arguments.memory_map
+        if arguments.drop_duplicates is not None:
+            self.drop_duplicates = arguments.drop_duplicates
+        if arguments.duplicate_columns is not None:
+            self.duplicate_columns = arguments.duplicate_columns
 
     def save_report(self, dataframe: pd.DataFrame, source_path_segment: str):
         """
         Save a report about the provided dataframe in the path provided,
         changing the extension as needed. The type of the report depends on the
-        user preferences.
+        user preferences. Polars dataframes are converted to pandas first.
         """
 
+        dataframe = DataProcessor.to_pandas(dataframe)
+
         log.info("Save dataset report")
         log.debug(f"DataProcessor.save_report("
                   f"dataframe={len(dataframe.index)} rows, "
@@ -329,24 +2829,30 @@ class DataProcessor:
         Create the decorator @DataProcessor.stopwatch to easily measure the
         execution time of a method. Time is measured before and after the
         execution of the method. A debug log entry is added showing the
-        difference.
+        difference. The arguments and the result of the method are passed
+        through.
+
+        Use `measure()` to store the time, and more, in `metrics`.
 
         :param func: method to measure.
         """
 
-        def wrapper(self):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
             tic = time.perf_counter()
-            func(self)
+            result = func(*args, **kwargs)
             toc = time.perf_counter()
-            log.debug(f"- time: {toc - tic:0.4f} s")
+            log.debug(f"- {func.__qualname__} time: {toc - tic:0.4f} s")
+
+            return result
 
         return wrapper
 
     @staticmethod
     def get_swifter_version() -> str:
         """
-        Returns Swifter version. This is here just to avoid PyCharm removing
-        Swifter's import.
+        Returns Swifter version. Swifter is no longer needed, use `apply()`
+        instead, so it is imported only here.
 
         :return: Swifter version.
         :rtype: str
@@ -355,4 +2861,6 @@ class DataProcessor:
         log.info("Get Swifter version")
         log.debug("DataProcessor.get_swifter_version()")
 
+        import swifter
+
         return swifter.__version__
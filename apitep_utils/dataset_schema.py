@@ -0,0 +1,236 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Union
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+class DatasetSchema:
+    """
+    Declarative description of how a dataset should be loaded.
+
+    - columns: list of the columns to read. All of them are read if None.
+    - dtypes: dictionary with the type of each column, such as "int32",
+    "float32" or "string". Columns not present are inferred.
+    - categories: columns that should be loaded as categorical. Either a list
+    of column names, or a dictionary with the list of categories of each column.
+    - dates: columns that should be parsed as dates. Either a list of column
+    names, or a dictionary with the format of each column.
+
+    A schema can be attached to a DataProcessor as a class attribute, or stored
+    in a JSON file with the same keys. If a file with the same name as a
+    dataset, but with the extension ".schema.json", exists, it is used as the
+    schema of that dataset.
+    """
+
+    SIDECAR_SUFFIX = ".schema.json"
+
+    columns: List = None
+    dtypes: Dict = None
+    categories: Union[List, Dict] = None
+    dates: Union[List, Dict] = None
+
+    def __init__(
+            self,
+            columns: List = None,
+            dtypes: Dict = None,
+            categories: Union[List, Dict] = None,
+            dates: Union[List, Dict] = None
+    ):
+        """
+        Init DatasetSchema class instance.
+
+        :param columns: list of the columns to read. Optional.
+        :param dtypes: type of each column. Optional.
+        :param categories: categorical columns, with or without their
+        categories. Optional.
+        :param dates: date columns, with or without their format. Optional.
+        """
+
+        log.info("Init dataset schema")
+        log.debug(f"DatasetSchema.__init__("
+                  f"columns={columns}, "
+                  f"dtypes={dtypes}, "
+                  f"categories={categories}, "
+                  f"dates={dates})")
+
+        if columns is not None:
+            self.columns = columns
+        if dtypes is not None:
+            self.dtypes = dtypes
+        if categories is not None:
+            self.categories = categories
+        if dates is not None:
+            self.dates = dates
+
+    @staticmethod
+    def from_file(schema_path_segment: str) -> "DatasetSchema":
+        """
+        Load a schema from the JSON file in the path provided.
+
+        :param schema_path_segment: path to the JSON schema.
+        :return: schema described in the file.
+        :rtype: DatasetSchema
+        """
+
+        log.info("Load dataset schema")
+        log.debug(f"DatasetSchema.from_file("
+                  f"schema_path_segment={schema_path_segment})")
+
+        with open(schema_path_segment, "r") as file:
+            schema = json.load(file)
+
+        return DatasetSchema(**schema)
+
+    @staticmethod
+    def get_sidecar_path(dataset_path_segment: str) -> str:
+        """
+        Get the path where the schema of the dataset provided would be stored
+        next to it: its full file name, extensions included, followed by
+        ".schema.json", so datasets in different formats, or compressed, never
+        share a schema.
+
+        :param dataset_path_segment: path to the dataset.
+        :return: path to the schema of the dataset.
+        :rtype: str
+        """
+
+        dataset_path = Path(dataset_path_segment)
+        schema_path = dataset_path.with_name(
+            f"{dataset_path.name}{DatasetSchema.SIDECAR_SUFFIX}")
+
+        return str(schema_path)
+
+    def get_dtypes(self) -> Dict:
+        """
+        Get the type of each column, including the categorical ones, in the
+        format expected by the `dtype` parameter of pandas' readers.
+
+        :return: type of each column.
+        :rtype: Dict
+        """
+
+        dtypes = dict(self.dtypes or {})
+        if isinstance(self.categories, dict):
+            for column, categories in self.categories.items():
+                dtypes[column] = pd.CategoricalDtype(categories)
+        elif self.categories is not None:
+            for column in self.categories:
+                dtypes[column] = "category"
+
+        return dtypes
+
+    def get_polars_dtypes(self) -> Dict:
+        """
+        Get the type of each column, including the categorical ones, as Polars
+        types. Types are translated through pandas, so they are written the
+        same way for both backends.
+
+        :return: Polars type of each column.
+        :rtype: Dict
+        """
+
+        import polars as pl
+
+        dtypes_df = pd.DataFrame({
+            column: pd.Series([], dtype=dtype)
+            for column, dtype in (self.dtypes or {}).items()
+        })
+        dtypes = {
+            column: dtype
+            for column, dtype in pl.from_pandas(dtypes_df).schema.items()
+            if dtype != pl.Null
+        }
+        for column in self.categories or []:
+            dtypes[column] = pl.Categorical
+
+        return dtypes
+
+    def apply(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Make the dataframe provided comply with the schema: keep only the
+        columns in the schema, cast them to their types, and parse the dates.
+        Used after reading formats whose readers do not take the schema
+        directly.
+
+        :param dataframe: dataframe to change.
+        :return: dataframe complying with the schema.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug(f"DatasetSchema.apply("
+                  f"dataframe={len(dataframe.index)} rows)")
+
+        if self.columns is not None:
+            columns = [column for column in self.columns if column in dataframe.columns]
+            if len(columns) != len(dataframe.columns):
+                dataframe = dataframe[columns]
+
+        dtypes = {
+            column: dtype
+            for column, dtype in self.get_dtypes().items()
+            if column in dataframe.columns and dataframe[column].dtype != dtype
+        }
+        if dtypes:
+            dataframe = dataframe.astype(dtypes)
+
+        if isinstance(self.dates, dict):
+            dates = self.dates
+        else:
+            dates = dict.fromkeys(self.dates or [])
+        parsed_dates = {
+            column: pd.to_datetime(dataframe[column], format=date_format)
+            for column, date_format in dates.items()
+            if column in dataframe.columns and not pd.api.types.is_datetime64_any_dtype(dataframe[column])
+        }
+        if parsed_dates:
+            dataframe = dataframe.assign(**parsed_dates)
+
+        return dataframe
+
+    def apply_polars(self, lazy_frame):
+        """
+        Make the Polars lazy frame provided comply with the schema, the same
+        way `apply()` does with pandas dataframes. Nothing is computed until
+        the lazy frame is collected.
+
+        :param lazy_frame: Polars lazy frame to change.
+        :return: Polars lazy frame complying with the schema.
+        :rtype: pl.LazyFrame
+        """
+
+        log.debug("DatasetSchema.apply_polars()")
+
+        import polars as pl
+
+        schema = lazy_frame.collect_schema()
+        if self.columns is not None:
+            columns = [column for column in self.columns if column in schema]
+            if len(columns) != len(schema):
+                lazy_frame = lazy_frame.select(columns)
+                schema = lazy_frame.collect_schema()
+
+        casts = [
+            pl.col(column).cast(dtype)
+            for column, dtype in self.get_polars_dtypes().items()
+            if column in schema and schema[column] != dtype
+        ]
+        if casts:
+            lazy_frame = lazy_frame.with_columns(casts)
+
+        if isinstance(self.dates, dict):
+            dates = self.dates
+        else:
+            dates = dict.fromkeys(self.dates or [])
+        parsed_dates = [
+            pl.col(column).str.to_datetime(format=date_format)
+            for column, date_format in dates.items()
+            if column in schema and schema[column] == pl.String
+        ]
+        if parsed_dates:
+            lazy_frame = lazy_frame.with_columns(parsed_dates)
+
+        return lazy_frame
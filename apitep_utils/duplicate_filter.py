@@ -0,0 +1,201 @@
+import logging
+from typing import Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+class DuplicateFilter:
+    """
+    Drop duplicated rows across several dataframes, or chunks, without
+    stacking them.
+
+    Each row is hashed into a 64-bit integer, over all the columns, or only
+    those in `columns`, and only the hashes of the rows seen so far are kept,
+    in sorted arrays, taking 8 bytes per distinct row. Rows whose hash was
+    already seen, in the same dataframe or in a previous one, are dropped,
+    keeping the first occurrence, as `drop_duplicates()` does.
+
+    Rows are compared by their hash, so two different rows could be taken as
+    duplicates if their hashes collide, which is very unlikely below billions
+    of rows. Numbers are hashed as 64-bit floats, as `pd.concat()` would
+    store them, so the same number read as an integer from one extract, and
+    as a float from another one with missing values in that column, matches.
+    Integers too large to be stored exactly as floats are hashed as they are.
+
+    The rows dropped are counted in `changes`, usually those of the data
+    processor creating the filter (see `DataProcessor.get_duplicate_filter()`).
+    """
+
+    columns: List = None
+    changes: Dict = None
+    runs: List = None
+
+    def __init__(self, columns: List = None, changes: Dict = None):
+        """
+        Init DuplicateFilter class instance.
+
+        :param columns: columns the rows are compared by. Defaults to all of
+        them. Optional.
+        :param changes: dictionary where the rows dropped are counted.
+        Optional.
+        """
+
+        log.info("Init duplicate filter")
+        log.debug(f"DuplicateFilter.__init__("
+                  f"columns={columns})")
+
+        self.changes = {}
+        self.runs = []
+
+        if columns is not None:
+            self.columns = columns
+        if changes is not None:
+            self.changes = changes
+
+    def __len__(self) -> int:
+        """
+        Get the number of distinct rows seen so far.
+
+        :return: number of hashes stored.
+        :rtype: int
+        """
+
+        return sum(len(run) for run in self.runs)
+
+    def hash_rows(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """
+        Hash each row of the dataframe provided, over `columns`, ignoring the
+        index. Numeric and boolean columns are hashed as floats (see
+        `get_canonical_series()`).
+
+        :param dataframe: dataframe whose rows are hashed.
+        :return: 64-bit hash of each row.
+        :rtype: np.ndarray
+        """
+
+        if self.columns is not None:
+            dataframe = dataframe[self.columns]
+
+        canonical_df = None
+        for position in range(len(dataframe.columns)):
+            series = dataframe.iloc[:, position]
+            canonical_series = DuplicateFilter.get_canonical_series(series)
+            if canonical_series is series:
+                continue
+            if canonical_df is None:
+                canonical_df = dataframe.copy(deep=False)
+            canonical_df.isetitem(position, canonical_series)
+        if canonical_df is not None:
+            dataframe = canonical_df
+
+        return pd.util.hash_pandas_object(dataframe, index=False).to_numpy()
+
+    @staticmethod
+    def get_canonical_series(series: pd.Series) -> pd.Series:
+        """
+        Get the series provided with the type its values are hashed with:
+        numbers and booleans as 64-bit floats, with missing values as NaN,
+        unless they are integers that floats cannot store exactly.
+
+        :param series: series to convert.
+        :return: converted series, or the same series if it is not converted.
+        :rtype: pd.Series
+        """
+
+        if series.dtype == "float64":
+            return series
+        if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+            return series
+
+        if pd.api.types.is_integer_dtype(series) and series.notna().any():
+            # Floats only store integers exactly up to 2 ** 53
+            if max(abs(int(series.min())), abs(int(series.max()))) > 2 ** 53:
+                return series
+
+        return series.astype("float64")
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Check which of the hashes provided were already seen.
+
+        :param hashes: array of hashes.
+        :return: array with True for each hash already seen.
+        :rtype: np.ndarray
+        """
+
+        seen = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.searchsorted(run, hashes)
+            positions[positions == len(run)] = 0
+            seen |= run[positions] == hashes
+
+        return seen
+
+    def add(self, hashes: np.ndarray):
+        """
+        Store the hashes provided, not seen yet, as a new sorted array. Arrays
+        are merged while the last one is as large as the previous one, so
+        there are only as many as the logarithm of the number of hashes.
+
+        :param hashes: array of distinct hashes, not seen yet.
+        """
+
+        if len(hashes) == 0:
+            return
+
+        self.runs.append(np.sort(hashes))
+        while len(self.runs) > 1 and len(self.runs[-2]) <= len(self.runs[-1]):
+            last_run = self.runs.pop()
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last_run]), kind="stable")
+
+    def filter(self, dataframe: pd.DataFrame, source: str = None) -> pd.DataFrame:
+        """
+        Drop the rows of the dataframe provided already seen, in it or in the
+        previous ones, and count them in `changes`.
+
+        :param dataframe: dataframe to filter.
+        :param source: name of the dataset the dataframe comes from, such as
+        its path, to count the rows dropped from it separately. Optional.
+        :return: dataframe without the duplicated rows, or the same dataframe
+        if there are none.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug(f"DuplicateFilter.filter("
+                  f"source={source})")
+
+        hashes = self.hash_rows(dataframe)
+        _, first_positions = np.unique(hashes, return_index=True)
+        keep = np.zeros(len(hashes), dtype=bool)
+        keep[first_positions] = True
+        keep &= ~self.contains(hashes)
+        self.add(hashes[keep])
+
+        dropped = int(len(hashes) - keep.sum())
+        change = "duplicated rows dropped"
+        if source is not None:
+            change = f"{change} from {source}"
+        self.changes[change] = self.changes.get(change, 0) + dropped
+        log.debug(f"- rows dropped: {dropped}")
+
+        if dropped == 0:
+            return dataframe
+
+        return dataframe[keep]
+
+    def filter_chunks(self, chunks: Iterator[pd.DataFrame], source: str = None) -> Iterator[pd.DataFrame]:
+        """
+        Drop the duplicated rows of each chunk provided as they are iterated,
+        holding only one chunk at a time.
+
+        :param chunks: iterator over the chunks to filter.
+        :param source: name of the dataset the chunks come from. Optional.
+        :return: iterator over the chunks without the duplicated rows.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        for chunk in chunks:
+            yield self.filter(chunk, source)
@@ -1,9 +1,10 @@
 import logging
 import sys
-import numpy as np
 import argparse
+from apitep_utils.dataset_schema import DatasetSchema
+from apitep_utils.parse_cache import ParseCache
 from apitep_utils.transformation import Transformation
-from typing import List
+from typing import Dict, List
 from apitep_utils import ArgumentParserHelper
 import pandas as pd
 
@@ -35,7 +36,32 @@ class ETL(Transformation):
             save_report_on_save: bool = None,
             report_type: Transformation.ReportType = None,
             report_path_segment: str = None,
-            input_type_excel: bool = None
+            input_type_excel: bool = None,
+            chunk_size: int = None,
+            input_columns: List = None,
+            output_compression: str = None,
+            schema: DatasetSchema = None,
+            schema_path_segment: str = None,
+            optimize_memory: bool = None,
+            category_threshold: float = None,
+            csv_engine: str = None,
+            dtype_backend: str = None,
+            max_workers: int = None,
+            parse_cache: ParseCache = None,
+            incremental: bool = None,
+            output_metadata: bool = None,
+            verify_input: bool = None,
+            excel_sheets: List = None,
+            excel_excluded_sheets: List = None,
+            excel_engine: str = None,
+            partition_rows: int = None,
+            partition_column: str = None,
+            apply_backend: Transformation.ApplyBackend = None,
+            profile_path_segment: str = None,
+            dataframe_backend: Transformation.DataFrameBackend = None,
+            memory_map: bool = None,
+            drop_duplicates: bool = None,
+            duplicate_columns: List = None
     ):
         """
         Init ETL class instance.
@@ -52,6 +78,59 @@ class ETL(Transformation):
         :param report_type: control the type of the report saved if
         save_report_on_load or save_report_on_save are True. Optional.
         :param input_type_excel: load with configuration of excel if True. Optional.
+        :param chunk_size: number of rows per chunk. If present, the datasets
+        are streamed in chunks of this size instead of loaded at once. Optional.
+        :param input_columns: list of the columns to read from each input
+        dataset. If not present, all of them are read. Optional.
+        :param output_compression: compression codec for the output dataset,
+        such as "snappy", "zstd" or "lz4" for Parquet, Feather or Arrow IPC, or
+        "gzip", "bz2", "xz" or "zstd" for CSV. Optional.
+        :param schema: schema used to load the input datasets. Optional.
+        :param schema_path_segment: path to a JSON file with the schema used to
+        load the input datasets. Optional.
+        :param optimize_memory: downcast the columns of the input datasets to
+        save memory if True. Optional.
+        :param category_threshold: maximum ratio of unique values to rows for a
+        text column to be converted to categorical when optimizing memory.
+        Optional.
+        :param csv_engine: parser used to read CSV datasets: "c", "python" or
+        "pyarrow". The last one is multithreaded. Optional.
+        :param dtype_backend: backend of the types of the loaded datasets:
+        "numpy_nullable" or "pyarrow". Optional.
+        :param max_workers: maximum number of datasets loaded, reports saved,
+        CSV output batches compressed, or partitions processed, at the same
+        time. Optional.
+        :param parse_cache: cache of parsed CSV and Excel datasets. Optional.
+        :param incremental: skip the execution if neither the inputs, nor the
+        parameters, nor the code changed since the last one, and the output
+        still exists, if True. Optional.
+        :param output_metadata: save the number of rows and the checksum of the
+        output dataset next to it if True. Optional.
+        :param verify_input: check the number of rows and the checksum of the
+        input datasets against the metadata saved next to them, if any, if
+        True. Optional.
+        :param excel_sheets: names of the sheets to read from Excel datasets.
+        If not present, all of them are read. Optional.
+        :param excel_excluded_sheets: names of the sheets not to read from
+        Excel datasets. Optional.
+        :param excel_engine: engine used to read Excel datasets, any of those
+        `pandas.read_excel()` accepts, such as "openpyxl" or "odf". Optional.
+        :param partition_rows: number of rows per partition, to process the
+        dataset in up to `max_workers` processes. Optional.
+        :param partition_column: column whose groups of rows are never split
+        between partitions. Optional.
+        :param apply_backend: how `apply()` runs functions that cannot be
+        vectorized. Optional.
+        :param profile_path_segment: folder where a profile of each phase is
+        saved, if present. Optional.
+        :param dataframe_backend: library the datasets are loaded with, and
+        `process()` works with: pandas or Polars. Optional.
+        :param memory_map: save Feather and Arrow IPC datasets uncompressed,
+        and load them by mapping them in memory, if True. Optional.
+        :param drop_duplicates: drop duplicated rows on load, across all the
+        datasets, if True. Optional.
+        :param duplicate_columns: columns the rows are compared by to find
+        duplicates. Defaults to all of them. Optional.
         """
 
         log.info("Init ETL")
@@ -64,7 +143,32 @@ class ETL(Transformation):
                   f"save_report_on_save={save_report_on_save}, "
                   f"report_type={report_type}, "
                   f"report_path_segment={report_path_segment}, "
-                  f"input_type_excel={input_type_excel})")
+                  f"input_type_excel={input_type_excel}, "
+                  f"chunk_size={chunk_size}, "
+                  f"input_columns={input_columns}, "
+                  f"output_compression={output_compression}, "
+                  f"schema={schema}, "
+                  f"schema_path_segment={schema_path_segment}, "
+                  f"optimize_memory={optimize_memory}, "
+                  f"category_threshold={category_threshold}, "
+                  f"csv_engine={csv_engine}, "
+                  f"dtype_backend={dtype_backend}, "
+                  f"max_workers={max_workers}, "
+                  f"parse_cache={parse_cache}, "
+                  f"incremental={incremental}, "
+                  f"output_metadata={output_metadata}, "
+                  f"verify_input={verify_input}, "
+                  f"excel_sheets={excel_sheets}, "
+                  f"excel_excluded_sheets={excel_excluded_sheets}, "
+                  f"excel_engine={excel_engine}, "
+                  f"partition_rows={partition_rows}, "
+                  f"partition_column={partition_column}, "
+                  f"apply_backend={apply_backend}, "
+                  f"profile_path_segment={profile_path_segment}, "
+                  f"dataframe_backend={dataframe_backend}, "
+                  f"memory_map={memory_map}, "
+                  f"drop_duplicates={drop_duplicates}, "
+                  f"duplicate_columns={duplicate_columns})")
 
         super().__init__(
             input_path_segment=None,
@@ -75,7 +179,32 @@ class ETL(Transformation):
             save_report_on_save=save_report_on_save,
             report_type=report_type,
             report_path_segment=report_path_segment,
-            input_type_excel=input_type_excel
+            input_type_excel=input_type_excel,
+            chunk_size=chunk_size,
+            input_columns=input_columns,
+            output_compression=output_compression,
+            schema=schema,
+            schema_path_segment=schema_path_segment,
+            optimize_memory=optimize_memory,
+            category_threshold=category_threshold,
+            csv_engine=csv_engine,
+            dtype_backend=dtype_backend,
+            max_workers=max_workers,
+            parse_cache=parse_cache,
+            incremental=incremental,
+            output_metadata=output_metadata,
+            verify_input=verify_input,
+            excel_sheets=excel_sheets,
+            excel_excluded_sheets=excel_excluded_sheets,
+            excel_engine=excel_engine,
+            partition_rows=partition_rows,
+            partition_column=partition_column,
+            apply_backend=apply_backend,
+            profile_path_segment=profile_path_segment,
+            dataframe_backend=dataframe_backend,
+            memory_map=memory_map,
+            drop_duplicates=drop_duplicates,
+            duplicate_columns=duplicate_columns
         )
 
         if save_report_on_load is None:
@@ -93,7 +222,10 @@ class ETL(Transformation):
         """
         Replace the destination column with the source column, then delete the
         source column. Before hand, count the differences in values between
-        both columns and return that value.
+        both columns and return that value. Missing values in both columns are
+        not considered different.
+
+        Use `replace_columns()` to replace several columns at once.
 
         :param source_column:
         :param destination_column:
@@ -107,46 +239,157 @@ class ETL(Transformation):
                   f"source_column={source_column},"
                   f"destination_column={destination_column})")
 
-        comparison = np.where(self.input_df[source_column] != self.input_df[destination_column])
-        changes = len(comparison[0])
+        differences = self.__replace_columns({source_column: destination_column})
+
+        return differences[destination_column]
+
+    def replace_columns(self, columns: Dict[str, str]) -> Dict[str, int]:
+        """
+        Replace each destination column with its source column, then delete
+        the source columns. The differences in values between each pair of
+        columns are counted at once, beforehand, and the dataframe is rebuilt
+        only once, however many columns are replaced. Missing values in both
+        columns are not considered different.
+
+        The number of differences of each pair is stored in `changes`.
+
+        :param columns: dictionary with the destination column of each source
+        column.
+
+        :return: number of differences of each destination column.
+        :rtype: Dict[str, int]
+        """
+
+        log.info("Replace columns with others")
+        log.debug(f"ETL.replace_columns("
+                  f"columns={columns})")
+
+        differences = self.__replace_columns(columns)
+        for source_column, destination_column in columns.items():
+            self.changes[f"values replaced in column {destination_column} "
+                         f"by column {source_column}"] = differences[destination_column]
+
+        return differences
+
+    def __replace_columns(self, columns: Dict[str, str]) -> Dict[str, int]:
+        """
+        Count the differences between each source column and its destination
+        column in `input_df`, then replace the destination columns with the
+        source ones, and delete the source columns.
+
+        :param columns: dictionary with the destination column of each source
+        column.
+        :return: number of differences of each destination column.
+        :rtype: Dict[str, int]
+        """
+
+        source_columns = list(columns)
+        destination_columns = list(columns.values())
+        if len(set(destination_columns)) != len(destination_columns):
+            raise ValueError("destination columns must be different")
+        if set(source_columns) & set(destination_columns):
+            raise ValueError("columns cannot be both source and destination")
+
+        if self.is_polars(self.input_df):
+            return self.__replace_polars_columns(columns)
+
+        source_df = self.input_df[source_columns]
+        destination_df = self.input_df[destination_columns].set_axis(source_columns, axis="columns")
+        missing_df = source_df.isna() & destination_df.isna()
+        different_df = source_df.ne(destination_df).fillna(True).astype(bool) & ~missing_df
+        differences = dict(zip(destination_columns, different_df.sum().astype(int).tolist()))
+
+        replaced_columns = {
+            destination_column: self.input_df[source_column]
+            for source_column, destination_column in columns.items()
+        }
+        self.input_df = pd.DataFrame(
+            {
+                column: replaced_columns.get(column, self.input_df[column])
+                for column in self.input_df.columns
+                if column not in columns
+            },
+            index=self.input_df.index)
 
-        self.input_df[destination_column] = self.input_df[source_column]
-        self.input_df.drop(labels=[source_column], axis="columns", inplace=True)
+        return differences
 
-        return changes
+    def __replace_polars_columns(self, columns: Dict[str, str]) -> Dict[str, int]:
+        """
+        Replace the columns of a Polars `input_df` like `__replace_columns()`
+        does. Lazy frames are only computed to count the differences.
+
+        :param columns: dictionary with the destination column of each source
+        column.
+        :return: number of differences of each destination column.
+        :rtype: Dict[str, int]
+        """
+
+        import polars as pl
+
+        different_df = self.input_df.lazy().select([
+            pl.col(source_column).ne_missing(pl.col(destination_column)).sum().alias(destination_column)
+            for source_column, destination_column in columns.items()
+        ]).collect()
+        differences = {
+            destination_column: int(different_df[destination_column][0])
+            for destination_column in columns.values()
+        }
+
+        self.input_df = self.input_df.with_columns([
+            pl.col(source_column).alias(destination_column)
+            for source_column, destination_column in columns.items()
+        ]).drop(list(columns))
+
+        return differences
 
     def load(self):
         """
-        Load the CSV datasets in the input path list provided. Optionally, save
-        a report in the same path for each of them, with the same file name, but
-        with HTML extension.
+        Load the datasets in the input path list provided, in any of the formats
+        in `DatasetFormat`. Optionally, save a report in the same path for each
+        of them, with the same file name, but with HTML extension.
+
+        Datasets are read, and their reports saved, by up to `max_workers`
+        threads. `input_dfs` keeps the order of `input_path_segments`.
+
+        In streaming mode, only prepare the iterator of chunks in `input_chunks`,
+        going through the datasets one after the other.
+
+        If `drop_duplicates` is True, duplicated rows are dropped across all
+        the datasets, after their reports, if any, or as the chunks are read.
         """
 
         log.info("Load input datasets")
-        log.debug("Integration.load()")
+        log.debug("ETL.load()")
 
         if self.input_path_segments is None:
             log.debug("- input path is none, nothing to load or report about")
             return
-        if not self.input_type_excel:
-            for input_path_segment in self.input_path_segments:
-                input_df = pd.read_csv(
-                    input_path_segment,
-                    sep=self.input_separator)
-                self.input_dfs.append(input_df)
-        else:
-            for input_path_segment in self.input_path_segments:
-                input_df = pd.concat(pd.read_excel(
-                    input_path_segment,
-                    header=0,
-                    sheet_name=None
-                ), ignore_index=True)
-                self.input_dfs.append(input_df)
+        if self.chunk_size is not None:
+            self.input_chunks = self.read_chunks(self.input_path_segments)
+            if self.drop_duplicates:
+                self.input_chunks = self.get_duplicate_filter().filter_chunks(self.input_chunks)
+            return
+
+        self.input_dfs = self.read_datasets(self.input_path_segments)
 
         if self.save_report_on_load:
-            for index, input_df in enumerate(self.input_dfs):
-                input_path_segment = self.input_path_segments[index]
-                self.save_report(input_df, input_path_segment)
+            with self.measure("load_report"):
+                self.save_reports(self.input_dfs, self.input_path_segments)
+        if self.drop_duplicates:
+            self.input_dfs = self.drop_duplicate_datasets(self.input_dfs, self.input_path_segments)
+
+    def get_input_path_segments(self) -> List:
+        """
+        Get the list of paths to the input datasets.
+
+        :return: list of paths to the input datasets.
+        :rtype: List
+        """
+
+        if self.input_path_segments is None:
+            return []
+
+        return self.input_path_segments
 
     def parse_arguments(self):
         """
@@ -156,6 +399,8 @@ class ETL(Transformation):
         Parsed arguments are:
         - paths to the input CSV datasets, separated with spaces.
         - path to the output CSV dataset.
+        - optional arguments shared by every data processor, such as the CSV
+        engine.
         """
 
         log.info("Get integration arguments")
@@ -169,6 +414,7 @@ class ETL(Transformation):
                                      help="path to the input CSV datasets")
         argument_parser.add_argument("-o", "--output_path", required=True,
                                      help="path to the output CSV dataset")
+        self.add_optional_arguments(argument_parser)
 
         arguments = argument_parser.parse_args()
         input_path_segments = arguments.input_paths
@@ -181,6 +427,7 @@ class ETL(Transformation):
         self.output_path_segment = ArgumentParserHelper.parse_data_file_path(
             data_file_path=arguments.output_path,
             check_is_file=False)
+        self.parse_optional_arguments(arguments)
 
     def execute(self):
         """
@@ -192,7 +439,17 @@ class ETL(Transformation):
 
         if len(sys.argv) > 1:
             self.parse_arguments()
-        self.load()
-        self.process()
-        self.save()
+        if self.incremental and self.is_up_to_date():
+            log.info("- output is up to date, nothing to execute")
+            return
+        self.metrics = {}
+        with self.measure("load"):
+            self.load()
+        with self.measure("process"):
+            self.process()
+        with self.measure("save"):
+            self.save()
         self.log_changes()
+        self.save_run_record()
+        if self.incremental:
+            self.save_fingerprint()
@@ -2,8 +2,9 @@ import logging
 import sys
 from typing import List
 
+from apitep_utils.dataset_schema import DatasetSchema
+from apitep_utils.parse_cache import ParseCache
 from apitep_utils.transformation import Transformation
-import pandas as pd
 from apitep_utils import ArgumentParserHelper
 import argparse
 
@@ -28,7 +29,32 @@ class FeatureEngineering(Transformation):
             output_separator: str = None,
             save_report_on_load: bool = None,
             save_report_on_save: bool = None,
-            report_type: Transformation.ReportType = None
+            report_type: Transformation.ReportType = None,
+            chunk_size: int = None,
+            input_columns: List = None,
+            output_compression: str = None,
+            schema: DatasetSchema = None,
+            schema_path_segment: str = None,
+            optimize_memory: bool = None,
+            category_threshold: float = None,
+            csv_engine: str = None,
+            dtype_backend: str = None,
+            max_workers: int = None,
+            parse_cache: ParseCache = None,
+            incremental: bool = None,
+            output_metadata: bool = None,
+            verify_input: bool = None,
+            excel_sheets: List = None,
+            excel_excluded_sheets: List = None,
+            excel_engine: str = None,
+            partition_rows: int = None,
+            partition_column: str = None,
+            apply_backend: Transformation.ApplyBackend = None,
+            profile_path_segment: str = None,
+            dataframe_backend: Transformation.DataFrameBackend = None,
+            memory_map: bool = None,
+            drop_duplicates: bool = None,
+            duplicate_columns: List = None
     ):
         """
         Init Integration class instance.
@@ -44,6 +70,59 @@ class FeatureEngineering(Transformation):
         Optional.
         :param report_type: control the type of the report saved if
         save_report_on_load or save_report_on_save are True. Optional.
+        :param chunk_size: number of rows per chunk. If present, the datasets
+        are streamed in chunks of this size instead of loaded at once. Optional.
+        :param input_columns: list of the columns to read from each input
+        dataset. If not present, all of them are read. Optional.
+        :param output_compression: compression codec for the output dataset,
+        such as "snappy", "zstd" or "lz4" for Parquet, Feather or Arrow IPC, or
+        "gzip", "bz2", "xz" or "zstd" for CSV. Optional.
+        :param schema: schema used to load the input datasets. Optional.
+        :param schema_path_segment: path to a JSON file with the schema used to
+        load the input datasets. Optional.
+        :param optimize_memory: downcast the columns of the input datasets to
+        save memory if True. Optional.
+        :param category_threshold: maximum ratio of unique values to rows for a
+        text column to be converted to categorical when optimizing memory.
+        Optional.
+        :param csv_engine: parser used to read CSV datasets: "c", "python" or
+        "pyarrow". The last one is multithreaded. Optional.
+        :param dtype_backend: backend of the types of the loaded datasets:
+        "numpy_nullable" or "pyarrow". Optional.
+        :param max_workers: maximum number of datasets loaded, reports saved,
+        CSV output batches compressed, or partitions processed, at the same
+        time. Optional.
+        :param parse_cache: cache of parsed CSV and Excel datasets. Optional.
+        :param incremental: skip the execution if neither the inputs, nor the
+        parameters, nor the code changed since the last one, and the output
+        still exists, if True. Optional.
+        :param output_metadata: save the number of rows and the checksum of the
+        output dataset next to it if True. Optional.
+        :param verify_input: check the number of rows and the checksum of the
+        input datasets against the metadata saved next to them, if any, if
+        True. Optional.
+        :param excel_sheets: names of the sheets to read from Excel datasets.
+        If not present, all of them are read. Optional.
+        :param excel_excluded_sheets: names of the sheets not to read from
+        Excel datasets. Optional.
+        :param excel_engine: engine used to read Excel datasets, any of those
+        `pandas.read_excel()` accepts, such as "openpyxl" or "odf". Optional.
+        :param partition_rows: number of rows per partition, to process the
+        dataset in up to `max_workers` processes. Optional.
+        :param partition_column: column whose groups of rows are never split
+        between partitions. Optional.
+        :param apply_backend: how `apply()` runs functions that cannot be
+        vectorized. Optional.
+        :param profile_path_segment: folder where a profile of each phase is
+        saved, if present. Optional.
+        :param dataframe_backend: library the datasets are loaded with, and
+        `process()` works with: pandas or Polars. Optional.
+        :param memory_map: save Feather and Arrow IPC datasets uncompressed,
+        and load them by mapping them in memory, if True. Optional.
+        :param drop_duplicates: drop duplicated rows on load, across all the
+        datasets, if True. Optional.
+        :param duplicate_columns: columns the rows are compared by to find
+        duplicates. Defaults to all of them. Optional.
         """
 
         log.info("Init FeatureEngineering")
@@ -54,7 +133,32 @@ class FeatureEngineering(Transformation):
                   f"output_separator={output_separator}, "
                   f"save_report_on_load={save_report_on_load}, "
                   f"save_report_on_save={save_report_on_save}, "
-                  f"report_type={report_type})")
+                  f"report_type={report_type}, "
+                  f"chunk_size={chunk_size}, "
+                  f"input_columns={input_columns}, "
+                  f"output_compression={output_compression}, "
+                  f"schema={schema}, "
+                  f"schema_path_segment={schema_path_segment}, "
+                  f"optimize_memory={optimize_memory}, "
+                  f"category_threshold={category_threshold}, "
+                  f"csv_engine={csv_engine}, "
+                  f"dtype_backend={dtype_backend}, "
+                  f"max_workers={max_workers}, "
+                  f"parse_cache={parse_cache}, "
+                  f"incremental={incremental}, "
+                  f"output_metadata={output_metadata}, "
+                  f"verify_input={verify_input}, "
+                  f"excel_sheets={excel_sheets}, "
+                  f"excel_excluded_sheets={excel_excluded_sheets}, "
+                  f"excel_engine={excel_engine}, "
+                  f"partition_rows={partition_rows}, "
+                  f"partition_column={partition_column}, "
+                  f"apply_backend={apply_backend}, "
+                  f"profile_path_segment={profile_path_segment}, "
+                  f"dataframe_backend={dataframe_backend}, "
+                  f"memory_map={memory_map}, "
+                  f"drop_duplicates={drop_duplicates}, "
+                  f"duplicate_columns={duplicate_columns})")
 
         super().__init__(
             input_path_segment=None,
@@ -63,7 +167,32 @@ class FeatureEngineering(Transformation):
             output_separator=output_separator,
             save_report_on_load=save_report_on_load,
             save_report_on_save=save_report_on_save,
-            report_type=report_type
+            report_type=report_type,
+            chunk_size=chunk_size,
+            input_columns=input_columns,
+            output_compression=output_compression,
+            schema=schema,
+            schema_path_segment=schema_path_segment,
+            optimize_memory=optimize_memory,
+            category_threshold=category_threshold,
+            csv_engine=csv_engine,
+            dtype_backend=dtype_backend,
+            max_workers=max_workers,
+            parse_cache=parse_cache,
+            incremental=incremental,
+            output_metadata=output_metadata,
+            verify_input=verify_input,
+            excel_sheets=excel_sheets,
+            excel_excluded_sheets=excel_excluded_sheets,
+            excel_engine=excel_engine,
+            partition_rows=partition_rows,
+            partition_column=partition_column,
+            apply_backend=apply_backend,
+            profile_path_segment=profile_path_segment,
+            dataframe_backend=dataframe_backend,
+            memory_map=memory_map,
+            drop_duplicates=drop_duplicates,
+            duplicate_columns=duplicate_columns
         )
 
         if save_report_on_load is None:
@@ -77,36 +206,52 @@ class FeatureEngineering(Transformation):
 
     def load(self):
         """
-        Load the CSV datasets in the input path list provided. Optionally, save
-        a report in the same path for each of them, with the same file name, but
-        with HTML extension.
+        Load the datasets in the input path list provided, in any of the formats
+        in `DatasetFormat`. Optionally, save a report in the same path for each
+        of them, with the same file name, but with HTML extension.
+
+        Datasets are read, and their reports saved, by up to `max_workers`
+        threads. `input_dfs` keeps the order of `input_path_segments`.
+
+        In streaming mode, only prepare the iterator of chunks in `input_chunks`,
+        going through the datasets one after the other.
+
+        If `drop_duplicates` is True, duplicated rows are dropped across all
+        the datasets, after their reports, if any, or as the chunks are read.
         """
 
         log.info("Load input datasets")
-        log.debug("Integration.load()")
+        log.debug("FeatureEngineering.load()")
 
         if self.input_path_segments is None:
             log.debug("- input path is none, nothing to load or report about")
             return
-        if not self.input_type_excel:
-            for input_path_segment in self.input_path_segments:
-                input_df = pd.read_csv(
-                    input_path_segment,
-                    sep=self.input_separator)
-                self.input_dfs.append(input_df)
-        else:
-            for input_path_segment in self.input_path_segments:
-                input_df = pd.concat(pd.read_excel(
-                    input_path_segment,
-                    header=0,
-                    sheet_name=None
-                ), ignore_index=True)
-                self.input_dfs.append(input_df)
+        if self.chunk_size is not None:
+            self.input_chunks = self.read_chunks(self.input_path_segments)
+            if self.drop_duplicates:
+                self.input_chunks = self.get_duplicate_filter().filter_chunks(self.input_chunks)
+            return
+
+        self.input_dfs = self.read_datasets(self.input_path_segments)
 
         if self.save_report_on_load:
-            for index, input_df in enumerate(self.input_dfs):
-                input_path_segment = self.input_path_segments[index]
-                self.save_report(input_df, input_path_segment)
+            with self.measure("load_report"):
+                self.save_reports(self.input_dfs, self.input_path_segments)
+        if self.drop_duplicates:
+            self.input_dfs = self.drop_duplicate_datasets(self.input_dfs, self.input_path_segments)
+
+    def get_input_path_segments(self) -> List:
+        """
+        Get the list of paths to the input datasets.
+
+        :return: list of paths to the input datasets.
+        :rtype: List
+        """
+
+        if self.input_path_segments is None:
+            return []
+
+        return self.input_path_segments
 
     def parse_arguments(self):
         """
@@ -116,6 +261,8 @@ class FeatureEngineering(Transformation):
         Parsed arguments are:
         - paths to the input CSV datasets, separated with spaces.
         - path to the output CSV dataset.
+        - optional arguments shared by every data processor, such as the CSV
+        engine.
         """
 
         log.info("Get integration arguments")
@@ -129,6 +276,7 @@ class FeatureEngineering(Transformation):
                                      help="path to the input CSV datasets")
         argument_parser.add_argument("-o", "--output_path", required=True,
                                      help="path to the output CSV dataset")
+        self.add_optional_arguments(argument_parser)
 
         arguments = argument_parser.parse_args()
         input_path_segments = arguments.input_paths
@@ -141,6 +289,7 @@ class FeatureEngineering(Transformation):
         self.output_path_segment = ArgumentParserHelper.parse_data_file_path(
             data_file_path=arguments.output_path,
             check_is_file=False)
+        self.parse_optional_arguments(arguments)
 
     def execute(self):
         """
@@ -152,7 +301,17 @@ class FeatureEngineering(Transformation):
 
         if len(sys.argv) > 1:
             self.parse_arguments()
-        self.load()
-        self.process()
-        self.save()
+        if self.incremental and self.is_up_to_date():
+            log.info("- output is up to date, nothing to execute")
+            return
+        self.metrics = {}
+        with self.measure("load"):
+            self.load()
+        with self.measure("process"):
+            self.process()
+        with self.measure("save"):
+            self.save()
         self.log_changes()
+        self.save_run_record()
+        if self.incremental:
+            self.save_fingerprint()
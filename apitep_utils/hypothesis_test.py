@@ -3,7 +3,6 @@ from enum import Enum
 from typing import List
 
 import pandas as pd
-from scipy.stats import kruskal, levene, pearsonr, ranksums, spearmanr, shapiro, chi2_contingency
 
 log = logging.getLogger(__name__)
 
@@ -144,6 +143,8 @@ class HypothesisTest:
         log.info("Execute Pearson test")
         log.debug("Tests.execute_pearson()")
 
+        from scipy.stats import pearsonr
+
         self.null_hypothesis_description = "Pearson's Null Hypothesis Description"
         self.alternative_hypothesis_description = "Pearson's Alternative Hypothesis Description"
 
@@ -159,6 +160,8 @@ class HypothesisTest:
         log.info("Execute Spearman test")
         log.debug("Tests.execute_spearman()")
 
+        from scipy.stats import spearmanr
+
         self.null_hypothesis_description = "Spearman's Null Hypothesis Description"
         self.alternative_hypothesis_description = "Spearman's Alternative Hypothesis Description"
 
@@ -174,6 +177,8 @@ class HypothesisTest:
         log.info("Execute Chi 2 test")
         log.debug("Tests.execute_chi2()")
 
+        from scipy.stats import chi2_contingency
+
         self.null_hypothesis_description = "There are no differences between the classes in the population"
         self.alternative_hypothesis_description = "There are differences between the classes in the population"
 
@@ -187,6 +192,8 @@ class HypothesisTest:
         log.info("Execute Levene test")
         log.debug("Tests.execute_levene()")
 
+        from scipy.stats import levene
+
         self.null_hypothesis_description = "The population variances are equal"
         self.alternative_hypothesis_description = "The population variances are not equal"
 
@@ -200,6 +207,8 @@ class HypothesisTest:
         log.info("Execute Shapiro test")
         log.debug("Tests.execute_shapiro()")
 
+        from scipy.stats import shapiro
+
         self.null_hypothesis_description = "The target variable is normally distributed"
         self.alternative_hypothesis_description = "The target variable is not normally distributed"
 
@@ -214,6 +223,8 @@ class HypothesisTest:
         log.info("Execute Kruskal Wallis test")
         log.debug("Tests.execute_kruskal_wallis()")
 
+        from scipy.stats import kruskal
+
         self.null_hypothesis_description = "The mean ranks of the groups are the same"
         self.alternative_hypothesis_description = "The mean ranks of the groups are not the same"
 
@@ -229,6 +240,8 @@ class HypothesisTest:
         log.info("Execute Wilcoxon rank-sum test")
         log.debug("Tests.execute_wilcoxon_rank_sum()")
 
+        from scipy.stats import ranksums
+
         self.null_hypothesis_description = "The populations have the same distribution"
         self.alternative_hypothesis_description = "The populations have not the same distribution"
 
@@ -1,10 +1,16 @@
 import argparse
+import itertools
 import logging
+import os
 import sys
-from typing import List
+from enum import Enum
+from typing import Dict, Iterator, List
 
+import numpy as np
 import pandas as pd
 from apitep_utils import ArgumentParserHelper
+from apitep_utils.dataset_schema import DatasetSchema
+from apitep_utils.parse_cache import ParseCache
 from apitep_utils.transformation import Transformation
 
 log = logging.getLogger(__name__)
@@ -13,10 +19,33 @@ log = logging.getLogger(__name__)
 class Integration(Transformation):
     """
     Integrate multiple datasets into a single one.
+
+    Either provide your own version of `process()`, or select one of the
+    built-in strategies with `strategy`:
+    - Concat: stack the datasets vertically, aligning their columns and types
+    (see `concat_datasets()`). In streaming mode, the chunks are aligned one
+    by one instead, never holding the datasets in memory (see `load()`).
+    - Join: join the datasets on `join_keys` (see `join_datasets()`).
+
+    The memory taken by the output dataset is estimated before integrating
+    the datasets, and checked against `max_output_bytes`, or the physical
+    memory of the machine.
     """
 
+    class Strategy(Enum):
+        Concat = "concat"
+        Join = "join"
+
+    JOIN_KEY = "__join_key"
+    JOIN_HOWS = ["inner", "left", "outer"]
+
     description: str = "Integration"
     input_path_segments: List = None
+    strategy: Strategy = None
+    join_keys: List = None
+    join_how: str = "inner"
+    max_output_bytes: int = None
+    scan_dtypes: bool = False
 
     input_dfs: List = []
 
@@ -29,6 +58,36 @@ class Integration(Transformation):
             save_report_on_load: bool = None,
             save_report_on_save: bool = None,
             report_type: Transformation.ReportType = None,
+            chunk_size: int = None,
+            input_columns: List = None,
+            output_compression: str = None,
+            schema: DatasetSchema = None,
+            schema_path_segment: str = None,
+            optimize_memory: bool = None,
+            category_threshold: float = None,
+            csv_engine: str = None,
+            dtype_backend: str = None,
+            max_workers: int = None,
+            parse_cache: ParseCache = None,
+            incremental: bool = None,
+            output_metadata: bool = None,
+            verify_input: bool = None,
+            excel_sheets: List = None,
+            excel_excluded_sheets: List = None,
+            excel_engine: str = None,
+            partition_rows: int = None,
+            partition_column: str = None,
+            apply_backend: Transformation.ApplyBackend = None,
+            profile_path_segment: str = None,
+            dataframe_backend: Transformation.DataFrameBackend = None,
+            memory_map: bool = None,
+            drop_duplicates: bool = None,
+            duplicate_columns: List = None,
+            strategy: Strategy = None,
+            join_keys: List = None,
+            join_how: str = None,
+            max_output_bytes: int = None,
+            scan_dtypes: bool = None
     ):
         """
         Init Integration class instance.
@@ -44,6 +103,69 @@ class Integration(Transformation):
         Optional.
         :param report_type: control the type of the report saved if
         save_report_on_load or save_report_on_save are True. Optional.
+        :param chunk_size: number of rows per chunk. If present, the datasets
+        are streamed in chunks of this size instead of loaded at once. Optional.
+        :param input_columns: list of the columns to read from each input
+        dataset. If not present, all of them are read. Optional.
+        :param output_compression: compression codec for the output dataset,
+        such as "snappy", "zstd" or "lz4" for Parquet, Feather or Arrow IPC, or
+        "gzip", "bz2", "xz" or "zstd" for CSV. Optional.
+        :param schema: schema used to load the input datasets. Optional.
+        :param schema_path_segment: path to a JSON file with the schema used to
+        load the input datasets. Optional.
+        :param optimize_memory: downcast the columns of the input datasets to
+        save memory if True. Optional.
+        :param category_threshold: maximum ratio of unique values to rows for a
+        text column to be converted to categorical when optimizing memory.
+        Optional.
+        :param csv_engine: parser used to read CSV datasets: "c", "python" or
+        "pyarrow". The last one is multithreaded. Optional.
+        :param dtype_backend: backend of the types of the loaded datasets:
+        "numpy_nullable" or "pyarrow". Optional.
+        :param max_workers: maximum number of datasets loaded, reports saved,
+        CSV output batches compressed, or partitions processed, at the same
+        time. Optional.
+        :param parse_cache: cache of parsed CSV and Excel datasets. Optional.
+        :param incremental: skip the execution if neither the inputs, nor the
+        parameters, nor the code changed since the last one, and the output
+        still exists, if True. Optional.
+        :param output_metadata: save the number of rows and the checksum of the
+        output dataset next to it if True. Optional.
+        :param verify_input: check the number of rows and the checksum of the
+        input datasets against the metadata saved next to them, if any, if
+        True. Optional.
+        :param excel_sheets: names of the sheets to read from Excel datasets.
+        If not present, all of them are read. Optional.
+        :param excel_excluded_sheets: names of the sheets not to read from
+        Excel datasets. Optional.
+        :param excel_engine: engine used to read Excel datasets, any of those
+        `pandas.read_excel()` accepts, such as "openpyxl" or "odf". Optional.
+        :param partition_rows: number of rows per partition, to process the
+        dataset in up to `max_workers` processes. Optional.
+        :param partition_column: column whose groups of rows are never split
+        between partitions. Optional.
+        :param apply_backend: how `apply()` runs functions that cannot be
+        vectorized. Optional.
+        :param profile_path_segment: folder where a profile of each phase is
+        saved, if present. Optional.
+        :param dataframe_backend: library the datasets are loaded with, and
+        `process()` works with: pandas or Polars. Optional.
+        :param memory_map: save Feather and Arrow IPC datasets uncompressed,
+        and load them by mapping them in memory, if True. Optional.
+        :param drop_duplicates: drop duplicated rows on load, across all the
+        datasets, if True. Optional.
+        :param duplicate_columns: columns the rows are compared by to find
+        duplicates. Defaults to all of them. Optional.
+        :param strategy: built-in strategy used to integrate the datasets, if
+        `process()` is not overridden. Optional.
+        :param join_keys: columns the datasets are joined on with the Join
+        strategy. Optional.
+        :param join_how: type of join: "inner", "left" or "outer". Optional.
+        :param max_output_bytes: maximum estimated size of the output dataset
+        of the built-in strategies. Defaults to the physical memory. Optional.
+        :param scan_dtypes: read every CSV dataset whole, before streaming it
+        with the Concat strategy, to get the types of its columns, if True.
+        Optional.
         """
 
         log.info("Init Integration")
@@ -54,7 +176,37 @@ class Integration(Transformation):
                   f"output_separator={output_separator}, "
                   f"save_report_on_load={save_report_on_load}, "
                   f"save_report_on_save={save_report_on_save}, "
-                  f"report_type={report_type})")
+                  f"report_type={report_type}, "
+                  f"chunk_size={chunk_size}, "
+                  f"input_columns={input_columns}, "
+                  f"output_compression={output_compression}, "
+                  f"schema={schema}, "
+                  f"schema_path_segment={schema_path_segment}, "
+                  f"optimize_memory={optimize_memory}, "
+                  f"category_threshold={category_threshold}, "
+                  f"csv_engine={csv_engine}, "
+                  f"dtype_backend={dtype_backend}, "
+                  f"max_workers={max_workers}, "
+                  f"parse_cache={parse_cache}, "
+                  f"incremental={incremental}, "
+                  f"output_metadata={output_metadata}, "
+                  f"verify_input={verify_input}, "
+                  f"excel_sheets={excel_sheets}, "
+                  f"excel_excluded_sheets={excel_excluded_sheets}, "
+                  f"excel_engine={excel_engine}, "
+                  f"partition_rows={partition_rows}, "
+                  f"partition_column={partition_column}, "
+                  f"apply_backend={apply_backend}, "
+                  f"profile_path_segment={profile_path_segment}, "
+                  f"dataframe_backend={dataframe_backend}, "
+                  f"memory_map={memory_map}, "
+                  f"drop_duplicates={drop_duplicates}, "
+                  f"duplicate_columns={duplicate_columns}, "
+                  f"strategy={strategy}, "
+                  f"join_keys={join_keys}, "
+                  f"join_how={join_how}, "
+                  f"max_output_bytes={max_output_bytes}, "
+                  f"scan_dtypes={scan_dtypes})")
 
         super().__init__(
             input_path_segment=None,
@@ -63,7 +215,32 @@ class Integration(Transformation):
             output_separator=output_separator,
             save_report_on_load=save_report_on_load,
             save_report_on_save=save_report_on_save,
-            report_type=report_type
+            report_type=report_type,
+            chunk_size=chunk_size,
+            input_columns=input_columns,
+            output_compression=output_compression,
+            schema=schema,
+            schema_path_segment=schema_path_segment,
+            optimize_memory=optimize_memory,
+            category_threshold=category_threshold,
+            csv_engine=csv_engine,
+            dtype_backend=dtype_backend,
+            max_workers=max_workers,
+            parse_cache=parse_cache,
+            incremental=incremental,
+            output_metadata=output_metadata,
+            verify_input=verify_input,
+            excel_sheets=excel_sheets,
+            excel_excluded_sheets=excel_excluded_sheets,
+            excel_engine=excel_engine,
+            partition_rows=partition_rows,
+            partition_column=partition_column,
+            apply_backend=apply_backend,
+            profile_path_segment=profile_path_segment,
+            dataframe_backend=dataframe_backend,
+            memory_map=memory_map,
+            drop_duplicates=drop_duplicates,
+            duplicate_columns=duplicate_columns
         )
 
         if input_path_segments is not None:
@@ -74,12 +251,36 @@ class Integration(Transformation):
             self.save_report_on_save = True
         if report_type is None:
             self.report_type = Transformation.ReportType.Advanced
+        if strategy is not None:
+            self.strategy = strategy
+        if join_keys is not None:
+            self.join_keys = join_keys
+        if join_how is not None:
+            self.join_how = join_how
+        if max_output_bytes is not None:
+            self.max_output_bytes = max_output_bytes
+        if scan_dtypes is not None:
+            self.scan_dtypes = scan_dtypes
 
     def load(self):
         """
-        Load the CSV datasets in the input path list provided. Optionally, save
-        a report in the same path for each of them, with the same file name, but
-        with HTML extension.
+        Load the datasets in the input path list provided, in any of the formats
+        in `DatasetFormat`. Optionally, save a report in the same path for each
+        of them, with the same file name, but with HTML extension.
+
+        Datasets are read, and their reports saved, by up to `max_workers`
+        threads. `input_dfs` keeps the order of `input_path_segments`.
+
+        In streaming mode, only prepare the iterator of chunks in `input_chunks`,
+        going through the datasets one after the other. With the Concat
+        strategy, the chunks are aligned to the schema unifying those of every
+        dataset (see `get_unified_dtypes()`), so datasets with different
+        columns, or types, are stacked without loading them. The types are
+        widened if a later chunk does not fit them (see `align_chunks()`).
+
+        If `drop_duplicates` is True, duplicated rows are dropped across all
+        the datasets, after their reports, if any, or as the chunks are read,
+        once aligned.
         """
 
         log.info("Load input datasets")
@@ -88,40 +289,621 @@ class Integration(Transformation):
         if self.input_path_segments is None:
             log.debug("- input path is none, nothing to load or report about")
             return
-        if not self.input_type_excel:
-            for input_path_segment in self.input_path_segments:
-                input_df = pd.read_csv(
-                    input_path_segment,
-                    sep=self.input_separator)
-                self.input_dfs.append(input_df)
-        else:
-            for input_path_segment in self.input_path_segments:
-                input_df = pd.concat(pd.read_excel(
-                    input_path_segment,
-                    header=0,
-                    sheet_name=None
-                ), ignore_index=True)
-                self.input_dfs.append(input_df)
+        if self.chunk_size is not None:
+            self.input_chunks = self.read_chunks(self.input_path_segments)
+            if self.strategy == Integration.Strategy.Concat:
+                self.input_chunks = self.align_chunks(self.input_chunks, self.get_unified_dtypes())
+            if self.drop_duplicates:
+                self.input_chunks = self.get_duplicate_filter().filter_chunks(self.input_chunks)
+            return
+
+        self.input_dfs = self.read_datasets(self.input_path_segments)
 
         if self.save_report_on_load:
-            for index, input_df in enumerate(self.input_dfs):
-                input_path_segment = self.input_path_segments[index]
-                self.save_report(input_df, input_path_segment)
+            with self.measure("load_report"):
+                self.save_reports(self.input_dfs, self.input_path_segments)
+        if self.drop_duplicates:
+            self.input_dfs = self.drop_duplicate_datasets(self.input_dfs, self.input_path_segments)
 
     def process(self):
         """
-        Combine all the datasets in input_dfs into one.
+        Combine all the datasets in input_dfs into one, with the built-in
+        strategy selected in `strategy`.
 
         Provide your own version of this method if needed. Make sure to use
         `input_dfs` as the input of your pipeline, and to store the resulting
         dataset in `output_df`.
+
+        In streaming mode, the chunks of all the datasets are appended one after
+        the other on save, so there is nothing to do here. In partitioned mode,
+        the datasets are stacked, then processed by `process_chunk()`, one
+        partition per process.
         """
 
         log.info("Process dataset")
         log.debug("Integration.process()")
 
+        if self.chunk_size is not None:
+            log.debug("- streaming mode, chunks will be processed on save")
+            return
+        if self.is_partitioned():
+            self.output_df = self.process_partitioned(pd.concat(self.input_dfs, ignore_index=True))
+            return
+        if self.strategy == Integration.Strategy.Concat:
+            self.output_df = self.concat_datasets(self.input_dfs)
+            return
+        if self.strategy == Integration.Strategy.Join:
+            self.output_df = self.join_datasets(self.input_dfs)
+            return
+
         raise NotImplementedError
 
+    def concat_datasets(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Stack the dataframes provided vertically, after aligning their schemas
+        (see `align_schemas()`). Columns missing in a dataframe are filled with
+        missing values.
+
+        Polars dataframes are concatenated lazily, with their types relaxed to
+        a common one.
+
+        :param dataframes: list of dataframes to concatenate.
+        :return: concatenated dataframe.
+        :rtype: pd.DataFrame
+        """
+
+        log.info("Concatenate datasets")
+        log.debug(f"Integration.concat_datasets("
+                  f"dataframes={len(dataframes)})")
+
+        if any(self.is_polars(dataframe) for dataframe in dataframes):
+            import polars as pl
+
+            return pl.concat(
+                [self.to_polars(dataframe) for dataframe in dataframes],
+                how="diagonal_relaxed")
+
+        aligned_dfs = self.align_schemas(dataframes)
+        self.check_output_memory(
+            sum(len(dataframe.index) for dataframe in aligned_dfs),
+            sum(int(dataframe.memory_usage(index=False, deep=True).sum()) for dataframe in aligned_dfs))
+
+        return pd.concat(aligned_dfs, ignore_index=True)
+
+    @staticmethod
+    def align_schemas(dataframes: List[pd.DataFrame]) -> List[pd.DataFrame]:
+        """
+        Cast the columns of the dataframes provided to types they can be
+        concatenated with, without losing information:
+        - categorical columns get the union of the categories of every
+        dataframe, so they are not converted to text.
+        - integer and boolean columns missing in some of the dataframes get
+        nullable types, so they are not converted to floats or text.
+        Only the columns cast are copied.
+
+        :param dataframes: list of dataframes to align.
+        :return: list of aligned dataframes.
+        :rtype: List[pd.DataFrame]
+        """
+
+        columns = list(dict.fromkeys(
+            column
+            for dataframe in dataframes
+            for column in dataframe.columns))
+
+        dtypes = {}
+        for column in columns:
+            column_series = [dataframe[column] for dataframe in dataframes if column in dataframe.columns]
+            complete = len(column_series) == len(dataframes)
+            if all(isinstance(series.dtype, pd.CategoricalDtype) for series in column_series):
+                categories = column_series[0].cat.categories
+                for series in column_series[1:]:
+                    categories = categories.union(series.cat.categories, sort=False)
+                dtypes[column] = pd.CategoricalDtype(categories)
+            elif complete or any(isinstance(series.dtype, pd.api.extensions.ExtensionDtype) for series in column_series):
+                continue
+            elif all(pd.api.types.is_bool_dtype(series) for series in column_series):
+                dtypes[column] = pd.BooleanDtype()
+            elif all(pd.api.types.is_integer_dtype(series) for series in column_series):
+                dtypes[column] = pd.Int64Dtype()
+
+        aligned_dfs = []
+        for dataframe in dataframes:
+            dataframe_dtypes = {
+                column: dtype
+                for column, dtype in dtypes.items()
+                if column in dataframe.columns and dataframe[column].dtype != dtype
+            }
+            if dataframe_dtypes:
+                dataframe = dataframe.astype(dataframe_dtypes, copy=False)
+            aligned_dfs.append(dataframe)
+
+        return aligned_dfs
+
+    def get_unified_dtypes(self) -> Dict:
+        """
+        Get the columns, and their types, of the union of the datasets in
+        `input_path_segments`, without loading them. The types of Parquet,
+        Feather and Arrow IPC datasets are read from their metadata, and those
+        of CSV datasets from their first chunk, read as `read_chunks()` does.
+        Their schemas, if any, are applied as well.
+
+        If `scan_dtypes` is True, CSV datasets are read whole instead, one
+        chunk at a time, keeping only the types of each chunk, so a value
+        found late in a file, such as a float in a column of integers, is
+        taken into account before any chunk is written. This reads each CSV
+        dataset twice, so it is only needed for outputs whose types cannot
+        change once written, such as Parquet, Feather or Arrow IPC datasets.
+
+        :return: dictionary with the type of each column, in the order they
+        are first found.
+        :rtype: Dict
+        """
+
+        log.info("Get unified schema of input datasets")
+        log.debug("Integration.get_unified_dtypes()")
+
+        unified_dtypes = self.unify_dtypes([
+            self.__read_dtypes(input_path_segment)
+            for input_path_segment in self.input_path_segments
+        ])
+        log.debug(f"- columns: {len(unified_dtypes)}")
+
+        return unified_dtypes
+
+    def __read_dtypes(self, input_path_segment: str) -> pd.Series:
+        """
+        Read the types of the columns of the dataset in the path provided, as
+        `read_chunks()` would load them, from its first chunk or, if
+        `scan_dtypes` is True, unified across all its chunks.
+
+        :param input_path_segment: path to the dataset.
+        :return: type of each column.
+        :rtype: pd.Series
+        """
+
+        log.debug(f"Integration.__read_dtypes("
+                  f"input_path_segment={input_path_segment})")
+
+        dataset_format = self.get_input_dataset_format(input_path_segment)
+        schema = self.get_schema(input_path_segment)
+        read_arguments = self.get_read_arguments(schema)
+
+        if dataset_format == Integration.DatasetFormat.CSV:
+            chunks = self.read_dataset_chunks(input_path_segment)
+            if self.scan_dtypes:
+                dtypes_list = [chunk.dtypes for chunk in chunks]
+            else:
+                dtypes_list = [chunk.dtypes for chunk in itertools.islice(chunks, 1)]
+                chunks.close()
+            if dtypes_list:
+                return pd.Series(self.unify_dtypes(dtypes_list), dtype=object)
+            sample_df = pd.read_csv(
+                input_path_segment,
+                sep=self.input_separator,
+                usecols=read_arguments["columns"],
+                dtype=read_arguments["dtypes"],
+                nrows=0,
+                **self.get_backend_arguments())
+        else:
+            import pyarrow as pa
+
+            if dataset_format == Integration.DatasetFormat.Parquet:
+                import pyarrow.parquet as pq
+
+                arrow_schema = pq.read_schema(input_path_segment)
+            else:
+                with pa.memory_map(input_path_segment) as source:
+                    arrow_schema = pa.ipc.open_file(source).schema
+            table = arrow_schema.empty_table()
+            if read_arguments["columns"] is not None:
+                table = table.select(read_arguments["columns"])
+            sample_df = table.to_pandas()
+        if schema is not None:
+            sample_df = schema.apply(sample_df)
+
+        return sample_df.dtypes
+
+    @staticmethod
+    def unify_dtypes(dtypes_list: List[pd.Series]) -> Dict:
+        """
+        Unify the types of the columns of several datasets into types every
+        chunk of them can be cast to, without losing information:
+        - categorical columns get the union of the categories.
+        - integer and boolean columns get nullable types, since any chunk may
+        miss values, or the whole column.
+        - integer columns found as floats in any dataset are floats.
+        - columns with any other mix of types are objects.
+
+        :param dtypes_list: list with the type of each column of each dataset.
+        :return: dictionary with the type of each column, in the order they
+        are first found.
+        :rtype: Dict
+        """
+
+        column_dtypes = {}
+        for dtypes in dtypes_list:
+            for column, dtype in dtypes.items():
+                column_dtypes.setdefault(column, []).append(dtype)
+
+        unified_dtypes = {}
+        for column, dtypes in column_dtypes.items():
+            if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+                categories = dtypes[0].categories
+                for dtype in dtypes[1:]:
+                    categories = categories.union(dtype.categories, sort=False)
+                unified_dtypes[column] = pd.CategoricalDtype(categories)
+            elif all(pd.api.types.is_bool_dtype(dtype) for dtype in dtypes):
+                unified_dtypes[column] = pd.BooleanDtype()
+            elif all(pd.api.types.is_integer_dtype(dtype) for dtype in dtypes):
+                unified_dtypes[column] = pd.Int64Dtype()
+            elif all(pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype) for dtype in dtypes):
+                unified_dtypes[column] = np.dtype("float64")
+            elif all(dtype == dtypes[0] for dtype in dtypes):
+                unified_dtypes[column] = dtypes[0]
+            else:
+                unified_dtypes[column] = np.dtype("object")
+
+        return unified_dtypes
+
+    @staticmethod
+    def align_chunks(chunks: Iterator[pd.DataFrame], dtypes: Dict) -> Iterator[pd.DataFrame]:
+        """
+        Align each chunk to the columns and types provided: columns are
+        reordered, missing ones are filled with missing values, and those of
+        other types are cast. Only one chunk is held at a time.
+
+        If a column of a chunk cannot be cast to the type provided without
+        losing information, such as a float in a column of integers, the type
+        is widened (see `unify_dtypes()`) for that chunk and the following
+        ones. Chunks already aligned keep the narrower type, which does not
+        matter to CSV outputs, but does to columnar ones.
+
+        :param chunks: iterator over the chunks of the datasets.
+        :param dtypes: dictionary with the type of each column.
+        :return: iterator over the aligned chunks.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        dtypes = dict(dtypes)
+        for chunk in chunks:
+            columns = {}
+            for column, dtype in dtypes.items():
+                if column not in chunk.columns:
+                    columns[column] = pd.Series(index=chunk.index, dtype=dtype)
+                    continue
+                if chunk[column].dtype != dtype:
+                    unified_dtype = Integration.unify_dtypes([
+                        pd.Series({column: dtype}, dtype=object),
+                        pd.Series({column: chunk[column].dtype}, dtype=object)])[column]
+                    if unified_dtype != dtype:
+                        log.warning(f"- type of column {column} widened from {dtype} to {unified_dtype}, "
+                                    f"set scan_dtypes to get it before writing columnar datasets")
+                        dtypes[column] = dtype = unified_dtype
+                if chunk[column].dtype != dtype:
+                    columns[column] = chunk[column].astype(dtype)
+                else:
+                    columns[column] = chunk[column]
+            yield pd.DataFrame(columns, index=chunk.index, copy=False)
+
+    def join_datasets(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Join the dataframes provided on `join_keys`, with the type of join in
+        `join_how`. Other columns found in more than one dataframe are renamed,
+        adding the position of their dataframe, starting with 1, e.g. "Fare_2".
+
+        The keys are coded as integers, shared by every dataframe, so the joins
+        compare integers only. Then, the order of the joins is planned from the
+        number of rows of each key in each dataframe, joining first those
+        giving the smallest intermediate results. Left joins always start with
+        the first dataframe. The rows of the output are then estimated, and
+        their memory checked, before joining anything.
+
+        If every dataframe is sorted by its keys, they are joined with a
+        sorted merge, and so is the output. Otherwise, rows are not in any
+        particular order.
+
+        Polars dataframes are joined lazily, leaving the plan to Polars.
+
+        :param dataframes: list of dataframes to join.
+        :return: joined dataframe, with the keys first.
+        :rtype: pd.DataFrame
+        """
+
+        log.info("Join datasets")
+        log.debug(f"Integration.join_datasets("
+                  f"dataframes={len(dataframes)})")
+
+        if not self.join_keys:
+            log.error("- join keys are needed to join datasets")
+            raise ValueError("join keys are needed to join datasets")
+        if self.join_how not in Integration.JOIN_HOWS:
+            log.error(f"- unknown join \"{self.join_how}\"")
+            raise ValueError(f"unknown join \"{self.join_how}\", expected one of {', '.join(Integration.JOIN_HOWS)}")
+
+        if any(self.is_polars(dataframe) for dataframe in dataframes):
+            return self.__join_polars(dataframes)
+
+        keyed_dfs, key_values = self.encode_join_keys(dataframes)
+        order, rows = self.plan_joins(keyed_dfs, len(key_values.index))
+        log.debug(f"- join order: {order}")
+
+        row_bytes = [
+            int(keyed_df.memory_usage(index=False, deep=True).sum()) / max(len(keyed_df.index), 1)
+            for keyed_df in keyed_dfs
+        ]
+        step_bytes = [
+            int(step_rows * (8 + sum(row_bytes[index] for index in order[:step + 1])))
+            for step, step_rows in enumerate(rows)
+        ]
+        self.check_output_memory(rows[-1], max(step_bytes))
+
+        sorted_merge = all(keyed_df.index.is_monotonic_increasing for keyed_df in keyed_dfs)
+        log.debug(f"- sorted merge: {sorted_merge}")
+        self.metrics.setdefault("process", {}).update({
+            "join_order": order,
+            "sorted_merge": sorted_merge
+        })
+
+        output_df = keyed_dfs[order[0]]
+        for index in order[1:]:
+            if sorted_merge:
+                output_df = output_df.join(keyed_dfs[index], how=self.join_how, sort=True)
+            else:
+                output_df = pd.merge(
+                    output_df,
+                    keyed_dfs[index],
+                    how=self.join_how,
+                    left_index=True,
+                    right_index=True)
+
+        codes = output_df.index.to_numpy()
+        output_columns = {
+            key: key_values[key].take(codes).array
+            for key in self.join_keys
+        }
+        for keyed_df in keyed_dfs:
+            for column in keyed_df.columns:
+                output_columns[column] = output_df[column].array
+
+        return pd.DataFrame(output_columns, index=pd.RangeIndex(len(codes)), copy=False)
+
+    def get_join_column_names(self, dataframe_columns: List[List]) -> List[Dict]:
+        """
+        Get the new name of the columns, other than the keys, found in more
+        than one of the dataframes to join: the name followed by the position
+        of its dataframe, starting with 1.
+
+        :param dataframe_columns: list of the columns of each dataframe.
+        :return: list of dictionaries with the new name of each column.
+        :rtype: List[Dict]
+        """
+
+        occurrences = {}
+        for columns in dataframe_columns:
+            for column in columns:
+                if column not in self.join_keys:
+                    occurrences[column] = occurrences.get(column, 0) + 1
+
+        return [
+            {
+                column: f"{column}_{position + 1}"
+                for column in columns
+                if occurrences.get(column, 0) > 1
+            }
+            for position, columns in enumerate(dataframe_columns)
+        ]
+
+    def encode_join_keys(self, dataframes: List[pd.DataFrame]) -> tuple:
+        """
+        Code the values of `join_keys` of the dataframes provided as integers,
+        sorted as the values are, and shared by every dataframe. Several keys
+        are coded as a single integer, coded again after adding each key, so
+        it never overflows. Missing values are coded too, so they match each
+        other, as pandas does.
+
+        :param dataframes: list of dataframes to join.
+        :return: list of dataframes indexed by the code of their keys, without
+        the key columns, and dataframe with the key values of each code.
+        :rtype: tuple
+        """
+
+        log.debug("Integration.encode_join_keys()")
+
+        keys_df = pd.concat([dataframe[self.join_keys] for dataframe in dataframes], ignore_index=True)
+        codes = np.zeros(len(keys_df.index), dtype=np.int64)
+        for key in self.join_keys:
+            key_codes, key_uniques = pd.factorize(keys_df[key], sort=True, use_na_sentinel=False)
+            # Coded again after each key, so codes stay below rows squared
+            codes, _ = pd.factorize(codes * len(key_uniques) + key_codes, sort=True)
+
+        _, first_positions = np.unique(codes, return_index=True)
+        key_values = keys_df.iloc[first_positions].reset_index(drop=True)
+
+        column_names = self.get_join_column_names([list(dataframe.columns) for dataframe in dataframes])
+        keyed_dfs = []
+        start = 0
+        for dataframe, names in zip(dataframes, column_names):
+            end = start + len(dataframe.index)
+            keyed_dfs.append(pd.DataFrame(
+                {
+                    names.get(column, column): dataframe[column].array
+                    for column in dataframe.columns
+                    if column not in self.join_keys
+                },
+                index=pd.Index(codes[start:end], name=Integration.JOIN_KEY),
+                copy=False))
+            start = end
+
+        return keyed_dfs, key_values
+
+    def plan_joins(self, keyed_dfs: List[pd.DataFrame], groups: int) -> tuple:
+        """
+        Plan the order of the joins of the dataframes provided, greedily: the
+        next dataframe joined is the one giving the fewest rows. The rows of
+        each join are computed from the number of rows of each key in each
+        dataframe, without joining them.
+
+        :param keyed_dfs: list of dataframes indexed by the code of their keys.
+        :param groups: number of different keys.
+        :return: positions of the dataframes, in the order they should be
+        joined, and rows after each join, starting with the first dataframe.
+        :rtype: tuple
+        """
+
+        log.debug("Integration.plan_joins()")
+
+        counts = [
+            np.bincount(keyed_df.index.to_numpy(), minlength=groups)
+            for keyed_df in keyed_dfs
+        ]
+        remaining = list(range(len(keyed_dfs)))
+        if self.join_how == "left":
+            first = 0
+        else:
+            first = min(remaining, key=lambda index: len(keyed_dfs[index].index))
+        order = [first]
+        remaining.remove(first)
+        current_counts = counts[first]
+        rows = [int(current_counts.sum())]
+
+        while remaining:
+            candidate_counts = {
+                index: self.__join_counts(current_counts, counts[index])
+                for index in remaining
+            }
+            best = min(remaining, key=lambda index: candidate_counts[index].sum())
+            order.append(best)
+            remaining.remove(best)
+            current_counts = candidate_counts[best]
+            rows.append(int(current_counts.sum()))
+
+        return order, rows
+
+    def __join_counts(self, left_counts: np.ndarray, right_counts: np.ndarray) -> np.ndarray:
+        """
+        Get the number of rows of each key after joining two dataframes with
+        the number of rows of each key provided.
+
+        :param left_counts: rows of each key in the left dataframe.
+        :param right_counts: rows of each key in the right dataframe.
+        :return: rows of each key in the joined dataframe.
+        :rtype: np.ndarray
+        """
+
+        if self.join_how == "inner":
+            return left_counts * right_counts
+        if self.join_how == "left":
+            return left_counts * np.maximum(right_counts, 1)
+
+        return np.where(
+            (left_counts > 0) & (right_counts > 0),
+            left_counts * right_counts,
+            left_counts + right_counts)
+
+    def __join_polars(self, dataframes: List):
+        """
+        Join the dataframes provided on `join_keys` as Polars lazy frames, in
+        the order provided, renaming repeated columns as `join_datasets()`
+        does. Unlike pandas, missing keys do not match each other.
+
+        :param dataframes: list of dataframes to join.
+        :return: joined Polars lazy frame.
+        :rtype: pl.LazyFrame
+        """
+
+        lazy_frames = [self.to_polars(dataframe) for dataframe in dataframes]
+        column_names = self.get_join_column_names([
+            lazy_frame.collect_schema().names()
+            for lazy_frame in lazy_frames
+        ])
+        lazy_frames = [
+            lazy_frame.rename(names)
+            for lazy_frame, names in zip(lazy_frames, column_names)
+        ]
+
+        how = {"outer": "full"}.get(self.join_how, self.join_how)
+        output_frame = lazy_frames[0]
+        for lazy_frame in lazy_frames[1:]:
+            output_frame = output_frame.join(
+                lazy_frame,
+                on=self.join_keys,
+                how=how,
+                coalesce=True)
+
+        return output_frame
+
+    def check_output_memory(self, rows: int, estimated_bytes: int):
+        """
+        Check the memory the output dataset is estimated to take against
+        `max_output_bytes`, or, if not present, the physical memory. The
+        estimate is stored in `metrics["process"]`.
+
+        :param rows: estimated rows of the output dataset.
+        :param estimated_bytes: estimated bytes of the output dataset, or of
+        the largest intermediate result.
+        """
+
+        log.debug(f"Integration.check_output_memory("
+                  f"rows={rows}, "
+                  f"estimated_bytes={estimated_bytes})")
+
+        self.metrics.setdefault("process", {}).update({
+            "estimated_output_rows": rows,
+            "estimated_output_bytes": estimated_bytes
+        })
+
+        max_output_bytes = self.max_output_bytes
+        if max_output_bytes is None:
+            max_output_bytes = Integration.get_physical_memory()
+        if max_output_bytes is not None and estimated_bytes > max_output_bytes:
+            log.error(f"- estimated output of {estimated_bytes} bytes exceeds {max_output_bytes} bytes")
+            raise MemoryError(f"estimated output of {estimated_bytes} bytes exceeds {max_output_bytes} bytes")
+
+    @staticmethod
+    def get_physical_memory() -> int:
+        """
+        Get the physical memory of the machine.
+
+        :return: physical memory, in bytes, or None if it is not available in
+        this platform.
+        :rtype: int
+        """
+
+        try:
+            return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            return None
+
+    def process_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Keep each chunk as it is, so the datasets are stacked vertically in
+        streaming and partitioned modes.
+
+        Provide your own version of this method if needed.
+
+        :param chunk: chunk of one of the input datasets.
+        :return: chunk of the output dataset.
+        :rtype: pd.DataFrame
+        """
+
+        log.debug("Integration.process_chunk()")
+
+        return chunk
+
+    def get_input_path_segments(self) -> List:
+        """
+        Get the list of paths to the input datasets.
+
+        :return: list of paths to the input datasets.
+        :rtype: List
+        """
+
+        if self.input_path_segments is None:
+            return []
+
+        return self.input_path_segments
+
     def parse_arguments(self):
         """
         Parse arguments provided via command line, and check if they are valid
@@ -130,6 +912,8 @@ class Integration(Transformation):
         Parsed arguments are:
         - paths to the input CSV datasets, separated with spaces.
         - path to the output CSV dataset.
+        - optional arguments shared by every data processor, such as the CSV
+        engine.
         """
 
         log.info("Get integration arguments")
@@ -143,6 +927,18 @@ class Integration(Transformation):
                                      help="path to the input CSV datasets")
         argument_parser.add_argument("-o", "--output_path", required=True,
                                      help="path to the output CSV dataset")
+        argument_parser.add_argument("--strategy",
+                                     choices=[strategy.value for strategy in Integration.Strategy],
+                                     help="built-in strategy used to integrate the datasets")
+        argument_parser.add_argument("--join_keys", nargs="+",
+                                     help="columns the datasets are joined on")
+        argument_parser.add_argument("--join_how", choices=Integration.JOIN_HOWS,
+                                     help="type of join")
+        argument_parser.add_argument("--max_output_bytes", type=int,
+                                     help="maximum estimated size of the output dataset")
+        argument_parser.add_argument("--scan_dtypes", action="store_true", default=None,
+                                     help="read the CSV datasets whole to get their types before streaming them")
+        self.add_optional_arguments(argument_parser)
 
         arguments = argument_parser.parse_args()
         input_path_segments = arguments.input_paths
@@ -155,6 +951,17 @@ class Integration(Transformation):
         self.output_path_segment = ArgumentParserHelper.parse_data_file_path(
             data_file_path=arguments.output_path,
             check_is_file=False)
+        self.parse_optional_arguments(arguments)
+        if arguments.strategy is not None:
+            self.strategy = Integration.Strategy(arguments.strategy)
+        if arguments.join_keys is not None:
+            self.join_keys = arguments.join_keys
+        if arguments.join_how is not None:
+            self.join_how = arguments.join_how
+        if arguments.max_output_bytes is not None:
+            self.max_output_bytes = arguments.max_output_bytes
+        if arguments.scan_dtypes is not None:
+            self.scan_dtypes = arguments.scan_dtypes
 
     def execute(self):
         """
@@ -166,7 +973,17 @@ class Integration(Transformation):
 
         if len(sys.argv) > 1:
             self.parse_arguments()
-        self.load()
-        self.process()
-        self.save()
+        if self.incremental and self.is_up_to_date():
+            log.info("- output is up to date, nothing to execute")
+            return
+        self.metrics = {}
+        with self.measure("load"):
+            self.load()
+        with self.measure("process"):
+            self.process()
+        with self.measure("save"):
+            self.save()
         self.log_changes()
+        self.save_run_record()
+        if self.incremental:
+            self.save_fingerprint()
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """
+    Local on-disk cache of parsed datasets.
+
+    Each entry is identified by the identity of the source file (path, size,
+    modification time and, optionally, a hash of its contents) and by the
+    options used to parse it. Entries are stored as Arrow IPC (Feather) files,
+    much faster to load than CSV or Excel.
+
+    When the cache grows over `max_bytes`, the least recently used entries are
+    evicted. Use `invalidate()` to remove the entries of a source file, or all
+    of them.
+    """
+
+    DATA_SUFFIX = ".feather"
+    METADATA_SUFFIX = ".json"
+
+    cache_path_segment: str = ".parse_cache"
+    max_bytes: int = 4 * 2 ** 30
+    hash_content: bool = False
+
+    def __init__(
+            self,
+            cache_path_segment: str = None,
+            max_bytes: int = None,
+            hash_content: bool = None
+    ):
+        """
+        Init ParseCache class instance.
+
+        :param cache_path_segment: folder where the entries are stored. It is
+        created if it does not exist. Optional.
+        :param max_bytes: maximum size of the cache, in bytes. Optional.
+        :param hash_content: include a hash of the contents of the source files
+        in their identity if True. Slower, but safe against files changed
+        without changing their size or modification time. Optional.
+        """
+
+        log.info("Init parse cache")
+        log.debug(f"ParseCache.__init__("
+                  f"cache_path_segment={cache_path_segment}, "
+                  f"max_bytes={max_bytes}, "
+                  f"hash_content={hash_content})")
+
+        if cache_path_segment is not None:
+            self.cache_path_segment = cache_path_segment
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if hash_content is not None:
+            self.hash_content = hash_content
+
+        Path(self.cache_path_segment).mkdir(parents=True, exist_ok=True)
+
+    def get_key(self, source_path_segment: str, options: dict) -> str:
+        """
+        Get the key of the entry for the source file and options provided.
+
+        :param source_path_segment: path to the source file.
+        :param options: options used to parse the source file.
+        :return: key of the entry.
+        :rtype: str
+        """
+
+        log.debug(f"ParseCache.get_key("
+                  f"source_path_segment={source_path_segment}, "
+                  f"options={options})")
+
+        source_path = Path(source_path_segment).resolve()
+        source_stat = source_path.stat()
+        identity = {
+            "path": str(source_path),
+            "size": source_stat.st_size,
+            "mtime": source_stat.st_mtime_ns,
+            "options": options
+        }
+        if self.hash_content:
+            identity["content"] = ParseCache.hash_file(str(source_path))
+
+        serialized_identity = json.dumps(identity, sort_keys=True, default=str)
+
+        return hashlib.sha256(serialized_identity.encode()).hexdigest()
+
+    @staticmethod
+    def hash_file(path_segment: str) -> str:
+        """
+        Get the SHA-256 hash of the contents of the file provided.
+
+        :param path_segment: path to the file.
+        :return: hexadecimal hash of the file.
+        :rtype: str
+        """
+
+        file_hash = hashlib.sha256()
+        with open(path_segment, "rb") as file:
+            for block in iter(lambda: file.read(2 ** 20), b""):
+                file_hash.update(block)
+
+        return file_hash.hexdigest()
+
+    def get(self, source_path_segment: str, options: dict, dtype_backend: str = None) -> pd.DataFrame:
+        """
+        Get the dataframe parsed from the source file with the options provided,
+        if it is in the cache.
+
+        :param source_path_segment: path to the source file.
+        :param options: options used to parse the source file.
+        :param dtype_backend: backend of the types of the dataframe. Optional.
+        :return: cached dataframe, or None if there is no entry.
+        :rtype: pd.DataFrame
+        """
+
+        log.info("Get dataset from parse cache")
+        log.debug(f"ParseCache.get("
+                  f"source_path_segment={source_path_segment}, "
+                  f"options={options}, "
+                  f"dtype_backend={dtype_backend})")
+
+        data_path = self.__get_data_path(self.get_key(source_path_segment, options))
+        if not data_path.is_file():
+            log.debug("- cache miss")
+            return None
+
+        log.debug("- cache hit")
+        os.utime(data_path)
+        read_arguments = {}
+        if dtype_backend is not None:
+            read_arguments["dtype_backend"] = dtype_backend
+
+        return pd.read_feather(data_path, **read_arguments)
+
+    def put(self, source_path_segment: str, options: dict, dataframe: pd.DataFrame):
+        """
+        Store the dataframe parsed from the source file with the options
+        provided. Dataframes that cannot be stored in Arrow IPC format are not
+        cached.
+
+        :param source_path_segment: path to the source file.
+        :param options: options used to parse the source file.
+        :param dataframe: dataframe parsed.
+        """
+
+        log.info("Put dataset in parse cache")
+        log.debug(f"ParseCache.put("
+                  f"source_path_segment={source_path_segment}, "
+                  f"options={options}, "
+                  f"dataframe={len(dataframe.index)} rows)")
+
+        key = self.get_key(source_path_segment, options)
+        data_path = self.__get_data_path(key)
+
+        file_descriptor, temporary_path_segment = tempfile.mkstemp(
+            dir=self.cache_path_segment,
+            suffix=".tmp")
+        os.close(file_descriptor)
+        try:
+            dataframe.reset_index(drop=True).to_feather(
+                temporary_path_segment,
+                compression="lz4")
+        except (TypeError, ValueError) as error:
+            log.warning(f"- dataset cannot be cached: {error}")
+            os.remove(temporary_path_segment)
+            return
+        os.replace(temporary_path_segment, data_path)
+
+        metadata = {"source_path": str(Path(source_path_segment).resolve())}
+        with open(self.__get_metadata_path(key), "w") as file:
+            json.dump(metadata, file)
+
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the size of the cache is
+        not greater than `max_bytes`.
+        """
+
+        log.debug("ParseCache.evict()")
+
+        data_stats = {}
+        for data_path in Path(self.cache_path_segment).glob(f"*{ParseCache.DATA_SUFFIX}"):
+            try:
+                data_stats[data_path] = data_path.stat()
+            except FileNotFoundError:
+                continue
+        cache_bytes = sum(data_stat.st_size for data_stat in data_stats.values())
+
+        for data_path in sorted(data_stats, key=lambda path: data_stats[path].st_mtime_ns):
+            if cache_bytes <= self.max_bytes:
+                break
+            log.debug(f"- evict {data_path.stem}")
+            cache_bytes -= data_stats[data_path].st_size
+            self.__remove(data_path.stem)
+
+    def invalidate(self, source_path_segment: str = None):
+        """
+        Remove the entries parsed from the source file provided, with any
+        options. If no source file is provided, remove every entry.
+
+        :param source_path_segment: path to the source file. Optional.
+        """
+
+        log.info("Invalidate parse cache")
+        log.debug(f"ParseCache.invalidate("
+                  f"source_path_segment={source_path_segment})")
+
+        source_path = None
+        if source_path_segment is not None:
+            source_path = str(Path(source_path_segment).resolve())
+
+        for metadata_path in Path(self.cache_path_segment).glob(f"*{ParseCache.METADATA_SUFFIX}"):
+            if source_path is not None:
+                with open(metadata_path, "r") as file:
+                    metadata = json.load(file)
+                if metadata["source_path"] != source_path:
+                    continue
+            self.__remove(metadata_path.stem)
+
+    def __get_data_path(self, key: str) -> Path:
+        return Path(self.cache_path_segment) / f"{key}{ParseCache.DATA_SUFFIX}"
+
+    def __get_metadata_path(self, key: str) -> Path:
+        return Path(self.cache_path_segment) / f"{key}{ParseCache.METADATA_SUFFIX}"
+
+    def __remove(self, key: str):
+        """
+        Remove the entry with the key provided.
+
+        :param key: key of the entry.
+        """
+
+        for path in [self.__get_data_path(key), self.__get_metadata_path(key)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,116 @@
+import cProfile
+import logging
+import sys
+import threading
+from collections import Counter
+
+log = logging.getLogger(__name__)
+
+
+class PhaseProfiler:
+    """
+    Profile a phase of a data processor, in the thread that runs it, with two
+    profilers at the same time:
+    - cProfile, deterministic, saved as a ".prof" file, to be opened with
+    pstats, snakeviz and the like.
+    - a sampling profiler, taking the stack of the thread every `interval`
+    seconds, saved as collapsed stacks (one "frame;frame;frame count" line per
+    stack), to be turned into a flamegraph with flamegraph.pl, speedscope and
+    the like.
+
+    Profilers can be paused while a nested phase is profiled, so the time of
+    each phase is only accounted once.
+    """
+
+    PROFILE_SUFFIX = ".prof"
+    COLLAPSED_SUFFIX = ".collapsed"
+
+    path_prefix: str = None
+    interval: float = 0.005
+
+    def __init__(self, path_prefix: str, interval: float = None):
+        """
+        Init PhaseProfiler class instance.
+
+        :param path_prefix: path of the profiles, without extension.
+        :param interval: seconds between samples. Optional.
+        """
+
+        log.debug(f"PhaseProfiler.__init__("
+                  f"path_prefix={path_prefix}, "
+                  f"interval={interval})")
+
+        self.path_prefix = path_prefix
+        if interval is not None:
+            self.interval = interval
+
+        self.samples = Counter()
+        self.__profile = cProfile.Profile()
+        self.__thread_id = None
+        self.__sampler = None
+        self.__paused = threading.Event()
+        self.__stopped = threading.Event()
+
+    def start(self):
+        """
+        Start profiling the current thread.
+        """
+
+        log.debug("PhaseProfiler.start()")
+
+        self.__thread_id = threading.get_ident()
+        self.__sampler = threading.Thread(target=self.__sample, daemon=True)
+        self.__sampler.start()
+        self.__profile.enable()
+
+    def pause(self):
+        """
+        Stop profiling until `resume()` is called.
+        """
+
+        self.__profile.disable()
+        self.__paused.set()
+
+    def resume(self):
+        """
+        Profile again after `pause()`.
+        """
+
+        self.__paused.clear()
+        self.__profile.enable()
+
+    def stop(self):
+        """
+        Stop profiling and save both profiles.
+        """
+
+        log.debug("PhaseProfiler.stop()")
+
+        self.__profile.disable()
+        self.__stopped.set()
+        self.__sampler.join()
+
+        self.__profile.dump_stats(f"{self.path_prefix}{PhaseProfiler.PROFILE_SUFFIX}")
+        with open(f"{self.path_prefix}{PhaseProfiler.COLLAPSED_SUFFIX}", "w") as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+        log.debug(f"- samples: {sum(self.samples.values())}")
+
+    def __sample(self):
+        """
+        Take the stack of the profiled thread every `interval` seconds, until
+        stopped.
+        """
+
+        while not self.__stopped.wait(self.interval):
+            if self.__paused.is_set():
+                continue
+            frame = sys._current_frames().get(self.__thread_id)
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if frames:
+                self.samples[";".join(reversed(frames))] += 1
@@ -0,0 +1,170 @@
+import logging
+from typing import List
+
+import pandas as pd
+
+from apitep_utils.analysis_modelling import AnalysisModeling
+from apitep_utils.data_processor import DataProcessor
+from apitep_utils.transformation import Transformation
+
+log = logging.getLogger(__name__)
+
+
+class Pipeline:
+    """
+    Chain data processor stages in memory.
+
+    Only the first stage loads its input datasets. The `output_df` of each
+    stage is handed to the next one directly, as its `input_df`, or as the only
+    dataframe in its `input_dfs` for transformations (ETL, Integration and
+    FeatureEngineering), so datasets are neither written nor parsed between
+    stages.
+
+    Only the last stage saves its output, unless `save_intermediate` is True.
+    Reports on load are saved by the first stage only, and reports on save by
+    the stages that save their output.
+
+    Each stage measures its phases in its own `metrics`, and saves a run record
+    when it saves its output. The time spent by each stage loading, processing
+    and saving is also stored in `timings`, and logged once the pipeline is
+    executed. Streaming mode is not available within a pipeline.
+    """
+
+    stages: List[DataProcessor] = None
+    save_intermediate: bool = False
+    timings: dict = None
+
+    def __init__(
+            self,
+            stages: List[DataProcessor] = None,
+            save_intermediate: bool = None
+    ):
+        """
+        Init Pipeline class instance.
+
+        :param stages: data processors to execute, in order. Optional.
+        :param save_intermediate: save the output of every stage, not only the
+        last one, if True. Optional.
+        """
+
+        log.info("Init pipeline")
+        log.debug(f"Pipeline.__init__("
+                  f"stages={stages}, "
+                  f"save_intermediate={save_intermediate})")
+
+        self.stages = []
+        self.timings = {}
+
+        if stages is not None:
+            self.stages = stages
+
+        if save_intermediate is not None:
+            self.save_intermediate = save_intermediate
+
+    def add_stage(self, stage: DataProcessor) -> "Pipeline":
+        """
+        Append a stage to the pipeline.
+
+        :param stage: data processor to execute after the current ones.
+        :return: the pipeline, so calls can be chained.
+        :rtype: Pipeline
+        """
+
+        log.debug(f"Pipeline.add_stage("
+                  f"stage={stage.description})")
+
+        self.stages.append(stage)
+
+        return self
+
+    def execute(self) -> pd.DataFrame:
+        """
+        Execute every stage, handing the output of each one to the next.
+
+        :return: output dataframe of the last stage.
+        :rtype: pd.DataFrame
+        """
+
+        log.info("Execute pipeline")
+        log.debug("Pipeline.execute()")
+
+        for stage in self.stages:
+            if stage.chunk_size is not None:
+                log.error(f"- {stage.description} is in streaming mode, not available in a pipeline")
+                raise NotImplementedError
+
+        self.timings = {}
+        output_df = None
+        for index, stage in enumerate(self.stages):
+            stage.metrics = {}
+            saved = self.save_intermediate or index == len(self.stages) - 1
+
+            with stage.measure("load"):
+                if index == 0:
+                    stage.load()
+                else:
+                    Pipeline.hand_over(output_df, stage)
+            with stage.measure("process"):
+                stage.process()
+                if isinstance(stage, AnalysisModeling):
+                    stage.analise()
+            if saved:
+                with stage.measure("save"):
+                    stage.save()
+
+            stage.log_changes()
+            if saved:
+                stage.save_run_record()
+            output_df = stage.output_df
+
+            stage_timings = {
+                phase: stage.metrics[phase]["wall_seconds"] if phase in stage.metrics else 0.0
+                for phase in ["load", "process", "save"]
+            }
+            stage_timings["total"] = sum(stage_timings.values())
+            self.timings[f"{index + 1}. {stage.description}"] = stage_timings
+
+        self.log_timings()
+
+        return output_df
+
+    @staticmethod
+    def hand_over(dataframe: pd.DataFrame, stage: DataProcessor):
+        """
+        Make the dataframe provided the input of the stage provided. It is
+        converted between pandas and Polars if both stages use different
+        dataframe backends.
+
+        :param dataframe: output dataframe of the previous stage.
+        :param stage: next stage.
+        """
+
+        log.debug(f"Pipeline.hand_over("
+                  f"dataframe={type(dataframe).__name__}, "
+                  f"stage={stage.description})")
+
+        if stage.dataframe_backend == DataProcessor.DataFrameBackend.Polars:
+            dataframe = DataProcessor.to_polars(dataframe)
+        else:
+            dataframe = DataProcessor.to_pandas(dataframe)
+
+        if isinstance(stage, Transformation):
+            stage.input_dfs = [dataframe]
+        else:
+            stage.input_df = dataframe
+
+    def log_timings(self):
+        """
+        Dump to log the time spent by each stage, and by the whole pipeline.
+        """
+
+        log.info("Log pipeline timings")
+        log.debug("Pipeline.log_timings()")
+
+        for stage, stage_timings in self.timings.items():
+            log.info(f"- {stage}: {stage_timings['total']:0.3f} s "
+                     f"(load {stage_timings['load']:0.3f} s, "
+                     f"process {stage_timings['process']:0.3f} s, "
+                     f"save {stage_timings['save']:0.3f} s)")
+        total = sum(stage_timings["total"] for stage_timings in self.timings.values())
+        log.info(f"- total: {total:0.3f} s")
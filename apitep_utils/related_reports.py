@@ -1,7 +1,5 @@
 import pandas as pd
 import os
-import plotly.express as px
-import plotly as py
 from enum import Enum
 
 
@@ -69,7 +67,9 @@ class RelatedReport:
             raise NotImplementedError
 
     def generate_numeric_plots(self, ds: pd.DataFrame, path: str, target_feature: str):
-        ds_numeric = ds.select_dtypes(include=['int64', 'float64'])
+        import plotly as py
+
+        ds_numeric = ds.select_dtypes(include=['number'])
         for col in ds_numeric:
             fig_histogram = RelatedReport.generate_histogram(ds, col, target_feature)
             fig_boxplot = RelatedReport.generate_boxplot(ds, col, target_feature)
@@ -79,6 +79,8 @@ class RelatedReport:
             self.numerical_html_files.append(path + '/individual_reports' + '/boxplot_' + col + '.html')
 
     def generate_categorical_plots(self, ds: pd.DataFrame, path: str, target_feature: str):
+        import plotly as py
+
         ds_cat = ds.select_dtypes(include=['category', 'object'])
         for col in ds_cat:
             fig_barplot = self.generate_histogram(ds, col, target_feature)
@@ -87,6 +89,8 @@ class RelatedReport:
 
     @staticmethod
     def generate_histogram(ds: pd.DataFrame, col: str, target_feature: str):
+        import plotly.express as px
+
         fig = px.histogram(
             ds,
             x=col,
@@ -97,6 +101,8 @@ class RelatedReport:
 
     @staticmethod
     def generate_boxplot(ds: pd.DataFrame, col: str, target_feature: str):
+        import plotly.express as px
+
         fig = px.box(
             ds,
             x=target_feature,
@@ -1,10 +1,6 @@
 import random
 
 import numpy as np
-import plotly as py
-import plotly.express as px
-import plotly.graph_objs as go
-from scipy import stats
 import os
 
 
@@ -12,11 +8,12 @@ class Report:
     numerical_html_files = []
     categorical_html_files = []
 
+    def __init__(self):
+        self.numerical_html_files = []
+        self.categorical_html_files = []
+
     def generate_advanced(self, ds, name, path):
-        if not os.path.exists(path):
-            os.makedirs(path + '/individual_reports')
-        elif not os.path.exists(path + '/individual_reports'):
-            os.makedirs(path + '/individual_reports')
+        os.makedirs(path + '/individual_reports', exist_ok=True)
 
         self.generate_numeric_plots(ds, path)
 
@@ -64,8 +61,9 @@ class Report:
             raise Exception("The dataset " + name + "no have columns of type 'category', 'int64' or 'float64' ")
 
     def generate_numeric_plots(self, ds, path):
-        numerics = ['int64', 'float64']
-        ds_numeric = ds.select_dtypes(include=numerics)
+        import plotly as py
+
+        ds_numeric = ds.select_dtypes(include=['number'])
         for col in ds_numeric:
             col_numeric = ds_numeric[col].dropna()
             fig_histogram = Report.generate_histogram_ploty(ds, col)
@@ -79,6 +77,8 @@ class Report:
             self.numerical_html_files.append(path + '/individual_reports' + '/qqplot_' + col + '.html')
 
     def generate_categorical_plots_ploty(self, ds, path):
+        import plotly as py
+
         ds_cat = ds.select_dtypes(include=['category', 'object'])
         for col in ds_cat:
             fig_barplot = self.generate_histogram_ploty(ds, col)
@@ -95,6 +95,8 @@ class Report:
 
     @staticmethod
     def generate_histogram_ploty(ds, name):
+        import plotly.express as px
+
         fig = px.histogram(
             ds,
             x=name,
@@ -105,6 +107,8 @@ class Report:
 
     @staticmethod
     def generate_boxplot_ploty(ds, name):
+        import plotly.express as px
+
         fig = px.box(
             ds,
             y=name,
@@ -114,6 +118,9 @@ class Report:
 
     @staticmethod
     def generate_qqplot_ploty(x, name):
+        import plotly.graph_objs as go
+        from scipy import stats
+
         qq = stats.probplot(x, dist='lognorm', sparams=(1,))
         x = np.array([qq[0][0][0], qq[0][0][-1]])
 
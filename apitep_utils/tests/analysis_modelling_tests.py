@@ -0,0 +1,45 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from apitep_utils.analysis_modelling import AnalysisModeling
+
+
+class CountingAnalysisModeling(AnalysisModeling):
+    executions = 0
+
+    def process(self):
+        self.rows = len(self.input_df.index)
+
+    def analise(self):
+        CountingAnalysisModeling.executions += 1
+        self.model_developed = {"rows": self.rows}
+
+    def save(self):
+        with open(self.output_path_segment, "w") as file:
+            file.write(str(self.model_developed))
+
+
+class TestAnalysisModeling(unittest.TestCase):
+    def test_analysis_modelling_incremental(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "model.txt")
+
+            def execute():
+                analysis_modelling = CountingAnalysisModeling(
+                    input_path_segment="test_dataset.csv",
+                    output_path_segment=output_path_segment,
+                    incremental=True)
+                with mock.patch.object(sys, "argv", ["analysis_modelling"]):
+                    analysis_modelling.execute()
+
+            CountingAnalysisModeling.executions = 0
+            execute()
+            execute()
+
+        self.assertEqual(
+            CountingAnalysisModeling.executions,
+            1,
+            "Attributes set while executing should not prevent skipping the second execution")
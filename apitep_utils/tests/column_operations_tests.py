@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from apitep_utils.column_operations import ColumnOperations
+from apitep_utils.data_processor import DataProcessor
+
+
+class TestColumnOperations(unittest.TestCase):
+    def test_column_operations(self):
+        input_df = pd.read_csv("test_dataset.csv")
+        original_df = input_df.copy()
+
+        data_processor = DataProcessor()
+        data_processor.input_df = input_df
+        output_df = (
+            data_processor.column_operations()
+            .drop(["Cabin", "Ticket"])
+            .rename({"Fare": "Price"})
+            .cast({"Pclass": "int8"})
+            .derive("Family", lambda columns: columns["SibSp"] + columns["Parch"])
+            .derive("Source", "test")
+            .execute())
+
+        expected_df = (
+            original_df
+            .drop(columns=["Cabin", "Ticket"])
+            .rename(columns={"Fare": "Price"})
+            .astype({"Pclass": "int8"})
+            .assign(Family=original_df["SibSp"] + original_df["Parch"], Source="test"))
+        pd.testing.assert_frame_equal(output_df, expected_df)
+        pd.testing.assert_frame_equal(input_df, original_df, obj="Original dataframe should be untouched")
+        self.assertTrue(
+            np.shares_memory(output_df["Age"].to_numpy(), input_df["Age"].to_numpy()),
+            "Columns left untouched should not be copied")
+        self.assertEqual(data_processor.changes["column Fare renamed"], "Price")
+        self.assertEqual(data_processor.changes["column Pclass cast"], "int64 to int8")
+        self.assertIn("column Cabin dropped", data_processor.changes)
+
+    def test_column_operations_polars(self):
+        input_df = pl.read_csv("test_dataset.csv")
+
+        output_df = (
+            ColumnOperations(input_df.lazy())
+            .drop("Cabin")
+            .rename({"Fare": "Price"})
+            .cast({"Pclass": pl.Int8})
+            .derive("Family", pl.col("SibSp") + pl.col("Parch"))
+            .execute())
+
+        self.assertIsInstance(output_df, pl.LazyFrame)
+        output_df = output_df.collect()
+        self.assertNotIn("Cabin", output_df.columns)
+        self.assertEqual(output_df.schema["Pclass"], pl.Int8)
+        self.assertEqual(output_df["Family"].to_list(), (input_df["SibSp"] + input_df["Parch"]).to_list())
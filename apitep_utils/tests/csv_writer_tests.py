@@ -0,0 +1,51 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from apitep_utils.csv_writer import CSVWriter
+
+
+class TestCSVWriter(unittest.TestCase):
+    def test_csv_writer_batches(self):
+        input_df = pd.read_csv("test_dataset.csv")
+
+        for compression in [None, "gzip", "bz2", "xz", "zstd"]:
+            with tempfile.TemporaryDirectory() as directory:
+                output_path_segment = str(Path(directory) / "test_dataset.csv")
+
+                with CSVWriter(
+                        output_path_segment,
+                        compression=compression,
+                        batch_rows=100,
+                        max_workers=4) as csv_writer:
+                    csv_writer.write(input_df.iloc[:500])
+                    csv_writer.write(input_df.iloc[500:])
+
+                output_df = pd.read_csv(output_path_segment, compression=compression)
+
+            self.assertEqual(csv_writer.rows, len(input_df.index))
+            pd.testing.assert_frame_equal(output_df, input_df)
+
+    def test_csv_writer_columns(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset.csv")
+
+            with CSVWriter(output_path_segment) as csv_writer:
+                csv_writer.write(pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+                csv_writer.write(pd.DataFrame({"b": [6], "a": [5]}))
+                with self.assertRaisesRegex(ValueError, r"missing \['b'\], extra \['c'\]"):
+                    csv_writer.write(pd.DataFrame({"a": [7], "c": ["z"]}))
+
+            output_df = pd.read_csv(output_path_segment)
+
+        pd.testing.assert_frame_equal(output_df, pd.DataFrame({"a": [1, 2, 5], "b": [3, 4, 6]}))
+
+    def test_csv_writer_compression(self):
+        self.assertEqual(CSVWriter.get_compression("dataset.csv.gz"), "gzip")
+        self.assertEqual(CSVWriter.get_compression("dataset.csv.zst", "bz2"), "zstd")
+        self.assertEqual(CSVWriter.get_compression("dataset.csv", "xz"), "xz")
+        self.assertIsNone(CSVWriter.get_compression("dataset.csv"))
+        with self.assertRaises(ValueError):
+            CSVWriter.get_compression("dataset.csv", "snappy")
@@ -0,0 +1,466 @@
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+from apitep_utils.data_processor import DataProcessor
+from apitep_utils.dataset_schema import DatasetSchema
+
+
+class StreamingDataProcessor(DataProcessor):
+    def process_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        chunk["Fare"] = chunk["Fare"] * 2
+        return chunk
+
+
+class GroupDataProcessor(DataProcessor):
+    def process_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        return chunk.groupby("Embarked", sort=False).size().rename("Rows").reset_index()
+
+
+class ColumnDroppingDataProcessor(DataProcessor):
+    def process_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        if chunk.index[0] > 0:
+            return chunk.drop(columns="Cabin")
+        return chunk
+
+
+class StopwatchDataProcessor(DataProcessor):
+    @DataProcessor.stopwatch
+    def add(self, a: int, b: int = 0) -> int:
+        return a + b
+
+
+class IdentityDataProcessor(DataProcessor):
+    def process(self):
+        self.output_df = self.input_df
+
+
+class PolarsDataProcessor(DataProcessor):
+    def process(self):
+        self.output_df = (
+            self.input_df
+            .filter(pl.col("Pclass") == 1)
+            .with_columns(pl.col("Fare") * 2))
+
+
+def get_title(name: str) -> str:
+    return name.split(",")[1].split(".")[0].strip()
+
+
+class TestDataProcessor(unittest.TestCase):
+    def test_data_processor_columnar_formats(self):
+        input_path_segment = "test_dataset.csv"
+        input_df = pd.read_csv(input_path_segment)
+
+        for extension in [".parquet", ".feather", ".arrow"]:
+            with tempfile.TemporaryDirectory() as directory:
+                output_path_segment = str(Path(directory) / f"test_dataset{extension}")
+
+                data_processor = IdentityDataProcessor(
+                    input_path_segment=input_path_segment,
+                    output_path_segment=output_path_segment,
+                    output_compression="zstd")
+                data_processor.load()
+                data_processor.process()
+                data_processor.save()
+
+                data_processor = IdentityDataProcessor(
+                    input_path_segment=output_path_segment,
+                    input_columns=["PassengerId", "Name"])
+                data_processor.load()
+
+            pd.testing.assert_frame_equal(
+                data_processor.input_df,
+                input_df[["PassengerId", "Name"]])
+
+    def test_data_processor_streaming_parquet(self):
+        input_path_segment = "test_dataset.csv"
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset_processed.parquet")
+
+            data_processor = StreamingDataProcessor(
+                input_path_segment=input_path_segment,
+                output_path_segment=output_path_segment,
+                chunk_size=100)
+            data_processor.load()
+            data_processor.process()
+            data_processor.save()
+
+            output_df = pd.read_parquet(output_path_segment)
+
+        input_df = pd.read_csv(input_path_segment)
+        pd.testing.assert_series_equal(output_df["Fare"], input_df["Fare"] * 2)
+
+    def test_data_processor_streaming(self):
+        input_path_segment = "test_dataset.csv"
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset_processed.csv")
+
+            data_processor = StreamingDataProcessor(
+                input_path_segment=input_path_segment,
+                output_path_segment=output_path_segment,
+                chunk_size=100)
+            data_processor.load()
+            data_processor.process()
+            data_processor.save()
+
+            input_df = pd.read_csv(input_path_segment)
+            output_df = pd.read_csv(output_path_segment)
+
+        self.assertIsNone(
+            data_processor.input_df,
+            "Input dataset should not be loaded in streaming mode")
+        self.assertEqual(
+            len(output_df.index),
+            len(input_df.index),
+            f"Output dataset has {len(output_df.index)} rows but it should "
+            f"have {len(input_df.index)}")
+        pd.testing.assert_series_equal(output_df["Fare"], input_df["Fare"] * 2)
+
+    def test_data_processor_streaming_columns(self):
+        with tempfile.TemporaryDirectory() as directory:
+            data_processor = ColumnDroppingDataProcessor(
+                input_path_segment="test_dataset.csv",
+                output_path_segment=str(Path(directory) / "test_dataset_processed.csv"),
+                chunk_size=100)
+            data_processor.load()
+            data_processor.process()
+
+            with self.assertRaisesRegex(ValueError, "Cabin"):
+                data_processor.save()
+
+    def test_data_processor_optimize_memory(self):
+        input_path_segment = "test_dataset.csv"
+
+        data_processor = DataProcessor(
+            input_path_segment=input_path_segment,
+            optimize_memory=True)
+        data_processor.load()
+
+        input_df = pd.read_csv(input_path_segment)
+        optimized_df = data_processor.input_df
+        self.assertEqual(optimized_df["Pclass"].dtype, "uint8")
+        self.assertEqual(optimized_df["Sex"].dtype, "category")
+        self.assertEqual(optimized_df["Fare"].dtype, "float64")
+        self.assertLess(
+            optimized_df.memory_usage(deep=True).sum(),
+            input_df.memory_usage(deep=True).sum(),
+            "Optimized dataset should use less memory")
+        self.assertIn(
+            f"bytes saved in {input_path_segment}, column Sex",
+            data_processor.changes)
+        pd.testing.assert_frame_equal(
+            optimized_df,
+            input_df,
+            check_dtype=False,
+            check_categorical=False)
+
+    def test_data_processor_optimize_memory_missing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path_segment = str(Path(directory) / "test_dataset.csv")
+            pd.DataFrame({"id": [1, 2, 3], "empty": [None, None, None]}).to_csv(input_path_segment, index=False)
+
+            data_processor = DataProcessor(
+                input_path_segment=input_path_segment,
+                dtype_backend="numpy_nullable",
+                optimize_memory=True)
+            data_processor.load()
+
+        self.assertEqual(data_processor.input_df["id"].dtype, "UInt8")
+        self.assertEqual(data_processor.input_df["empty"].dtype, "Int64")
+        self.assertTrue(data_processor.input_df["empty"].isna().all())
+
+    def test_data_processor_csv_engine(self):
+        input_path_segment = "test_dataset.csv"
+
+        data_processor = DataProcessor(
+            input_path_segment=input_path_segment,
+            csv_engine="pyarrow")
+        data_processor.load()
+        pd.testing.assert_frame_equal(
+            data_processor.input_df,
+            pd.read_csv(input_path_segment))
+
+        data_processor = DataProcessor(
+            input_path_segment=input_path_segment,
+            csv_engine="pyarrow",
+            dtype_backend="pyarrow")
+        data_processor.load()
+        self.assertEqual(str(data_processor.input_df["PassengerId"].dtype), "int64[pyarrow]")
+        self.assertEqual(
+            data_processor.input_df["Cabin"].isna().sum(),
+            pd.read_csv(input_path_segment)["Cabin"].isna().sum(),
+            "Empty fields should be missing values with every engine")
+
+    def test_data_processor_compressed_csv(self):
+        input_path_segment = "test_dataset.csv"
+        input_df = pd.read_csv(input_path_segment)
+
+        for extension in [".csv.gz", ".csv.bz2", ".csv.xz", ".csv.zst"]:
+            with tempfile.TemporaryDirectory() as directory:
+                output_path_segment = str(Path(directory) / f"test_dataset{extension}")
+
+                data_processor = IdentityDataProcessor(
+                    input_path_segment=input_path_segment,
+                    output_path_segment=output_path_segment)
+                data_processor.load()
+                data_processor.process()
+                data_processor.save()
+                metrics = data_processor.metrics["save"]
+
+                data_processor = IdentityDataProcessor(
+                    input_path_segment=output_path_segment)
+                data_processor.load()
+
+            self.assertEqual(metrics["rows"], len(input_df.index))
+            self.assertGreater(metrics["compression_ratio"], 1)
+            pd.testing.assert_frame_equal(data_processor.input_df, input_df)
+
+    def test_data_processor_atomic_save(self):
+        input_path_segment = "test_dataset.csv"
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset.csv")
+            Path(output_path_segment).write_text("previous output\n")
+
+            data_processor = IdentityDataProcessor(
+                input_path_segment=input_path_segment,
+                output_path_segment=output_path_segment)
+            data_processor.load()
+            data_processor.output_df = None
+            with self.assertRaises(AttributeError):
+                data_processor.save()
+
+            self.assertEqual(Path(output_path_segment).read_text(), "previous output\n")
+            self.assertEqual(
+                [path.name for path in Path(directory).iterdir()],
+                ["test_dataset.csv"],
+                "Failed saves should not leave temporary files behind")
+
+    def test_data_processor_metadata(self):
+        input_path_segment = "test_dataset.csv"
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset.csv.gz")
+
+            data_processor = IdentityDataProcessor(
+                input_path_segment=input_path_segment,
+                output_path_segment=output_path_segment,
+                output_metadata=True)
+            data_processor.load()
+            data_processor.process()
+            data_processor.save()
+
+            metadata_path = Path(DataProcessor.get_metadata_path_segment(output_path_segment))
+            self.assertEqual(metadata_path.name, "test_dataset.csv.gz.meta.json")
+
+            data_processor = DataProcessor(
+                input_path_segment=output_path_segment,
+                verify_input=True)
+            data_processor.load()
+            self.assertEqual(
+                len(data_processor.input_df.index),
+                len(pd.read_csv(input_path_segment).index))
+
+            with open(output_path_segment, "ab") as file:
+                file.write(b"truncated")
+            with self.assertRaises(RuntimeError):
+                data_processor.load()
+
+    @unittest.skipUnless(importlib.util.find_spec("openpyxl"), "openpyxl is not installed")
+    def test_data_processor_excel_sheets(self):
+        input_df = pd.read_csv("test_dataset.csv")
+        sheet_dfs = {
+            "first": input_df.iloc[:100],
+            "second": input_df.iloc[100:200],
+            "notes": pd.DataFrame({"Note": ["not data"]})
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path_segment = str(Path(directory) / "test_dataset.xlsx")
+            with pd.ExcelWriter(input_path_segment) as excel_writer:
+                for sheet_name, sheet_df in sheet_dfs.items():
+                    sheet_df.to_excel(excel_writer, sheet_name=sheet_name, index=False)
+
+            for excel_engine in [None, "openpyxl"]:
+                data_processor = DataProcessor(
+                    input_path_segment=input_path_segment,
+                    input_type_excel=True,
+                    excel_excluded_sheets=["notes"],
+                    excel_engine=excel_engine,
+                    max_workers=2)
+                data_processor.load()
+                self.assertEqual(len(data_processor.input_df.index), 200)
+                self.assertNotIn("Note", data_processor.input_df.columns)
+
+            data_processor = DataProcessor(
+                input_path_segment=input_path_segment,
+                input_type_excel=True,
+                excel_sheets=["second"])
+            data_processor.load()
+            self.assertEqual(
+                data_processor.input_df["PassengerId"].tolist(),
+                input_df["PassengerId"].iloc[100:200].tolist())
+
+    def test_data_processor_partitioned(self):
+        input_path_segment = "test_dataset.csv"
+        input_df = pd.read_csv(input_path_segment)
+
+        data_processor = StreamingDataProcessor(
+            input_path_segment=input_path_segment,
+            partition_rows=100,
+            max_workers=2)
+        data_processor.load()
+        data_processor.process()
+        self.assertIsNot(data_processor.output_df, data_processor.input_df)
+        pd.testing.assert_series_equal(data_processor.output_df["Fare"], input_df["Fare"] * 2)
+
+        data_processor = StreamingDataProcessor(
+            input_path_segment=input_path_segment,
+            partition_rows=100,
+            partition_column="Embarked",
+            max_workers=2)
+        data_processor.load()
+        self.assertFalse(
+            input_df["Embarked"].is_monotonic_increasing,
+            "Partition keys should be unsorted for this test")
+        data_processor.process()
+        pd.testing.assert_frame_equal(
+            data_processor.output_df,
+            data_processor.process_chunk(input_df.copy()),
+            obj="Partitioned output should keep the order of the input")
+
+        data_processor = GroupDataProcessor(
+            input_path_segment=input_path_segment,
+            partition_rows=100,
+            partition_column="Embarked",
+            max_workers=2)
+        data_processor.load()
+        partitions = data_processor.get_partitions(data_processor.input_df)
+        self.assertEqual(
+            sum(partition["Embarked"].nunique(dropna=False) for partition in partitions),
+            input_df["Embarked"].nunique(dropna=False),
+            "Groups should not be split between partitions")
+        data_processor.process()
+        expected_df = input_df.groupby("Embarked", sort=False).size()
+        pd.testing.assert_series_equal(
+            data_processor.output_df.set_index("Embarked")["Rows"],
+            expected_df,
+            check_names=False)
+
+    def test_data_processor_apply(self):
+        input_df = pd.read_csv("test_dataset.csv")
+        data_processor = DataProcessor()
+
+        result = data_processor.apply(
+            input_df,
+            lambda row: row["SibSp"] + row["Parch"],
+            name="family",
+            vectorized=True)
+        pd.testing.assert_series_equal(result, input_df["SibSp"] + input_df["Parch"])
+
+        expected = input_df["Name"].apply(get_title)
+        for backend in DataProcessor.ApplyBackend:
+            result = data_processor.apply(input_df["Name"], get_title, backend=backend, chunk_rows=100)
+            pd.testing.assert_series_equal(result, expected)
+
+        result = data_processor.apply(input_df["Age"], lambda age: "adult" if age >= 18 else "minor")
+        self.assertEqual(result.iloc[0], "adult")
+
+        calls = []
+
+        def double_floats(value):
+            calls.append(value)
+            return value * 2 if isinstance(value, float) else value
+
+        result = data_processor.apply(input_df["Fare"], double_floats, backend=DataProcessor.ApplyBackend.Serial)
+        pd.testing.assert_series_equal(result, input_df["Fare"] * 2)
+        self.assertEqual(len(calls), len(input_df.index), "Functions should only be called value by value")
+
+        self.assertEqual(
+            [record["path"] for record in data_processor.metrics["apply"]],
+            ["vectorized", "serial", "threads", "processes", "threads", "serial"])
+
+    def test_data_processor_polars(self):
+        input_path_segment = "test_dataset.csv"
+        input_df = pd.read_csv(input_path_segment)
+        expected_df = input_df[input_df["Pclass"] == 1].assign(Fare=input_df["Fare"] * 2)
+
+        for extension in [".csv", ".parquet", ".arrow"]:
+            with tempfile.TemporaryDirectory() as directory:
+                output_path_segment = str(Path(directory) / f"test_dataset_processed{extension}")
+
+                data_processor = PolarsDataProcessor(
+                    input_path_segment=input_path_segment,
+                    output_path_segment=output_path_segment,
+                    schema=DatasetSchema(dtypes={"PassengerId": "int32"}, categories=["Embarked"]),
+                    dataframe_backend=DataProcessor.DataFrameBackend.Polars)
+                data_processor.load()
+                self.assertIsInstance(data_processor.input_df, pl.LazyFrame)
+                data_processor.process()
+                data_processor.save()
+                self.assertEqual(data_processor.input_df.collect_schema()["PassengerId"], pl.Int32)
+                self.assertEqual(data_processor.input_df.collect_schema()["Embarked"], pl.Categorical)
+
+                data_processor = IdentityDataProcessor(input_path_segment=output_path_segment)
+                data_processor.load()
+
+            pd.testing.assert_frame_equal(
+                data_processor.input_df.astype({"PassengerId": "int64", "Embarked": "object"}),
+                expected_df.reset_index(drop=True),
+                check_dtype=False)
+
+    def test_data_processor_memory_map(self):
+        input_path_segment = "test_dataset.csv"
+        input_df = pd.read_csv(input_path_segment)
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset.arrow")
+
+            data_processor = IdentityDataProcessor(
+                input_path_segment=input_path_segment,
+                output_path_segment=output_path_segment,
+                memory_map=True)
+            data_processor.load()
+            data_processor.process()
+            data_processor.save()
+
+            data_processor = IdentityDataProcessor(
+                input_path_segment=output_path_segment,
+                memory_map=True)
+            data_processor.load()
+
+            pd.testing.assert_frame_equal(data_processor.input_df, input_df)
+            self.assertFalse(
+                data_processor.input_df["PassengerId"].to_numpy().flags.writeable,
+                "Numeric columns should point to the mapped file")
+
+    def test_data_processor_stopwatch(self):
+        data_processor = StopwatchDataProcessor()
+        self.assertEqual(data_processor.add(1, b=2), 3)
+        self.assertEqual(StopwatchDataProcessor.add.__name__, "add")
+
+    def test_data_processor_profile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            data_processor = DataProcessor(profile_path_segment=directory)
+            with data_processor.measure("process"):
+                sum(value * value for value in range(200000))
+                with data_processor.measure("save_report"):
+                    sum(value * value for value in range(200000))
+
+            for phase in ["process", "save_report"]:
+                profile_path = Path(directory) / f"dataprocessor.{phase}.prof"
+                collapsed_path = Path(directory) / f"dataprocessor.{phase}.collapsed"
+                self.assertTrue(profile_path.is_file(), f"{profile_path.name} should be saved")
+                self.assertTrue(collapsed_path.is_file(), f"{collapsed_path.name} should be saved")
+            self.assertEqual(data_processor.active_profilers, [])
+
+        data_processor = DataProcessor()
+        with data_processor.measure("process"):
+            self.assertEqual(data_processor.active_profilers, [], "Profiling should be disabled by default")
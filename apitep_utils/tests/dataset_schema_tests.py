@@ -0,0 +1,64 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from apitep_utils import DatasetSchema
+from apitep_utils.data_processor import DataProcessor
+
+
+class SchemaDataProcessor(DataProcessor):
+    schema = DatasetSchema(
+        columns=["PassengerId", "Pclass", "Sex", "Fare"],
+        dtypes={"PassengerId": "int32", "Fare": "float32"},
+        categories={"Sex": ["female", "male"]})
+
+
+class TestDatasetSchema(unittest.TestCase):
+    def test_dataset_schema_class_attribute(self):
+        data_processor = SchemaDataProcessor(input_path_segment="test_dataset.csv")
+        data_processor.load()
+
+        input_df = data_processor.input_df
+        self.assertEqual(
+            list(input_df.columns),
+            ["PassengerId", "Pclass", "Sex", "Fare"],
+            "Only the columns in the schema should be loaded")
+        self.assertEqual(input_df["PassengerId"].dtype, "int32")
+        self.assertEqual(input_df["Fare"].dtype, "float32")
+        self.assertEqual(
+            list(input_df["Sex"].cat.categories),
+            ["female", "male"],
+            "Sex should be categorical with the categories in the schema")
+
+    def test_dataset_schema_sidecar(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path_segment = str(Path(directory) / "test_dataset.csv")
+            shutil.copy("test_dataset.csv", input_path_segment)
+            with open(DatasetSchema.get_sidecar_path(input_path_segment), "w") as file:
+                json.dump({"columns": ["Embarked"], "categories": ["Embarked"]}, file)
+
+            data_processor = DataProcessor(input_path_segment=input_path_segment)
+            data_processor.load()
+
+        self.assertEqual(list(data_processor.input_df.columns), ["Embarked"])
+        self.assertIsInstance(data_processor.input_df["Embarked"].dtype, pd.CategoricalDtype)
+
+    def test_dataset_schema_sidecar_path(self):
+        self.assertEqual(Path(DatasetSchema.get_sidecar_path("data/test.csv")).name, "test.csv.schema.json")
+        self.assertEqual(Path(DatasetSchema.get_sidecar_path("data/test.csv.gz")).name, "test.csv.gz.schema.json")
+        self.assertNotEqual(
+            DatasetSchema.get_sidecar_path("data/test.csv"),
+            DatasetSchema.get_sidecar_path("data/test.parquet"))
+
+    def test_dataset_schema_apply_dates(self):
+        dataframe = pd.DataFrame({"date": ["01/02/2021", "03/04/2021"], "value": [1, 2]})
+        schema = DatasetSchema(dates={"date": "%d/%m/%Y"}, dtypes={"value": "int8"})
+
+        dataframe = schema.apply(dataframe)
+
+        self.assertEqual(dataframe["date"].iloc[1], pd.Timestamp(2021, 4, 3))
+        self.assertEqual(dataframe["value"].dtype, "int8")
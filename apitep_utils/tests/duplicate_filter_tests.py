@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from apitep_utils.duplicate_filter import DuplicateFilter
+from apitep_utils.integration import Integration
+
+
+class TestDuplicateFilter(unittest.TestCase):
+    def test_duplicate_filter(self):
+        input_df = pd.read_csv("test_dataset.csv")
+        first_df = input_df.iloc[:300]
+        second_df = pd.concat([input_df.iloc[200:], input_df.iloc[-10:]], ignore_index=True)
+
+        changes = {}
+        duplicate_filter = DuplicateFilter(changes=changes)
+        output_df = pd.concat([
+            duplicate_filter.filter(first_df, "first"),
+            duplicate_filter.filter(second_df, "second")],
+            ignore_index=True)
+
+        expected_df = pd.concat([first_df, second_df], ignore_index=True).drop_duplicates(ignore_index=True)
+        pd.testing.assert_frame_equal(output_df, expected_df)
+        self.assertEqual(changes["duplicated rows dropped from first"], 0)
+        self.assertEqual(changes["duplicated rows dropped from second"], 110)
+        self.assertEqual(len(duplicate_filter), len(expected_df.index))
+
+    def test_duplicate_filter_types(self):
+        first_df = pd.DataFrame({"id": [1, 2], "value": [10, 20], "flag": [True, False]})
+        second_df = pd.DataFrame({"id": [2.0, 3.0], "value": [20.0, np.nan], "flag": [0.0, 1.0]})
+        third_df = pd.DataFrame({"id": [2 ** 60, 2 ** 60 + 1], "value": [1, 1], "flag": [True, True]})
+
+        duplicate_filter = DuplicateFilter()
+        output_df = pd.concat(
+            [duplicate_filter.filter(first_df), duplicate_filter.filter(second_df)],
+            ignore_index=True)
+
+        expected_df = pd.concat([first_df, second_df], ignore_index=True).drop_duplicates(ignore_index=True)
+        self.assertEqual(len(output_df.index), 3)
+        self.assertEqual(len(output_df.index), len(expected_df.index))
+        self.assertEqual(
+            len(duplicate_filter.filter(third_df).index),
+            2,
+            "Integers beyond the precision of floats should not be taken as duplicates")
+
+    def test_duplicate_filter_columns(self):
+        rng = np.random.default_rng(0)
+        input_df = pd.DataFrame({
+            "id": rng.integers(0, 500, 5000),
+            "value": rng.random(5000)})
+
+        duplicate_filter = DuplicateFilter(columns=["id"])
+        chunks = (input_df.iloc[start:start + 100] for start in range(0, 5000, 100))
+        output_df = pd.concat(duplicate_filter.filter_chunks(chunks))
+
+        pd.testing.assert_frame_equal(output_df, input_df.drop_duplicates(subset=["id"]))
+        self.assertLess(len(duplicate_filter.runs), 10, "Hashes should be merged in a few sorted arrays")
+        self.assertEqual(duplicate_filter.changes["duplicated rows dropped"], 5000 - len(output_df.index))
+
+    def test_duplicate_filter_streaming(self):
+        input_df = pd.read_csv("test_dataset.csv")
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path_segments = [
+                str(Path(directory) / "first.csv"),
+                str(Path(directory) / "second.csv")]
+            input_df.iloc[:300].to_csv(input_path_segments[0], index=False)
+            input_df.iloc[200:].to_csv(input_path_segments[1], index=False)
+            output_path_segment = str(Path(directory) / "output.csv")
+
+            integration = Integration(
+                input_path_segments=input_path_segments,
+                output_path_segment=output_path_segment,
+                save_report_on_save=False,
+                chunk_size=100,
+                drop_duplicates=True,
+                duplicate_columns=["PassengerId"])
+            integration.load()
+            integration.save()
+
+            output_df = pd.read_csv(output_path_segment)
+
+        pd.testing.assert_frame_equal(output_df, input_df)
+        self.assertEqual(integration.changes["duplicated rows dropped"], 100)
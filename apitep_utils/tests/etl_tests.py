@@ -1,4 +1,12 @@
+import json
+import sys
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+import polars as pl
 
 from apitep_utils import ETL
 
@@ -8,6 +16,14 @@ class DerivedETL(ETL):
         self.output_df = self.input_df
 
 
+class CountingETL(ETL):
+    executions = 0
+
+    def process(self):
+        CountingETL.executions += 1
+        self.output_df = pd.concat(self.input_dfs, ignore_index=True)
+
+
 class TestETL(unittest.TestCase):
     def test_etl_load(self):
         input_path_segment = "test_dataset.csv"
@@ -47,3 +63,90 @@ class TestETL(unittest.TestCase):
             dataset_rows,
             file_lines,
             f"Output dataset has {dataset_rows} but it should have {file_lines}")
+
+    def test_etl_incremental(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path_segment = str(Path(directory) / "test_dataset.csv")
+            output_path_segment = str(Path(directory) / "test_dataset_processed.csv")
+            pd.read_csv("test_dataset.csv").to_csv(input_path_segment, index=False)
+
+            def execute(**arguments):
+                etl = CountingETL(
+                    input_path_segments=[input_path_segment],
+                    output_path_segment=output_path_segment,
+                    save_report_on_load=False,
+                    save_report_on_save=False,
+                    incremental=True,
+                    **arguments)
+                with mock.patch.object(sys, "argv", ["etl"]):
+                    etl.execute()
+
+            CountingETL.executions = 0
+            execute()
+            execute()
+            self.assertEqual(CountingETL.executions, 1, "Second execution should be skipped")
+
+            execute(input_columns=["PassengerId"])
+            self.assertEqual(CountingETL.executions, 2, "Changing parameters should execute again")
+
+            pd.read_csv("test_dataset.csv").head().to_csv(input_path_segment, index=False)
+            execute(input_columns=["PassengerId"])
+            self.assertEqual(CountingETL.executions, 3, "Changing inputs should execute again")
+
+            Path(output_path_segment).unlink()
+            execute(input_columns=["PassengerId"])
+            self.assertEqual(CountingETL.executions, 4, "Missing output should execute again")
+
+    def test_etl_run_record(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset_processed.csv")
+
+            etl = CountingETL(
+                input_path_segments=["test_dataset.csv"],
+                output_path_segment=output_path_segment,
+                save_report_on_load=False,
+                save_report_on_save=False)
+            with mock.patch.object(sys, "argv", ["etl"]):
+                etl.execute()
+                etl.execute()
+
+            with open(etl.get_run_record_path_segment(), "r") as file:
+                run_records = [json.loads(line) for line in file]
+
+        self.assertEqual(len(run_records), 2, "Each execution should append a run record")
+        metrics = run_records[-1]["metrics"]
+        rows = len(pd.read_csv("test_dataset.csv").index)
+        self.assertEqual(metrics["load"]["input_rows"], rows)
+        self.assertEqual(metrics["process"]["output_rows"], rows)
+        self.assertEqual(metrics["load"]["bytes_read"], Path("test_dataset.csv").stat().st_size)
+        self.assertGreater(metrics["save"]["bytes_written"], 0)
+        for phase in ["load", "process", "save"]:
+            self.assertGreaterEqual(metrics[phase]["wall_seconds"], 0)
+            self.assertGreaterEqual(metrics[phase]["cpu_seconds"], 0)
+
+    def test_etl_replace_columns(self):
+        input_df = pd.DataFrame({
+            "a": [1.0, None, 3.0, None],
+            "b": [1.0, None, 4.0, 5.0],
+            "c": ["x", "y", None, None],
+            "d": ["x", "z", "w", None],
+            "e": [1, 2, 3, 4]
+        })
+
+        etl = ETL()
+        etl.input_df = input_df.copy()
+        differences = etl.replace_columns({"a": "b", "c": "d"})
+
+        self.assertEqual(differences, {"b": 2, "d": 2})
+        self.assertEqual(list(etl.input_df.columns), ["b", "d", "e"])
+        pd.testing.assert_series_equal(etl.input_df["b"], input_df["a"], check_names=False)
+        pd.testing.assert_series_equal(etl.input_df["d"], input_df["c"], check_names=False)
+        self.assertEqual(etl.changes["values replaced in column b by column a"], 2)
+
+        etl.input_df = input_df.copy()
+        self.assertEqual(etl.replace_column("a", "b"), 2)
+        self.assertEqual(list(etl.input_df.columns), ["b", "c", "d", "e"])
+
+        etl.input_df = pl.from_pandas(input_df).lazy()
+        self.assertEqual(etl.replace_columns({"a": "b", "c": "d"}), {"b": 2, "d": 2})
+        self.assertEqual(etl.input_df.collect_schema().names(), ["b", "d", "e"])
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import unittest
+
+
+def get_loaded_modules(statement: str, modules: list) -> list:
+    script = (f"import sys\n"
+              f"{statement}\n"
+              f"print(' '.join(module for module in {modules!r} if module in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    return result.stdout.split()
+
+
+class TestImport(unittest.TestCase):
+    def test_import_package(self):
+        loaded_modules = get_loaded_modules(
+            "import apitep_utils",
+            ["numpy", "pandas", "plotly", "scipy", "swifter"])
+        self.assertEqual(loaded_modules, [], "Importing the package should not load heavy dependencies")
+
+    def test_import_etl(self):
+        loaded_modules = get_loaded_modules(
+            "from apitep_utils import ETL",
+            ["plotly", "scipy", "swifter"])
+        self.assertEqual(loaded_modules, [], "Importing ETL should not load report or test dependencies")
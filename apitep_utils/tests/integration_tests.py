@@ -1,5 +1,8 @@
+import tempfile
 import unittest
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from apitep_utils.integration import Integration
 
@@ -23,3 +26,231 @@ class TestIntegration(unittest.TestCase):
                 "test_dataset_column.csv"],
             output_path_segment="test_dataset_integration.csv")
         integration.execute()
+
+    def test_integration_streaming(self):
+        input_path_segments = [
+            "test_dataset.csv",
+            "test_dataset.csv"]
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path_segment = str(Path(directory) / "test_dataset_integration.csv")
+
+            integration = Integration(
+                input_path_segments=input_path_segments,
+                output_path_segment=output_path_segment,
+                save_report_on_save=False,
+                chunk_size=100)
+            integration.load()
+            integration.process()
+            integration.save()
+
+            output_df = pd.read_csv(output_path_segment)
+
+        input_rows = 2 * len(pd.read_csv(input_path_segments[0]).index)
+        self.assertEqual(
+            len(output_df.index),
+            input_rows,
+            f"Output dataset has {len(output_df.index)} rows but it should "
+            f"have {input_rows}")
+
+    def test_integration_parallel_load(self):
+        input_path_segments = [
+            "test_dataset.csv",
+            "test_dataset_column.csv",
+            "test_dataset.csv"]
+
+        integration = Integration(
+            input_path_segments=input_path_segments,
+            max_workers=3)
+        integration.load()
+
+        self.assertEqual(len(integration.input_dfs), len(input_path_segments))
+        for input_path_segment, input_df in zip(input_path_segments, integration.input_dfs):
+            pd.testing.assert_frame_equal(input_df, pd.read_csv(input_path_segment))
+
+    def test_integration_parallel_load_failure(self):
+        integration = Integration(
+            input_path_segments=[
+                "test_dataset.csv",
+                "non_existant_file.csv"],
+            max_workers=2)
+
+        with self.assertRaises(RuntimeError) as context:
+            integration.load()
+
+        self.assertIn("non_existant_file.csv", str(context.exception))
+        self.assertEqual(integration.input_dfs, [], "No dataset should be loaded")
+
+    def test_integration_concat(self):
+        first_df = pd.DataFrame({
+            "id": [1, 2],
+            "flag": [True, False],
+            "class": pd.Categorical(["a", "b"])})
+        second_df = pd.DataFrame({
+            "id": [3],
+            "class": pd.Categorical(["c"]),
+            "fare": [1.5]})
+
+        integration = Integration(strategy=Integration.Strategy.Concat)
+        integration.input_dfs = [first_df, second_df]
+        integration.process()
+        output_df = integration.output_df
+
+        self.assertEqual(list(output_df.columns), ["id", "flag", "class", "fare"])
+        self.assertEqual(output_df["id"].dtype, np.int64)
+        self.assertEqual(str(output_df["flag"].dtype), "boolean")
+        self.assertEqual(list(output_df["class"].cat.categories), ["a", "b", "c"])
+        self.assertTrue(pd.isna(output_df["flag"].iloc[2]))
+        self.assertEqual(integration.metrics["process"]["estimated_output_rows"], 3)
+
+    def test_integration_join(self):
+        rng = np.random.default_rng(0)
+        people_df = pd.DataFrame({
+            "id": np.arange(50),
+            "site": rng.choice(["x", "y"], 50),
+            "age": rng.integers(0, 90, 50)})
+        visits_df = pd.DataFrame({
+            "id": rng.integers(0, 60, 200),
+            "site": rng.choice(["x", "y"], 200),
+            "fare": rng.random(200)})
+        labels_df = pd.DataFrame({
+            "id": np.arange(0, 50, 2),
+            "site": rng.choice(["x", "y"], 25),
+            "age": rng.integers(0, 90, 25)})
+        keys = ["id", "site"]
+
+        for how in ["inner", "left", "outer"]:
+            for sort in [False, True]:
+                input_dfs = [people_df, visits_df, labels_df]
+                if sort:
+                    input_dfs = [input_df.sort_values(keys, ignore_index=True) for input_df in input_dfs]
+                integration = Integration(
+                    strategy=Integration.Strategy.Join,
+                    join_keys=keys,
+                    join_how=how)
+                integration.input_dfs = input_dfs
+                integration.process()
+
+                expected_df = pd.merge(
+                    pd.merge(input_dfs[0], input_dfs[1], on=keys, how=how),
+                    input_dfs[2], on=keys, how=how, suffixes=("_1", "_3"))
+                columns = keys + ["age_1", "fare", "age_3"]
+                output_df = integration.output_df[columns].sort_values(columns, ignore_index=True)
+                expected_df = expected_df[columns].sort_values(columns, ignore_index=True)
+
+                pd.testing.assert_frame_equal(output_df, expected_df, check_dtype=False)
+                self.assertEqual(integration.metrics["process"]["sorted_merge"], sort)
+                self.assertEqual(
+                    integration.metrics["process"]["estimated_output_rows"],
+                    len(expected_df.index))
+                if how == "left":
+                    self.assertEqual(integration.metrics["process"]["join_order"][0], 0)
+
+    def test_integration_join_many_keys(self):
+        # Seven keys with 600 values each would code 2 ** 64 as 0 if the codes
+        # of every key were combined before coding them again
+        keys = [f"key_{index}" for index in range(7)]
+        digits = []
+        value = 2 ** 64
+        for _ in keys:
+            value, digit = divmod(value, 600)
+            digits.insert(0, digit)
+        left_df = pd.DataFrame({key: list(range(600)) + [digit] for key, digit in zip(keys, digits)})
+        left_df["left"] = range(601)
+        right_df = pd.DataFrame({key: [digit] for key, digit in zip(keys, digits)})
+        right_df["right"] = ["match"]
+
+        integration = Integration(
+            strategy=Integration.Strategy.Join,
+            join_keys=keys)
+        integration.input_dfs = [left_df, right_df]
+        integration.process()
+
+        self.assertEqual(integration.output_df["left"].tolist(), [600])
+
+    def test_integration_join_memory(self):
+        integration = Integration(
+            strategy=Integration.Strategy.Join,
+            join_keys=["id"],
+            max_output_bytes=1000)
+        integration.input_dfs = [
+            pd.DataFrame({"id": [1] * 100, "a": range(100)}),
+            pd.DataFrame({"id": [1] * 100, "b": range(100)})]
+
+        with self.assertRaises(MemoryError):
+            integration.process()
+        self.assertEqual(integration.metrics["process"]["estimated_output_rows"], 10000)
+
+    def test_integration_streaming_concat(self):
+        first_df = pd.DataFrame({
+            "id": range(10),
+            "name": [f"name {i}" for i in range(10)]})
+        second_df = pd.DataFrame({
+            "id": range(10, 15),
+            "fare": [i / 2 for i in range(5)],
+            "name": [None] * 5})
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path_segments = [
+                str(Path(directory) / "first.csv"),
+                str(Path(directory) / "second.parquet")]
+            first_df.to_csv(input_path_segments[0], index=False)
+            second_df.to_parquet(input_path_segments[1], index=False)
+
+            for extension in ["csv", "parquet"]:
+                output_path_segment = str(Path(directory) / f"integration.{extension}")
+                integration = Integration(
+                    input_path_segments=input_path_segments,
+                    output_path_segment=output_path_segment,
+                    save_report_on_save=False,
+                    chunk_size=3,
+                    strategy=Integration.Strategy.Concat)
+                integration.load()
+                integration.process()
+                integration.save()
+
+                if extension == "csv":
+                    output_df = pd.read_csv(output_path_segment)
+                else:
+                    output_df = pd.read_parquet(output_path_segment)
+
+                self.assertEqual(list(output_df.columns), ["id", "name", "fare"])
+                self.assertEqual(list(output_df["id"]), list(range(15)))
+                self.assertEqual(output_df["name"].isna().sum(), 5)
+                self.assertEqual(output_df["fare"].isna().sum(), 10)
+                self.assertEqual(output_df["fare"].sum(), second_df["fare"].sum())
+
+    def test_integration_streaming_concat_late_type(self):
+        late_df = pd.DataFrame({"id": range(2000), "value": range(2000)})
+        late_df["value"] = late_df["value"].astype(object)
+        late_df.loc[1999, "value"] = 0.5
+        other_df = pd.DataFrame({"id": [2000], "value": [7]})
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path_segments = [
+                str(Path(directory) / "late.csv"),
+                str(Path(directory) / "other.parquet")]
+            late_df.to_csv(input_path_segments[0], index=False)
+            other_df.to_parquet(input_path_segments[1], index=False)
+
+            for extension, scan_dtypes in [("csv", False), ("parquet", True)]:
+                output_path_segment = str(Path(directory) / f"integration.{extension}")
+                integration = Integration(
+                    input_path_segments=input_path_segments,
+                    output_path_segment=output_path_segment,
+                    save_report_on_save=False,
+                    chunk_size=100,
+                    strategy=Integration.Strategy.Concat,
+                    scan_dtypes=scan_dtypes)
+                integration.load()
+                integration.save()
+
+                if extension == "csv":
+                    output_df = pd.read_csv(output_path_segment)
+                else:
+                    output_df = pd.read_parquet(output_path_segment)
+
+                self.assertEqual(output_df["value"].dtype, "float64")
+                self.assertEqual(output_df["value"].iloc[1999], 0.5)
+                self.assertEqual(output_df["value"].iloc[-1], 7)
+                self.assertEqual(len(output_df.index), 2001)
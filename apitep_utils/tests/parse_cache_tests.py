@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from apitep_utils import ParseCache
+from apitep_utils.data_processor import DataProcessor
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path_segment = str(Path(self.directory.name) / "cache")
+        self.input_path_segment = str(Path(self.directory.name) / "test_dataset.csv")
+        shutil.copy("test_dataset.csv", self.input_path_segment)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_parse_cache_get_put(self):
+        parse_cache = ParseCache(cache_path_segment=self.cache_path_segment)
+        options = {"separator": ","}
+        dataframe = pd.read_csv(self.input_path_segment)
+
+        self.assertIsNone(parse_cache.get(self.input_path_segment, options))
+        parse_cache.put(self.input_path_segment, options, dataframe)
+        pd.testing.assert_frame_equal(
+            parse_cache.get(self.input_path_segment, options),
+            dataframe)
+        self.assertIsNone(
+            parse_cache.get(self.input_path_segment, {"separator": ";"}),
+            "Entries should depend on the options")
+
+        os.utime(self.input_path_segment, ns=(0, 0))
+        self.assertIsNone(
+            parse_cache.get(self.input_path_segment, options),
+            "Entries should depend on the modification time of the source")
+
+    def test_parse_cache_invalidate(self):
+        parse_cache = ParseCache(cache_path_segment=self.cache_path_segment)
+        options = {"separator": ","}
+        parse_cache.put(self.input_path_segment, options, pd.read_csv(self.input_path_segment))
+
+        parse_cache.invalidate(self.input_path_segment)
+
+        self.assertIsNone(parse_cache.get(self.input_path_segment, options))
+        self.assertEqual(list(Path(self.cache_path_segment).iterdir()), [])
+
+    def test_parse_cache_evict(self):
+        parse_cache = ParseCache(cache_path_segment=self.cache_path_segment, max_bytes=1)
+        dataframe = pd.read_csv(self.input_path_segment)
+
+        parse_cache.put(self.input_path_segment, {"separator": ","}, dataframe)
+
+        self.assertIsNone(
+            parse_cache.get(self.input_path_segment, {"separator": ","}),
+            "Entries over the size of the cache should be evicted")
+
+    def test_parse_cache_data_processor(self):
+        parse_cache = ParseCache(cache_path_segment=self.cache_path_segment)
+
+        data_processor = DataProcessor(
+            input_path_segment=self.input_path_segment,
+            parse_cache=parse_cache)
+        data_processor.load()
+        first_input_df = data_processor.input_df
+        data_processor.load()
+
+        entries = list(Path(self.cache_path_segment).glob(f"*{ParseCache.DATA_SUFFIX}"))
+        self.assertEqual(len(entries), 1)
+        pd.testing.assert_frame_equal(data_processor.input_df, first_input_df)
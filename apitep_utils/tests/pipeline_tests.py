@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+from apitep_utils import Pipeline
+from apitep_utils.data_processor import DataProcessor
+from apitep_utils.feature_engineering import FeatureEngineering
+from apitep_utils.integration import Integration
+
+
+class ConcatIntegration(Integration):
+    def process(self):
+        self.output_df = pd.concat(self.input_dfs, ignore_index=True)
+
+
+class FareFeatureEngineering(FeatureEngineering):
+    def process(self):
+        self.output_df = self.input_dfs[0].assign(DoubleFare=self.input_dfs[0]["Fare"] * 2)
+
+
+class PolarsIntegration(Integration):
+    def process(self):
+        passengers = self.input_dfs[0]
+        fares = passengers.group_by("Pclass").agg(pl.col("Fare").mean().alias("MeanFare"))
+        self.output_df = passengers.join(fares, on="Pclass", how="left")
+
+
+class FirstClassDataProcessor(DataProcessor):
+    def process(self):
+        self.output_df = self.input_df[self.input_df["Pclass"] == 1]
+
+
+class TestPipeline(unittest.TestCase):
+    def test_pipeline(self):
+        input_path_segment = "test_dataset.csv"
+        input_df = pd.read_csv(input_path_segment)
+
+        with tempfile.TemporaryDirectory() as directory:
+            intermediate_path_segment = str(Path(directory) / "integration.csv")
+            output_path_segment = str(Path(directory) / "output.csv")
+
+            pipeline = Pipeline(stages=[
+                ConcatIntegration(
+                    input_path_segments=[input_path_segment, input_path_segment],
+                    output_path_segment=intermediate_path_segment,
+                    save_report_on_load=False),
+                FareFeatureEngineering(
+                    save_report_on_load=False)
+            ])
+            pipeline.add_stage(FirstClassDataProcessor(output_path_segment=output_path_segment))
+            output_df = pipeline.execute()
+
+            self.assertFalse(
+                Path(intermediate_path_segment).exists(),
+                "Intermediate outputs should not be saved by default")
+            pd.testing.assert_frame_equal(pd.read_csv(output_path_segment), output_df.reset_index(drop=True))
+
+        expected_df = pd.concat([input_df, input_df], ignore_index=True)
+        expected_df = expected_df[expected_df["Pclass"] == 1]
+        self.assertEqual(len(output_df.index), len(expected_df.index))
+        pd.testing.assert_series_equal(output_df["DoubleFare"], expected_df["Fare"] * 2, check_names=False)
+        self.assertEqual(
+            list(pipeline.timings),
+            ["1. Integration", "2. Feature Engineering", "3. DataProcessor"])
+
+    def test_pipeline_polars(self):
+        input_path_segment = "test_dataset.csv"
+        input_df = pd.read_csv(input_path_segment)
+
+        pipeline = Pipeline(stages=[
+            PolarsIntegration(
+                input_path_segments=[input_path_segment],
+                save_report_on_load=False,
+                save_report_on_save=False,
+                dataframe_backend=DataProcessor.DataFrameBackend.Polars),
+            FirstClassDataProcessor()
+        ])
+        output_df = pipeline.execute()
+
+        self.assertIsInstance(output_df, pd.DataFrame, "Polars outputs should be handed to pandas stages as pandas")
+        expected_df = input_df[input_df["Pclass"] == 1]
+        self.assertEqual(len(output_df.index), len(expected_df.index))
+        self.assertAlmostEqual(output_df["MeanFare"].iloc[0], expected_df["Fare"].mean())
@@ -0,0 +1,124 @@
+"""
+Compare the time, and peak memory, taken by a typical sequence of column
+operations on a wide dataframe, made either by chaining pandas calls, one after
+the other, or in a single batch with DataProcessor.column_operations().
+
+For every group of three numeric columns of a synthetic dataset, the sequence
+drops the first one, renames the second one, casts the third one to float32,
+and derives a new column from the last two:
+
+    python benchmarks/column_operations_benchmark.py --rows 100000 --columns 300
+"""
+import argparse
+import time
+import tracemalloc
+import warnings
+
+import pandas as pd
+
+from apitep_utils.data_processor import DataProcessor
+from synthetic_dataset import generate_dataset
+
+
+def chain_operations(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make the operations with one pandas call each, as process() methods
+    usually do.
+
+    :param dataframe: dataframe to change.
+    :return: changed dataframe.
+    :rtype: pd.DataFrame
+    """
+
+    dataframe = dataframe.copy()
+    columns = list(dataframe.columns)
+    for first, second, third in zip(columns[0::3], columns[1::3], columns[2::3]):
+        dataframe.drop(columns=[first], inplace=True)
+        dataframe.rename(columns={second: f"{second}_renamed"}, inplace=True)
+        dataframe[third] = dataframe[third].astype("float32")
+        dataframe[f"{third}_derived"] = dataframe[f"{second}_renamed"] + dataframe[third]
+
+    return dataframe
+
+
+def batch_operations(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make the same operations in a single batch.
+
+    :param dataframe: dataframe to change.
+    :return: changed dataframe.
+    :rtype: pd.DataFrame
+    """
+
+    data_processor = DataProcessor()
+    column_operations = data_processor.column_operations(dataframe)
+    columns = list(dataframe.columns)
+    for first, second, third in zip(columns[0::3], columns[1::3], columns[2::3]):
+        (column_operations
+            .drop(first)
+            .rename({second: f"{second}_renamed"})
+            .cast({third: "float32"})
+            .derive(
+                f"{third}_derived",
+                lambda columns, second=second, third=third: columns[f"{second}_renamed"] + columns[third]))
+
+    return column_operations.execute()
+
+
+def measure(function, dataframe: pd.DataFrame, repeat: int) -> tuple:
+    """
+    Get the best time, and the peak memory, of the function provided.
+
+    :param function: function to measure.
+    :param dataframe: dataframe passed to the function.
+    :param repeat: number of times the function is timed.
+    :return: best time, in seconds, and peak memory, in bytes.
+    :rtype: tuple
+    """
+
+    function(dataframe)
+    timings = []
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        function(dataframe)
+        toc = time.perf_counter()
+        timings.append(toc - tic)
+
+    tracemalloc.start()
+    function(dataframe)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(timings), peak
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Column operations benchmark")
+    argument_parser.add_argument("--rows", nargs="+", type=int, default=[10000, 100000],
+                                 help="rows of the synthetic datasets")
+    argument_parser.add_argument("--columns", type=int, default=300,
+                                 help="numeric columns of the synthetic datasets")
+    argument_parser.add_argument("--repeat", type=int, default=3,
+                                 help="times each approach is timed")
+    arguments = argument_parser.parse_args()
+
+    # Chaining calls fragments the dataframe, which is what is measured here
+    warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+
+    for rows in arguments.rows:
+        dataframe = generate_dataset(
+            rows=rows,
+            columns=arguments.columns,
+            dtypes=["float", "integer"])
+        pd.testing.assert_frame_equal(chain_operations(dataframe), batch_operations(dataframe))
+
+        print(f"{rows} rows, {arguments.columns} columns")
+        chain_time, chain_peak = measure(chain_operations, dataframe, arguments.repeat)
+        batch_time, batch_peak = measure(batch_operations, dataframe, arguments.repeat)
+        print(f"- chained: {chain_time:0.3f} s, peak {chain_peak / 2 ** 20:0.1f} MiB")
+        print(f"- batch: {batch_time:0.3f} s, peak {batch_peak / 2 ** 20:0.1f} MiB "
+              f"({chain_time / batch_time:0.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare the time DataProcessor.load() takes to read CSV datasets with each of
+the CSV engines and type backends available.
+
+Either generate synthetic datasets with the number of rows provided, or pass
+your own datasets:
+
+    python benchmarks/csv_engine_benchmark.py --rows 100000 1000000
+    python benchmarks/csv_engine_benchmark.py --input_paths data/extract.csv
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from apitep_utils.data_processor import DataProcessor
+
+CONFIGURATIONS = [
+    ("c", None),
+    ("python", None),
+    ("pyarrow", None),
+    ("pyarrow", "pyarrow"),
+]
+
+
+def generate_dataset(path_segment: str, rows: int):
+    """
+    Write a synthetic CSV dataset with numeric, text and low cardinality
+    columns.
+
+    :param path_segment: path where the dataset should be written.
+    :param rows: number of rows of the dataset.
+    """
+
+    generator = np.random.default_rng(0)
+    dataframe = pd.DataFrame({
+        "identifier": np.arange(rows),
+        "integer": generator.integers(0, 1000, rows),
+        "float": generator.normal(size=rows),
+        "category": generator.choice(["north", "south", "east", "west"], rows),
+        "text": [f"text {value}" for value in generator.integers(0, rows, rows)]
+    })
+    dataframe.to_csv(path_segment, index=False)
+
+
+def benchmark(input_path_segment: str, repeat: int):
+    """
+    Load the dataset provided with each configuration and print the best time
+    of each of them.
+
+    :param input_path_segment: path to the CSV dataset to load.
+    :param repeat: number of times each configuration is measured.
+    """
+
+    size = Path(input_path_segment).stat().st_size
+    print(f"{input_path_segment} ({size / 2 ** 20:.1f} MiB)")
+
+    for csv_engine, dtype_backend in CONFIGURATIONS:
+        data_processor = DataProcessor(
+            input_path_segment=input_path_segment,
+            csv_engine=csv_engine,
+            dtype_backend=dtype_backend)
+        timings = []
+        for _ in range(repeat):
+            tic = time.perf_counter()
+            data_processor.load()
+            toc = time.perf_counter()
+            timings.append(toc - tic)
+        rows = len(data_processor.input_df.index)
+        best = min(timings)
+        print(f"- engine={csv_engine}, dtype_backend={dtype_backend}: "
+              f"{best:0.3f} s, {rows / best:,.0f} rows/s")
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="CSV engine benchmark")
+    argument_parser.add_argument("--rows", nargs="+", type=int, default=[100000, 1000000],
+                                 help="rows of the synthetic datasets")
+    argument_parser.add_argument("--input_paths", nargs="+",
+                                 help="CSV datasets to use instead of synthetic ones")
+    argument_parser.add_argument("--repeat", type=int, default=3,
+                                 help="times each configuration is measured")
+    arguments = argument_parser.parse_args()
+
+    if arguments.input_paths is not None:
+        for input_path_segment in arguments.input_paths:
+            benchmark(input_path_segment, arguments.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in arguments.rows:
+            input_path_segment = str(Path(directory) / f"synthetic_{rows}.csv")
+            generate_dataset(input_path_segment, rows)
+            benchmark(input_path_segment, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Compare the time, and peak memory, taken to drop the duplicated rows of
+several overlapping extracts, either stacking them and calling
+drop_duplicates(), or filtering them one by one with DuplicateFilter:
+
+    python benchmarks/duplicate_filter_benchmark.py --extracts 10 --rows 100000
+"""
+import argparse
+import time
+import tracemalloc
+
+import pandas as pd
+
+from apitep_utils.duplicate_filter import DuplicateFilter
+from synthetic_dataset import generate_dataset
+
+
+def stack_and_drop(extracts: list) -> int:
+    """
+    Stack the extracts and drop the duplicated rows with pandas.
+
+    :param extracts: list of dataframes.
+    :return: number of rows kept.
+    :rtype: int
+    """
+
+    return len(pd.concat(extracts, ignore_index=True).drop_duplicates().index)
+
+
+def filter_extracts(extracts: list) -> int:
+    """
+    Drop the duplicated rows of each extract, one after the other.
+
+    :param extracts: list of dataframes.
+    :return: number of rows kept.
+    :rtype: int
+    """
+
+    duplicate_filter = DuplicateFilter()
+
+    return sum(len(duplicate_filter.filter(extract).index) for extract in extracts)
+
+
+def measure(function, extracts: list) -> tuple:
+    """
+    Get the time, and the peak memory, of the function provided.
+
+    :param function: function to measure.
+    :param extracts: list of dataframes passed to the function.
+    :return: time, in seconds, and peak memory, in bytes.
+    :rtype: tuple
+    """
+
+    tracemalloc.start()
+    tic = time.perf_counter()
+    function(extracts)
+    toc = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return toc - tic, peak
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Duplicate filter benchmark")
+    argument_parser.add_argument("--extracts", type=int, default=10,
+                                 help="number of extracts")
+    argument_parser.add_argument("--rows", type=int, default=100000,
+                                 help="rows of each extract")
+    arguments = argument_parser.parse_args()
+
+    # Each extract shares half of its rows with the previous one
+    dataset = generate_dataset(
+        rows=(arguments.extracts + 1) * arguments.rows // 2,
+        dtypes=["float", "integer", "category", "text"])
+    step = arguments.rows // 2
+    extracts = [
+        dataset.iloc[index * step:index * step + arguments.rows]
+        for index in range(arguments.extracts)
+    ]
+    assert stack_and_drop(extracts) == filter_extracts(extracts)
+
+    print(f"{arguments.extracts} extracts, {arguments.rows} rows each")
+    stack_time, stack_peak = measure(stack_and_drop, extracts)
+    filter_time, filter_peak = measure(filter_extracts, extracts)
+    print(f"- stack and drop_duplicates: {stack_time:0.3f} s, peak {stack_peak / 2 ** 20:0.1f} MiB")
+    print(f"- DuplicateFilter: {filter_time:0.3f} s, peak {filter_peak / 2 ** 20:0.1f} MiB "
+          f"({stack_peak / filter_peak:0.1f}x less memory)")
+
+
+if __name__ == "__main__":
+    main()
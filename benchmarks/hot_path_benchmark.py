@@ -0,0 +1,342 @@
+"""
+Measure the time and memory taken by the hot paths of the library on
+synthetic datasets of several sizes:
+
+- DataProcessor.load() and DataProcessor.save() of CSV and Parquet datasets,
+  reading CSV datasets with the default engine and with the pyarrow one.
+- Report.generate_advanced().
+- HypothesisTest.execute(), with Pearson, Spearman and Chi2 tests.
+- FeatureSelection.process().
+- DatasetSubsampler, by rows and by percentage.
+
+Each benchmark is run once to warm up, so lazy imports are not measured, then
+timed `--repeat` times, keeping the best time, and run once more under
+tracemalloc to get its peak memory. The results are saved as JSON, by default
+in benchmarks/results/<commit>.json, and compared with the baseline stored in
+benchmarks/baselines/hot_path.json, or with the results file, or commit, in
+--baseline:
+
+    python benchmarks/hot_path_benchmark.py --rows 10000 100000
+    python benchmarks/hot_path_benchmark.py --check
+    python benchmarks/hot_path_benchmark.py --baseline benchmarks/results/<commit>.json
+
+With --check, the benchmark fails if any time or peak memory is more than
+`--tolerance` worse than the baseline. Compare results taken on the same
+machine only: the stored baseline records the machine, and the versions of
+Python, pandas and numpy, it was taken with. To regenerate it, on the machine
+the benchmark is checked on, run the benchmark with the default arguments, and
+commit the new file:
+
+    python benchmarks/hot_path_benchmark.py --update_baseline
+
+Report.generate_advanced() lets plotly open each plot in a browser, if there
+is one, so leave "report" out of --benchmarks on a desktop.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from apitep_utils.data_processor import DataProcessor
+from apitep_utils.dataset_subsampler import DatasetSubsampler
+from apitep_utils.feature_selection import FeatureSelection
+from apitep_utils.hypothesis_test import HypothesisTest
+from apitep_utils.report import Report
+from synthetic_dataset import generate_dataset
+
+RESULTS_PATH = Path(__file__).parent / "results"
+BASELINE_PATH = Path(__file__).parent / "baselines" / "hot_path.json"
+
+DTYPES = ["float", "float", "integer", "category", "text", "boolean", "datetime"]
+
+
+class Workload:
+    """
+    Synthetic datasets of a given size, on disk and in memory, shared by the
+    benchmarks of that size.
+    """
+
+    def __init__(self, directory: str, rows: int, cardinality: int, null_rate: float):
+        self.directory = Path(directory)
+        self.dataframe = generate_dataset(
+            rows=rows,
+            dtypes=DTYPES,
+            cardinality=cardinality,
+            null_rate=null_rate)
+        self.csv_path_segment = str(self.directory / f"synthetic_{rows}.csv")
+        self.parquet_path_segment = str(self.directory / f"synthetic_{rows}.parquet")
+        self.dataframe.to_csv(self.csv_path_segment, index=False)
+        self.dataframe.to_parquet(self.parquet_path_segment, index=False)
+
+        # Hypothesis tests do not take nulls
+        self.complete_df = self.dataframe.dropna()
+
+    def load_csv(self):
+        DataProcessor(input_path_segment=self.csv_path_segment).load()
+
+    def load_csv_pyarrow(self):
+        DataProcessor(input_path_segment=self.csv_path_segment, csv_engine="pyarrow").load()
+
+    def load_parquet(self):
+        DataProcessor(input_path_segment=self.parquet_path_segment).load()
+
+    def save_csv(self):
+        self.save(".csv")
+
+    def save_parquet(self):
+        self.save(".parquet")
+
+    def save(self, suffix: str):
+        data_processor = DataProcessor(output_path_segment=str(self.directory / f"output{suffix}"))
+        data_processor.output_df = self.dataframe
+        data_processor.save()
+
+    def report(self):
+        report_path = self.directory / "report"
+        report_path.mkdir(exist_ok=True)
+        Report().generate_advanced(self.dataframe, "synthetic", str(report_path))
+
+    def pearson(self):
+        self.hypothesis_test(HypothesisTest.TestType.Pearson, "float_0", "float_1")
+
+    def spearman(self):
+        self.hypothesis_test(HypothesisTest.TestType.Spearman, "float_0", "integer_2")
+
+    def chi2(self):
+        self.hypothesis_test(HypothesisTest.TestType.Chi2, "category_3", "text_4")
+
+    def hypothesis_test(self, test_type: HypothesisTest.TestType, target: str, candidate: str):
+        HypothesisTest(
+            dataframe=self.complete_df,
+            test_type=test_type,
+            target=self.complete_df[target],
+            candidates=[self.complete_df[candidate]]).execute()
+
+    def feature_selection(self):
+        dependency_tests = [
+            HypothesisTest(
+                dataframe=self.complete_df,
+                test_type=HypothesisTest.TestType.Spearman,
+                target=self.complete_df["float_0"],
+                candidates=[self.complete_df[candidate]])
+            for candidate in self.complete_df.select_dtypes(include="number").columns
+            if candidate != "float_0"
+        ]
+        FeatureSelection(dependency_tests=dependency_tests).process()
+
+    def subsample_rows(self):
+        self.subsample().subsample_rows(len(self.dataframe.index) // 10)
+
+    def subsample_percentage(self):
+        self.subsample().subsample_percentage(10)
+
+    def subsample(self) -> DatasetSubsampler:
+        return DatasetSubsampler(
+            dataset_path=self.csv_path_segment,
+            dataset_subsample_path=str(self.directory / "subsample.csv"))
+
+
+BENCHMARKS = [
+    "load_csv",
+    "load_csv_pyarrow",
+    "load_parquet",
+    "save_csv",
+    "save_parquet",
+    "report",
+    "pearson",
+    "spearman",
+    "chi2",
+    "feature_selection",
+    "subsample_rows",
+    "subsample_percentage",
+]
+
+
+def measure(function, repeat: int) -> dict:
+    """
+    Measure the best time and the peak memory of the function provided.
+
+    :param function: function to measure, without arguments.
+    :param repeat: number of times the function is timed.
+    :return: best time, in seconds, and peak memory allocated, in bytes.
+    :rtype: dict
+    """
+
+    function()
+
+    timings = []
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        function()
+        toc = time.perf_counter()
+        timings.append(toc - tic)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": min(timings),
+        "peak_bytes": peak_bytes
+    }
+
+
+def get_commit() -> str:
+    """
+    Get the short hash of the current commit, marked as dirty if the working
+    tree has changes.
+
+    :return: commit the results are taken on, or "unknown" outside git.
+    :rtype: str
+    """
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{commit}-dirty" if status else commit
+
+
+def get_baseline_path(baseline: str) -> Path:
+    """
+    Get the path of the baseline results provided, either a results file or
+    the commit they were taken on, or of the stored baseline if none is
+    provided.
+
+    :param baseline: path of a results file, or commit, or None.
+    :return: path of the results file.
+    :rtype: Path
+    """
+
+    if baseline is None:
+        return BASELINE_PATH
+
+    path = Path(baseline)
+    if path.is_file():
+        return path
+
+    return RESULTS_PATH / f"{baseline}.json"
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Print the ratio of each result to its baseline, and get the ones worse
+    than the tolerance provided.
+
+    :param results: current results.
+    :param baseline: baseline results.
+    :param tolerance: fraction a result can be worse than its baseline.
+    :return: names of the results worse than their baseline.
+    :rtype: list
+    """
+
+    print(f"Comparison with the baseline taken on {baseline['created'][:10]}, "
+          f"Python {baseline['python']}, pandas {baseline['pandas']}, {baseline['machine']}")
+
+    regressions = []
+    for name, result in results["results"].items():
+        if name not in baseline["results"]:
+            continue
+        ratios = []
+        for metric in ["seconds", "peak_bytes"]:
+            reference = baseline["results"][name][metric]
+            ratio = result[metric] / reference if reference > 0 else 1.0
+            ratios.append(f"{metric} x{ratio:0.2f}")
+            if ratio > 1 + tolerance:
+                regressions.append(f"{name} {metric}")
+        print(f"- {name}: {', '.join(ratios)}")
+
+    return regressions
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Hot path benchmark")
+    argument_parser.add_argument("--rows", nargs="+", type=int, default=[10000, 100000],
+                                 help="rows of the synthetic datasets")
+    argument_parser.add_argument("--cardinality", type=int, default=100,
+                                 help="distinct values of integer, category and text columns")
+    argument_parser.add_argument("--null_rate", type=float, default=0.05,
+                                 help="fraction of null values in each column")
+    argument_parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS,
+                                 help="benchmarks to run")
+    argument_parser.add_argument("--repeat", type=int, default=3,
+                                 help="times each benchmark is timed")
+    argument_parser.add_argument("--output_path",
+                                 help="results file, benchmarks/results/<commit>.json by default")
+    argument_parser.add_argument("--baseline",
+                                 help="results file, or commit, to compare with, "
+                                      "benchmarks/baselines/hot_path.json by default")
+    argument_parser.add_argument("--tolerance", type=float, default=0.2,
+                                 help="fraction a result can be worse than its baseline")
+    argument_parser.add_argument("--check", action="store_true",
+                                 help="fail if any result is worse than its baseline")
+    argument_parser.add_argument("--update_baseline", action="store_true",
+                                 help="save the results as the stored baseline")
+    arguments = argument_parser.parse_args()
+
+    commit = get_commit()
+    results = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "parameters": {
+            "cardinality": arguments.cardinality,
+            "null_rate": arguments.null_rate,
+            "repeat": arguments.repeat
+        },
+        "results": {}
+    }
+
+    for rows in arguments.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            workload = Workload(directory, rows, arguments.cardinality, arguments.null_rate)
+            for benchmark in arguments.benchmarks:
+                result = measure(getattr(workload, benchmark), arguments.repeat)
+                name = f"{benchmark}[{rows}]"
+                results["results"][name] = result
+                print(f"- {name}: {result['seconds']:0.3f} s, "
+                      f"{result['peak_bytes'] / 2 ** 20:0.1f} MiB peak")
+
+    if arguments.update_baseline:
+        output_path = BASELINE_PATH
+    else:
+        output_path = Path(arguments.output_path or RESULTS_PATH / f"{commit}.json")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as file:
+        json.dump(results, file, indent=4)
+    print(f"Results saved to {output_path}")
+
+    baseline_path = get_baseline_path(arguments.baseline)
+    if not arguments.update_baseline and (arguments.baseline is not None or baseline_path.is_file()):
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, arguments.tolerance)
+        for regression in regressions:
+            print(f"error: {regression} is worse than the baseline")
+        if arguments.check and regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
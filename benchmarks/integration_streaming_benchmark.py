@@ -0,0 +1,95 @@
+"""
+Compare the time, and peak memory, taken by Integration to stack many CSV
+datasets, with different columns, either loading them all and concatenating
+them, or in streaming mode, aligning and appending one chunk at a time:
+
+    python benchmarks/integration_streaming_benchmark.py --files 100 --rows 10000
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from apitep_utils.integration import Integration
+from synthetic_dataset import generate_dataset
+
+
+def integrate(input_path_segments: list, output_path_segment: str, chunk_size: int = None):
+    """
+    Stack the datasets provided with the Concat strategy.
+
+    :param input_path_segments: list of paths to the input datasets.
+    :param output_path_segment: path to the output dataset.
+    :param chunk_size: rows per chunk, to stream the datasets. Optional.
+    """
+
+    integration = Integration(
+        input_path_segments=input_path_segments,
+        output_path_segment=output_path_segment,
+        save_report_on_save=False,
+        chunk_size=chunk_size,
+        strategy=Integration.Strategy.Concat)
+    integration.load()
+    integration.process()
+    integration.save()
+
+
+def measure(function, *arguments) -> tuple:
+    """
+    Get the time, and the peak memory, of the function provided.
+
+    :param function: function to measure.
+    :param arguments: arguments passed to the function.
+    :return: time, in seconds, and peak memory, in bytes.
+    :rtype: tuple
+    """
+
+    tracemalloc.start()
+    tic = time.perf_counter()
+    function(*arguments)
+    toc = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return toc - tic, peak
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Integration streaming benchmark")
+    argument_parser.add_argument("--files", type=int, default=20,
+                                 help="number of input datasets")
+    argument_parser.add_argument("--rows", type=int, default=10000,
+                                 help="rows of each input dataset")
+    argument_parser.add_argument("--chunk_size", type=int, default=5000,
+                                 help="rows per chunk in streaming mode")
+    arguments = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path_segments = []
+        for index in range(arguments.files):
+            # Every other dataset misses some columns, so they must be aligned
+            dataframe = generate_dataset(rows=arguments.rows, seed=index)
+            if index % 2:
+                dataframe = dataframe.iloc[:, ::2]
+            input_path_segment = str(Path(directory) / f"input_{index}.csv")
+            dataframe.to_csv(input_path_segment, index=False)
+            input_path_segments.append(input_path_segment)
+
+        print(f"{arguments.files} files, {arguments.rows} rows each")
+        load_time, load_peak = measure(
+            integrate,
+            input_path_segments,
+            str(Path(directory) / "output_load.csv"))
+        stream_time, stream_peak = measure(
+            integrate,
+            input_path_segments,
+            str(Path(directory) / "output_stream.csv"),
+            arguments.chunk_size)
+        print(f"- load and concat: {load_time:0.3f} s, peak {load_peak / 2 ** 20:0.1f} MiB")
+        print(f"- streaming: {stream_time:0.3f} s, peak {stream_peak / 2 ** 20:0.1f} MiB "
+              f"({load_peak / stream_peak:0.1f}x less memory)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Measure how long it takes to start a Python process that imports apitep_utils,
+or some of its public names, and which heavy dependencies each import loads.
+
+Each statement is run in a new interpreter, so nothing is cached between them:
+
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --repeat 10 --check
+
+With --check, the benchmark fails if importing the package itself loads any of
+the heavy dependencies, so lazy imports do not regress unnoticed.
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    "pass",
+    "import apitep_utils",
+    "from apitep_utils import ArgumentParserHelper",
+    "from apitep_utils import ETL",
+    "from apitep_utils import FeatureSelection",
+    "from apitep_utils.report import Report",
+]
+
+HEAVY_MODULES = ["numpy", "pandas", "plotly", "scipy", "swifter", "pandas_profiling"]
+
+LIGHT_STATEMENTS = [
+    "import apitep_utils",
+    "from apitep_utils import ArgumentParserHelper",
+]
+
+
+def get_loaded_modules(statement: str) -> list:
+    """
+    Get the heavy dependencies loaded by the statement provided.
+
+    :param statement: Python statement to run.
+    :return: list of the heavy modules loaded.
+    """
+
+    script = (f"import sys\n"
+              f"{statement}\n"
+              f"print(' '.join(module for module in {HEAVY_MODULES!r} if module in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    return result.stdout.split()
+
+
+def get_startup_time(statement: str, repeat: int) -> float:
+    """
+    Get the best time to start an interpreter and run the statement provided.
+
+    :param statement: Python statement to run.
+    :param repeat: number of times the statement is measured.
+    :return: best time, in seconds.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        toc = time.perf_counter()
+        timings.append(toc - tic)
+
+    return min(timings)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Startup time benchmark")
+    argument_parser.add_argument("--repeat", type=int, default=5,
+                                 help="times each statement is measured")
+    argument_parser.add_argument("--check", action="store_true",
+                                 help="fail if light imports load heavy dependencies")
+    arguments = argument_parser.parse_args()
+
+    for statement in STATEMENTS:
+        best = get_startup_time(statement, arguments.repeat)
+        loaded_modules = get_loaded_modules(statement)
+        print(f"- {statement}: {best:0.3f} s, loads {', '.join(loaded_modules) or 'nothing heavy'}")
+
+    if arguments.check:
+        regressions = {}
+        for statement in LIGHT_STATEMENTS:
+            loaded_modules = get_loaded_modules(statement)
+            if loaded_modules:
+                regressions[statement] = loaded_modules
+        for statement, loaded_modules in regressions.items():
+            print(f"error: \"{statement}\" loads {', '.join(loaded_modules)}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Generate deterministic synthetic datasets for the benchmarks.
+
+The same arguments, seed included, always produce the same dataset, so
+timings taken on different commits are comparable:
+
+    python benchmarks/synthetic_dataset.py synthetic.csv --rows 100000
+    python benchmarks/synthetic_dataset.py synthetic.parquet --columns 20 \
+        --dtypes float category --cardinality 50 --null_rate 0.1
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+DTYPES = ["float", "integer", "category", "text", "boolean", "datetime"]
+
+
+def generate_column(generator: np.random.Generator, dtype: str, rows: int, cardinality: int) -> pd.Series:
+    """
+    Generate the values of a column of the type provided.
+
+    :param generator: random generator, already seeded.
+    :param dtype: type of the column, one of DTYPES.
+    :param rows: number of values.
+    :param cardinality: number of distinct values of integer, category and
+    text columns.
+    :return: values of the column.
+    :rtype: pd.Series
+    """
+
+    if dtype == "float":
+        return pd.Series(generator.normal(loc=100, scale=15, size=rows))
+    if dtype == "integer":
+        return pd.Series(generator.integers(0, cardinality, rows))
+    if dtype == "category":
+        categories = [f"category {index}" for index in range(cardinality)]
+        return pd.Series(pd.Categorical.from_codes(generator.integers(0, cardinality, rows), categories))
+    if dtype == "text":
+        values = np.array([f"text {index:08d}" for index in range(cardinality)], dtype=object)
+        return pd.Series(values[generator.integers(0, cardinality, rows)])
+    if dtype == "boolean":
+        return pd.Series(generator.random(rows) < 0.5)
+    if dtype == "datetime":
+        seconds = generator.integers(0, 10 * 365 * 24 * 3600, rows)
+        return pd.Series(pd.Timestamp("2015-01-01") + pd.to_timedelta(seconds, unit="s"))
+
+    raise ValueError(f"unknown dtype \"{dtype}\", expected one of {', '.join(DTYPES)}")
+
+
+def generate_dataset(
+        rows: int,
+        columns: int = None,
+        dtypes: list = None,
+        cardinality: int = 100,
+        null_rate: float = 0.0,
+        seed: int = 0
+) -> pd.DataFrame:
+    """
+    Generate a synthetic dataset. The type of each column is taken in turn
+    from the types provided, and the column is named after it, e.g.
+    "float_0", "integer_1", "category_2".
+
+    :param rows: number of rows of the dataset.
+    :param columns: number of columns of the dataset. Defaults to one column
+    per type. Optional.
+    :param dtypes: types of the columns, from DTYPES. Defaults to all of them.
+    Optional.
+    :param cardinality: number of distinct values of integer, category and
+    text columns. Optional.
+    :param null_rate: fraction, from 0 to 1, of the values of each column
+    replaced by nulls. Integer columns with nulls are stored as floats, and
+    boolean ones as objects, as pandas does. Optional.
+    :param seed: seed of the random generator. Optional.
+    :return: the synthetic dataset.
+    :rtype: pd.DataFrame
+    """
+
+    if dtypes is None:
+        dtypes = DTYPES
+    if columns is None:
+        columns = len(dtypes)
+    if not 0.0 <= null_rate <= 1.0:
+        raise ValueError(f"null rate must be between 0 and 1, got {null_rate}")
+
+    generator = np.random.default_rng(seed)
+    data = {}
+    for index in range(columns):
+        dtype = dtypes[index % len(dtypes)]
+        column = generate_column(generator, dtype, rows, max(cardinality, 1))
+        if null_rate > 0:
+            column = column.mask(generator.random(rows) < null_rate)
+        data[f"{dtype}_{index}"] = column
+
+    return pd.DataFrame(data)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Synthetic dataset generator")
+    argument_parser.add_argument("output_path",
+                                 help="path of the dataset, CSV or Parquet by extension")
+    argument_parser.add_argument("--rows", type=int, default=100000,
+                                 help="rows of the dataset")
+    argument_parser.add_argument("--columns", type=int,
+                                 help="columns of the dataset, one per type by default")
+    argument_parser.add_argument("--dtypes", nargs="+", choices=DTYPES,
+                                 help="types of the columns, taken in turn")
+    argument_parser.add_argument("--cardinality", type=int, default=100,
+                                 help="distinct values of integer, category and text columns")
+    argument_parser.add_argument("--null_rate", type=float, default=0.0,
+                                 help="fraction of null values in each column")
+    argument_parser.add_argument("--seed", type=int, default=0,
+                                 help="seed of the random generator")
+    arguments = argument_parser.parse_args()
+
+    dataframe = generate_dataset(
+        rows=arguments.rows,
+        columns=arguments.columns,
+        dtypes=arguments.dtypes,
+        cardinality=arguments.cardinality,
+        null_rate=arguments.null_rate,
+        seed=arguments.seed)
+
+    if arguments.output_path.endswith(".parquet"):
+        dataframe.to_parquet(arguments.output_path, index=False)
+    else:
+        dataframe.to_csv(arguments.output_path, index=False)
+
+
+if __name__ == "__main__":
+    main()